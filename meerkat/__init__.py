@@ -69,6 +69,7 @@ from meerkat.ops.cond import (
     cor,
 )
 from meerkat.ops.embed import embed
+from meerkat.ops.expression import Expression, lazy
 from meerkat.ops.map import defer, map
 from meerkat.ops.merge import merge
 from meerkat.ops.sample import sample
@@ -147,6 +148,8 @@ __all__ = [
     "mark",
     "endpoint",
     "magic",
+    "lazy",
+    "Expression",
     # <<<< Columns >>>>
     "column",
     "Column",
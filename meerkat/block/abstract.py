@@ -1,15 +1,33 @@
 from __future__ import annotations
 
 import os
+import pickle
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, Hashable, List, Mapping, Sequence, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 
 from meerkat.errors import ConsolidationError
 from meerkat.tools.utils import dump_yaml, load_yaml
 
+from .key_index import KeyIndex
+from .vector_index import VectorIndex
+
 # an index into a block that specifies where a column's data lives in the block
 BlockIndex = Union[int, slice, str]
 
+# the number of bytes of an array to hash or write at a time
+CHUNK_BYTES = 2**26
 
 if TYPE_CHECKING:
     from meerkat.block.ref import BlockRef
@@ -27,6 +45,17 @@ class BlockView:
 
 
 class AbstractBlock:
+    # key indices of the columns in the block, keyed by (hashable) block index. These
+    # live on the block so that they are shared by all views of the block
+    _key_indices: Dict[Hashable, KeyIndex] = None
+    # vector indices of the columns in the block, see `TensorColumn.create_vector_index`
+    _vector_indices: Dict[Hashable, VectorIndex] = None
+    # whether the data in the block has been mutated since the block was created
+    _mutated: bool = False
+    # incremented on every mutation, so that results derived from the data can be
+    # checked for staleness
+    _version: int = 0
+
     def __init__(self, *args, **kwargs):
         super(AbstractBlock, self).__init__(*args, **kwargs)
 
@@ -80,10 +109,49 @@ class AbstractBlock:
     def is_mmap(self):
         return False
 
+    def _get_key_index(self, index: BlockIndex) -> KeyIndex:
+        if self._key_indices is None:
+            return None
+        return self._key_indices.get(_hashable_block_index(index), None)
+
+    def _set_key_index(self, index: BlockIndex, key_index: KeyIndex):
+        if self._key_indices is None:
+            self._key_indices = {}
+        self._key_indices[_hashable_block_index(index)] = key_index
+
+    def _get_vector_index(self, index: BlockIndex) -> VectorIndex:
+        if self._vector_indices is None:
+            return None
+        return self._vector_indices.get(_hashable_block_index(index), None)
+
+    def _set_vector_index(self, index: BlockIndex, vector_index: VectorIndex):
+        if self._vector_indices is None:
+            self._vector_indices = {}
+        self._vector_indices[_hashable_block_index(index)] = vector_index
+
+    def _mark_mutated(self):
+        """Must be called whenever the data in the block is mutated."""
+        self._mutated = True
+        self._version += 1
+        self._key_indices = None
+        self._vector_indices = None
+
     def write(self, path: str, *args, **kwargs):
         os.makedirs(path, exist_ok=True)
         self._write_data(path, *args, **kwargs)
+        self._write_metadata(path)
+
+    def _write_metadata(self, path: str):
         metadata = {"klass": type(self)}
+        if self._key_indices:
+            # write the key indices alongside the data, so they needn't be rebuilt
+            metadata["key_indices"] = "key_indices.pkl"
+            with open(os.path.join(path, metadata["key_indices"]), "wb") as f:
+                pickle.dump(self._key_indices, f)
+        if self._vector_indices:
+            metadata["vector_indices"] = "vector_indices.pkl"
+            with open(os.path.join(path, metadata["vector_indices"]), "wb") as f:
+                pickle.dump(self._vector_indices, f)
         metadata_path = os.path.join(path, "meta.yaml")
         dump_yaml(metadata, metadata_path)
 
@@ -95,11 +163,44 @@ class AbstractBlock:
 
         block_class = metadata["klass"]
         data = block_class._read_data(path, *args, **kwargs)
-        return block_class(data)
+        block = block_class(data)
+        if "key_indices" in metadata:
+            with open(os.path.join(path, metadata["key_indices"]), "rb") as f:
+                block._key_indices = pickle.load(f)
+        if "vector_indices" in metadata:
+            with open(os.path.join(path, metadata["vector_indices"]), "rb") as f:
+                block._vector_indices = pickle.load(f)
+        return block
 
     def _write_data(self, path: str, *args, **kwargs):
         raise NotImplementedError
 
+    def _checksum(self) -> Optional[str]:
+        """A hash of the data in the block, used to skip rewriting blocks that
+        have not changed. Blocks whose data can't be hashed cheaply return
+        None and are always rewritten."""
+        return None
+
     @staticmethod
     def _read_data(path: str, *args, **kwargs) -> object:
         raise NotImplementedError
+
+
+def _hashable_block_index(index: BlockIndex) -> Hashable:
+    # slices are not hashable
+    if isinstance(index, slice):
+        return (index.start, index.stop, index.step)
+    return index
+
+
+def hash_array(hasher, array: np.ndarray):
+    """Update ``hasher`` with the dtype, shape and contents of ``array``, a
+    chunk of rows at a time."""
+    hasher.update(f"{array.dtype.str}{array.shape}".encode())
+    if array.ndim == 0:
+        hasher.update(array.tobytes())
+        return
+    row_bytes = max(array[:1].nbytes, 1)
+    chunk_size = max(CHUNK_BYTES // row_bytes, 1)
+    for start in range(0, len(array), chunk_size):
+        hasher.update(np.ascontiguousarray(array[start : start + chunk_size]).data)
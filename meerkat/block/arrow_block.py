@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import os
 from dataclasses import dataclass
-from typing import Dict, Hashable, List, Sequence, Union
+from typing import Dict, Hashable, List, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -105,6 +106,66 @@ class ArrowBlock(AbstractBlock):
 
         return index
 
+    @staticmethod
+    def _take(
+        data: Union[pa.Table, pa.ChunkedArray, pa.Array], index: np.ndarray
+    ) -> Union[pa.Table, pa.ChunkedArray, pa.Array]:
+        """Gather the rows of ``data`` at the integer positions in ``index``.
+
+        We do not want to use ``data.take(index)`` directly, because it can't handle
+        ChunkedArrays that don't fit in an Array
+        https://issues.apache.org/jira/browse/ARROW-9773. Instead, the global
+        positions are mapped to (chunk, offset) pairs with NumPy and we issue one
+        ``take`` per chunk. If the positions are not grouped by chunk, the gathered
+        rows are put back in order with a final ``take``, which is only over the
+        (small) result.
+        """
+        if isinstance(data, pa.Array):
+            return data.take(pa.array(index, type=pa.int64()))
+
+        index = np.asarray(index, dtype=np.int64)
+        index = np.where(index < 0, index + len(data), index)
+        if len(index) > 0 and (index.min() < 0 or index.max() >= len(data)):
+            raise IndexError(
+                f"Index out of bounds for Arrow data with length {len(data)}."
+            )
+
+        chunks = data.to_batches() if isinstance(data, pa.Table) else data.chunks
+        if len(chunks) <= 1:
+            return data.take(pa.array(index, type=pa.int64()))
+
+        lengths = np.array([len(chunk) for chunk in chunks])
+        ends = np.cumsum(lengths)
+        chunk_idxs = np.searchsorted(ends, index, side="right")
+        offsets = index - (ends - lengths)[chunk_idxs]
+
+        def _gather(chunk_idxs: np.ndarray, offsets: np.ndarray):
+            # one take per run of consecutive positions that fall in the same chunk
+            bounds = np.flatnonzero(np.diff(chunk_idxs)) + 1
+            taken = [
+                chunks[run_chunk_idxs[0]].take(pa.array(run_offsets, type=pa.int64()))
+                for run_chunk_idxs, run_offsets in zip(
+                    np.split(chunk_idxs, bounds), np.split(offsets, bounds)
+                )
+                if len(run_offsets) > 0
+            ]
+            if isinstance(data, pa.Table):
+                return pa.Table.from_batches(taken, schema=data.schema)
+            return pa.chunked_array(taken, type=data.type)
+
+        if (np.diff(chunk_idxs) >= 0).all():
+            return _gather(chunk_idxs, offsets)
+
+        order = np.argsort(chunk_idxs, kind="stable")
+        out = _gather(chunk_idxs[order], offsets[order])
+        if out.nbytes >= np.iinfo(np.int32).max:
+            # the result may not fit in an Array, so we fall back to one take per run
+            # of the positions in their original order
+            return _gather(chunk_idxs, offsets)
+        inverse = np.empty_like(order)
+        inverse[order] = np.arange(len(order))
+        return out.take(pa.array(inverse, type=pa.int64()))
+
     def _get(
         self, index, block_ref: BlockRef, materialize: bool = True
     ) -> Union[BlockRef, dict]:
@@ -125,15 +186,7 @@ class ArrowBlock(AbstractBlock):
         elif index.dtype == bool:
             data = self.data.filter(pa.array(index))
         else:
-            # we do not want to use ``data = self.data.take(index)``
-            # because it can't handle ChunkedArrays that don't fit in an Array
-            # https://issues.apache.org/jira/browse/ARROW-9773
-            # TODO (Sabri): Huggingface gets around this in a similar manner but
-            # applies the slices to the record batches, because this allows them to do
-            # the batch lookup in numpy, which is faster than pure python, which is
-            # presumably why Table.slice does
-            # noqa E501, https://github.com/huggingface/datasets/blob/491dad8507792f6f51077867e22412af7cd5c2f1/src/datasets/table.py#L110
-            data = pa.concat_tables(self.data.slice(i, 1) for i in index)
+            data = self._take(self.data, index)
 
         block = self.__class__(data)
 
@@ -165,6 +218,19 @@ class ArrowBlock(AbstractBlock):
     def _write_data(self, path: str):
         self._write_table(os.path.join(path, "data.arrow"), self.data)
 
+    def _checksum(self) -> Optional[str]:
+        hasher = hashlib.blake2b(type(self).__name__.encode(), digest_size=16)
+        hasher.update(str(self.data.schema).encode())
+        for column in self.data.columns:
+            for chunk in column.chunks:
+                # buffers may extend beyond a sliced chunk, so the offset and length
+                # are needed to identify its contents
+                hasher.update(f"{chunk.offset},{len(chunk)}".encode())
+                for buffer in chunk.buffers():
+                    if buffer is not None:
+                        hasher.update(buffer)
+        return hasher.hexdigest()
+
     @staticmethod
     def _read_data(
         path: str, mmap: bool = False, read_inputs: Dict[str, Column] = None
@@ -2,18 +2,23 @@ from __future__ import annotations
 
 import os
 from copy import copy
-from dataclasses import dataclass
-from typing import Dict, Hashable, List, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
+import pandas as pd
 from cytoolz import merge_with
 
 import meerkat as mk
 from meerkat.block.ref import BlockRef
 from meerkat.columns.abstract import Column
+from meerkat.tools.lazy_loader import LazyLoader
 from meerkat.tools.utils import dump_yaml, load_yaml, meerkat_dill_load, translate_index
 
 from .abstract import AbstractBlock, BlockIndex, BlockView
+from .result_cache import MISSING, ResultCache, make_namespace
+
+torch = LazyLoader("torch")
 
 
 @dataclass
@@ -23,6 +28,8 @@ class DeferredCellOp:
     fn: callable
     is_batched_fn: bool
     return_index: Union[str, int] = None
+    cache: ResultCache = field(default=None, compare=False, repr=False)
+    cache_key: Tuple[str, int] = field(default=None, compare=False, repr=False)
 
     @staticmethod
     def prepare_arg(arg):
@@ -35,16 +42,19 @@ class DeferredCellOp:
         return arg
 
     def _get(self):
-        args = [self.prepare_arg(arg) for arg in self.args]
-        kwargs = {kw: self.prepare_arg(arg) for kw, arg in self.kwargs.items()}
-        out = self.fn(*args, **kwargs)
+        out = MISSING if self.cache is None else self.cache.get(self.cache_key)
+        if out is MISSING:
+            args = [self.prepare_arg(arg) for arg in self.args]
+            kwargs = {kw: self.prepare_arg(arg) for kw, arg in self.kwargs.items()}
+            out = self.fn(*args, **kwargs)
+            if self.is_batched_fn:
+                out = _split_batch(out, 1)[0]
+            if self.cache is not None:
+                self.cache.put(self.cache_key, out)
 
         if self.return_index is not None:
             return out[self.return_index]
 
-        if self.is_batched_fn:
-            return out[0]
-
         return out
 
     def with_return_index(self, index: Union[str, int]):
@@ -91,6 +101,14 @@ class DeferredOp:
     return_format: type = None
     return_index: Union[str, int] = None
     materialize_inputs: bool = True
+    # the cache holding the outputs of `fn`, see `DeferredColumn.enable_cache`
+    cache: ResultCache = field(default=None, compare=False, repr=False)
+    cache_namespace: str = field(default=None, compare=False, repr=False)
+    # the rows of the op the cache was enabled on that the rows of this op map to,
+    # None if they are the same rows
+    cache_positions: np.ndarray = field(default=None, compare=False, repr=False)
+    # the versions of the inputs when the namespace was built
+    cache_versions: Tuple = field(default=None, compare=False, repr=False)
 
     @staticmethod
     def concat(ops: Sequence[DeferredOp]):
@@ -109,8 +127,61 @@ class DeferredOp:
             kwarg: mk.concat([op.kwargs[kwarg] for op in ops])
             for kwarg in op.kwargs.keys()
         }
+
+        # the cache can only be kept if all of the ops index into the same rows
+        if op.cache is not None and all(
+            other.cache is op.cache
+            and other._get_cache_namespace() == ops[0]._get_cache_namespace()
+            for other in ops
+        ):
+            op.cache_namespace = ops[0].cache_namespace
+            op.cache_positions = np.concatenate(
+                [other._cache_positions(np.arange(len(other))) for other in ops]
+            )
+            op.cache_versions = op._input_versions()
+        else:
+            op.disable_cache()
         return op
 
+    def enable_cache(self, cache: ResultCache):
+        """Cache the outputs of ``fn`` in ``cache``, keyed by the function, the
+        ids and versions of the inputs and the row."""
+        if cache.persist:
+            raise ValueError(
+                "The outputs of a deferred column can't be cached in a persisted "
+                "ResultCache, because their namespaces are not stable across "
+                "processes."
+            )
+        self.cache = cache
+        self.cache_namespace = make_namespace(
+            self.fn,
+            tuple(arg.id for arg in self.args)
+            + tuple(sorted((k, v.id) for k, v in self.kwargs.items())),
+        )
+        self.cache_positions = None
+        self.cache_versions = self._input_versions()
+
+    def disable_cache(self):
+        self.cache, self.cache_namespace = None, None
+        self.cache_positions, self.cache_versions = None, None
+
+    def _input_versions(self) -> Tuple:
+        return tuple(
+            _column_version(column)
+            for column in list(self.args) + list(self.kwargs.values())
+        )
+
+    def _get_cache_namespace(self) -> str:
+        """The namespace of the cached outputs, which is moved to a new one
+        when the inputs have been mutated since it was built."""
+        versions = self._input_versions()
+        if versions != self.cache_versions:
+            self.cache_namespace = make_namespace(
+                self.fn, (self.cache_namespace, versions)
+            )
+            self.cache_versions = versions
+        return self.cache_namespace
+
     def is_equal(self, other: Column):
         if (
             self.fn != other.fn
@@ -226,22 +297,10 @@ class DeferredOp:
         if single_on_batched:
             index = np.array([index])
 
-        # we pass results from other columns
-        # prepare inputs
-        kwargs = {
-            # if column has already been indexed
-            kwarg: indexed_inputs[id(column)]
-            if id(column) in indexed_inputs
-            else column._get(index, materialize=self.materialize_inputs)
-            for kwarg, column in self.kwargs.items()
-        }
+        if materialize and self.cache is not None:
+            return self._get_cached(index, indexed_inputs, single_on_batched)
 
-        args = [
-            indexed_inputs[id(column)]
-            if id(column) in indexed_inputs
-            else column._get(index, materialize=self.materialize_inputs)
-            for column in self.args
-        ]
+        args, kwargs = self._prepare_inputs(index, indexed_inputs)
 
         if isinstance(index, int):
             if materialize:
@@ -250,13 +309,7 @@ class DeferredOp:
                     output = output[self.return_index]
                 return output
             else:
-                return DeferredCellOp(
-                    fn=self.fn,
-                    args=args,
-                    kwargs=kwargs,
-                    is_batched_fn=self.is_batched_fn,
-                    return_index=self.return_index,
-                )
+                return self._cell_op(args, kwargs, index)
 
         elif isinstance(index, np.ndarray):
             if materialize:
@@ -267,20 +320,7 @@ class DeferredOp:
                         output = output[self.return_index]
 
                     if single_on_batched:
-                        if (
-                            (self.return_format is None or self.return_format is dict)
-                            and isinstance(output, Dict)
-                            and (self.return_index is None)
-                        ):
-                            return {k: v[0] for k, v in output.items()}
-                        elif (
-                            (self.return_format is None or self.return_format is tuple)
-                            and isinstance(output, Tuple)
-                            and (self.return_index is None)
-                        ):
-                            return [v[0] for v in output]
-                        else:
-                            return output[0]
+                        return self._unbatch_output(output)
                     return output
 
                 else:
@@ -295,22 +335,11 @@ class DeferredOp:
                             output = output[self.return_index]
                         outputs.append(output)
 
-                    if (self.return_format is dict) and (self.return_index is None):
-                        return merge_with(list, outputs)
-                    elif (self.return_format is tuple) and (self.return_index is None):
-                        return tuple(zip(*outputs))
-                    else:
-                        return outputs
+                    return self._collect_outputs(outputs)
 
             else:
                 if single_on_batched:
-                    return DeferredCellOp(
-                        fn=self.fn,
-                        args=args,
-                        kwargs=kwargs,
-                        is_batched_fn=self.is_batched_fn,
-                        return_index=self.return_index,
-                    )
+                    return self._cell_op(args, kwargs, int(index[0]))
                 return DeferredOp(
                     fn=self.fn,
                     args=args,
@@ -319,8 +348,159 @@ class DeferredOp:
                     batch_size=self.batch_size,
                     return_format=self.return_format,
                     return_index=self.return_index,
+                    cache=self.cache,
+                    cache_namespace=None
+                    if self.cache is None
+                    else self._get_cache_namespace(),
+                    cache_positions=None
+                    if self.cache is None
+                    else self._cache_positions(index),
+                    cache_versions=None
+                    if self.cache is None
+                    else tuple(
+                        _column_version(column)
+                        for column in list(args) + list(kwargs.values())
+                    ),
                 )
 
+    def _prepare_inputs(
+        self, index: Union[int, np.ndarray], indexed_inputs: Dict[int, Column]
+    ) -> Tuple[List, Dict]:
+        # we pass results from other columns
+        # prepare inputs
+        kwargs = {
+            # if column has already been indexed
+            kwarg: indexed_inputs[id(column)]
+            if id(column) in indexed_inputs
+            else column._get(index, materialize=self.materialize_inputs)
+            for kwarg, column in self.kwargs.items()
+        }
+
+        args = [
+            indexed_inputs[id(column)]
+            if id(column) in indexed_inputs
+            else column._get(index, materialize=self.materialize_inputs)
+            for column in self.args
+        ]
+        return args, kwargs
+
+    def _cell_op(self, args: List, kwargs: Dict, index: int) -> DeferredCellOp:
+        return DeferredCellOp(
+            fn=self.fn,
+            args=args,
+            kwargs=kwargs,
+            is_batched_fn=self.is_batched_fn,
+            return_index=self.return_index,
+            cache=self.cache,
+            cache_key=None
+            if self.cache is None
+            else (self._get_cache_namespace(), int(self._cache_positions(index))),
+        )
+
+    def _unbatch_output(self, output: object) -> object:
+        """Unpack the output of a batched function called on a single row."""
+        if (
+            (self.return_format is None or self.return_format is dict)
+            and isinstance(output, Dict)
+            and (self.return_index is None)
+        ):
+            return {k: v[0] for k, v in output.items()}
+        elif (
+            (self.return_format is None or self.return_format is tuple)
+            and isinstance(output, Tuple)
+            and (self.return_index is None)
+        ):
+            return [v[0] for v in output]
+        else:
+            return output[0]
+
+    def _collect_outputs(self, outputs: List[object]) -> object:
+        """Collect the outputs of an unbatched function called on each row."""
+        if (self.return_format is dict) and (self.return_index is None):
+            return merge_with(list, outputs)
+        elif (self.return_format is tuple) and (self.return_index is None):
+            return tuple(zip(*outputs))
+        else:
+            return outputs
+
+    def _cache_positions(self, index: Union[int, np.ndarray]):
+        if self.cache_positions is None:
+            return index
+        return self.cache_positions[index]
+
+    def _get_cached(
+        self,
+        index: Union[int, np.ndarray],
+        indexed_inputs: Dict[int, Column],
+        single_on_batched: bool,
+    ):
+        """Materialize the rows at ``index``, computing only the rows whose
+        outputs are not in the cache.
+
+        The cache holds the output of ``fn`` for each row (i.e. before
+        ``return_index`` is applied), so it is shared by all of the columns
+        backed by the op.
+        """
+        batch_index = np.atleast_1d(index)
+        namespace = self._get_cache_namespace()
+        keys = [
+            (namespace, int(position))
+            for position in self._cache_positions(batch_index)
+        ]
+        rows = [self.cache.get(key) for key in keys]
+
+        missing = np.array([row is MISSING for row in rows], dtype=bool)
+        if missing.any():
+            missing_index = batch_index[missing]
+            args, kwargs = self._prepare_inputs(
+                missing_index if isinstance(index, np.ndarray) else index,
+                {
+                    # inputs indexed by the caller are subset to the missing rows
+                    key: value
+                    if missing.all() or not isinstance(value, Column)
+                    else value._get(
+                        np.where(missing)[0], materialize=self.materialize_inputs
+                    )
+                    for key, value in indexed_inputs.items()
+                },
+            )
+            if isinstance(index, int):
+                computed = [self.fn(*args, **kwargs)]
+            elif self.is_batched_fn:
+                computed = _split_batch(
+                    self.fn(*args, **kwargs), num_rows=len(missing_index)
+                )
+            else:
+                computed = [
+                    self.fn(
+                        *[arg[i] for arg in args],
+                        **{kwarg: column[i] for kwarg, column in kwargs.items()},
+                    )
+                    for i in range(len(missing_index))
+                ]
+
+            for position, row in zip(np.where(missing)[0], computed):
+                self.cache.put(keys[position], row)
+                rows[position] = row
+
+        if isinstance(index, int) or single_on_batched:
+            output = rows[0]
+            if self.return_index is not None:
+                return output[self.return_index]
+            if single_on_batched and isinstance(output, tuple):
+                return list(output)
+            return output
+
+        if self.is_batched_fn:
+            output = _merge_batch(rows)
+            if self.return_index is not None:
+                output = output[self.return_index]
+            return output
+
+        if self.return_index is not None:
+            rows = [row[self.return_index] for row in rows]
+        return self._collect_outputs(rows)
+
     def __len__(self):
         if len(self.args) > 0:
             return len(self.args[0])
@@ -336,6 +516,35 @@ class DeferredOp:
         return op
 
 
+def _split_batch(output: object, num_rows: int) -> List[object]:
+    """Split the output of a batched function into the outputs for each
+    row."""
+    if isinstance(output, dict):
+        columns = {k: _split_batch(v, num_rows) for k, v in output.items()}
+        return [{k: v[i] for k, v in columns.items()} for i in range(num_rows)]
+    if isinstance(output, tuple):
+        columns = [_split_batch(v, num_rows) for v in output]
+        return [tuple(v[i] for v in columns) for i in range(num_rows)]
+    if isinstance(output, pd.Series):
+        return [output.iloc[i] for i in range(num_rows)]
+    return [output[i] for i in range(num_rows)]
+
+
+def _merge_batch(rows: List[object]) -> object:
+    """Merge the outputs for each row into the output of a batched function,
+    the inverse of :func:`_split_batch`."""
+    first = rows[0]
+    if isinstance(first, dict):
+        return {k: _merge_batch([row[k] for row in rows]) for k in first}
+    if isinstance(first, tuple):
+        return tuple(_merge_batch([row[i] for row in rows]) for i in range(len(first)))
+    if isinstance(first, (np.ndarray, np.generic)):
+        return np.stack(rows)
+    if torch.is_tensor(first):
+        return torch.stack(rows)
+    return list(rows)
+
+
 class DeferredBlock(AbstractBlock):
     @dataclass(eq=True, frozen=True)
     class Signature:
@@ -472,3 +681,9 @@ class DeferredBlock(AbstractBlock):
     ) -> object:
         path = os.path.join(path, "data.op")
         return DeferredOp.read(path, read_inputs=read_inputs)
+
+
+def _column_version(column: Column) -> Tuple[int, Optional[int]]:
+    # mutations through a column are counted on the column and on its block
+    block = getattr(column, "_block", None)
+    return (column._version, None if block is None else block._version)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Any, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class KeyIndex:
+    """A hash index mapping the keys in a column to their positions.
+
+    The index is backed by a :class:`pandas.Index`, so lookups are served by a
+    hash table that pandas builds lazily on first use. Keys that form a contiguous
+    range of integers (e.g. the ``pkey`` column created by
+    :meth:`DataFrame.create_primary_key`) are stored as a
+    :class:`pandas.RangeIndex`, which needs no hash table at all. If a key occurs
+    more than once, it is mapped to the position of its first occurrence.
+
+    Args:
+        keys (np.ndarray): The keys, in positional order.
+    """
+
+    def __init__(self, keys: np.ndarray):
+        keys = np.asarray(keys)
+        # the positions of the keys in the index, if they are not 0, 1, 2, ...
+        self._positions = None
+        if (
+            keys.dtype.kind in "iu"
+            and len(keys) > 0
+            and (keys == np.arange(keys[0], keys[0] + len(keys))).all()
+        ):
+            self._index = pd.RangeIndex(int(keys[0]), int(keys[0]) + len(keys))
+        else:
+            index = pd.Index(keys)
+            if not index.is_unique:
+                first = ~index.duplicated(keep="first")
+                index = index[first]
+                self._positions = np.flatnonzero(first)
+            self._index = index
+        self._length = len(keys)
+
+    @classmethod
+    def from_column(cls, column) -> KeyIndex:
+        return cls(column.to_numpy())
+
+    def __len__(self):
+        return self._length
+
+    def get_loc(self, key: Any) -> int:
+        """Get the position of ``key``. Raise a key error if the key is not
+        found."""
+        try:
+            posidx = self._index.get_loc(key)
+        except (KeyError, TypeError):
+            raise KeyError(f"keyidx {key} not found in column.")
+        if self._positions is not None:
+            posidx = self._positions[posidx]
+        return int(posidx)
+
+    def get_locs(self, keys: Sequence[Any]) -> np.ndarray:
+        """Get the positions of ``keys``, in the order of ``keys``. Raise a key
+        error if any of the keys are not found."""
+        posidxs, found = self.lookup(keys)
+        if not found.all():
+            raise KeyError(
+                f"Key indexes {_as_key_array(keys)[~found].tolist()} not found in "
+                "column."
+            )
+        return posidxs
+
+    def lookup(self, keys: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the positions of ``keys``, in the order of ``keys``, without raising
+        for missing keys.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The positions of the keys, which are -1
+                for the keys that are not found, and a boolean mask of the keys that
+                are found.
+        """
+        keys = _as_key_array(keys)
+        try:
+            posidxs = self._index.get_indexer(keys)
+        except TypeError:
+            # e.g. string keys looked up in an integer index
+            posidxs = np.full(len(keys), -1, dtype=np.intp)
+        found = posidxs != -1
+        if self._positions is not None:
+            posidxs = np.where(found, self._positions[posidxs], -1)
+        return posidxs, found
+
+
+def _as_key_array(keys: Sequence[Any]) -> pd.Index:
+    if not isinstance(keys, (np.ndarray, pd.Series, pd.Index)):
+        # e.g. torch tensors are converted with `__array__`, and lists go straight
+        # to pandas, which keeps mixed types (and empty lists) as objects
+        keys = np.asarray(keys) if hasattr(keys, "__array__") else list(keys)
+    return pd.Index(keys)
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import os
 import shutil
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Mapping, Sequence, Tuple, Union
 
 import numpy as np
@@ -18,6 +19,9 @@ from meerkat.tools.utils import dump_yaml, load_yaml
 from .deferred_block import DeferredBlock
 from .ref import BlockRef
 
+# placeholder for the columns of a lazily read BlockManager that are not yet loaded
+_UNLOADED = object()
+
 
 class BlockManager(MutableMapping):
     """Manages all blocks in a DataFrame."""
@@ -26,6 +30,8 @@ class BlockManager(MutableMapping):
         self._columns: Dict[str, Column] = {}  # ordered as of 3.7
         self._column_to_block_id: Dict[str, int] = {}
         self._block_refs: Dict[int, BlockRef] = {}
+        # reads unloaded columns from disk, see `BlockManager.read(lazy=True)`
+        self._reader: _BlockManagerReader = None
 
     def update(self, block_ref: BlockRef):
         """data (): a single blockable object, potentially contains multiple
@@ -82,6 +88,7 @@ class BlockManager(MutableMapping):
         """"""
         from .deferred_block import DeferredBlock
 
+        self._load()
         results = None
         indexed_inputs = {}
         for _, block_ref in self.topological_block_refs():
@@ -137,6 +144,7 @@ class BlockManager(MutableMapping):
         return results
 
     def consolidate(self, consolidate_unitary_groups: bool = False):
+        self._load()
         column_order = list(
             self._columns.keys()
         )  # need to maintain order after consolidate
@@ -164,6 +172,18 @@ class BlockManager(MutableMapping):
                 for name, col in block_ref.items():
                     consolidated_inputs[id(col)] = new_block_ref[name]
 
+                    # carry over key and vector indices, which are still valid
+                    # since consolidation doesn't change the data
+                    new_col = new_block_ref[name]
+                    key_index = col._block._get_key_index(col._block_index)
+                    if key_index is not None:
+                        new_col._block._set_key_index(new_col._block_index, key_index)
+                    vector_index = col._block._get_vector_index(col._block_index)
+                    if vector_index is not None:
+                        new_col._block._set_vector_index(
+                            new_col._block_index, vector_index
+                        )
+
             self.update(new_block_ref)
 
         self.reorder(column_order)
@@ -193,8 +213,17 @@ class BlockManager(MutableMapping):
         self, index: Union[str, Sequence[str]]
     ) -> Union[Column, BlockManager]:
         if isinstance(index, str):
-            return self._columns[index]
+            column = self._columns[index]
+            if self._reader is not None and column is _UNLOADED:
+                self._load([index])
+                column = self._columns[index]
+            # loading the last unloaded column drops the reader
+            if self._reader is not None:
+                self._reader.touch(index)
+                self._evict()
+            return column
         elif isinstance(index, Sequence):
+            self._load(index)
             mgr = BlockManager()
             block_id_to_names = defaultdict(list)
             for name in index:
@@ -237,7 +266,7 @@ class BlockManager(MutableMapping):
 
     @property
     def nrows(self):
-        return 0 if len(self) == 0 else len(next(iter(self._columns.values())))
+        return 0 if len(self) == 0 else len(self[next(iter(self._columns))])
 
     @property
     def ncols(self):
@@ -250,6 +279,7 @@ class BlockManager(MutableMapping):
         return iter(self._columns)
 
     def get_block_ref(self, name: str):
+        self._load([name])
         return self._block_refs[self._column_to_block_id[name]]
 
     def add_column(self, col: Column, name: str):
@@ -274,26 +304,53 @@ class BlockManager(MutableMapping):
             mgr.add_column(col=col, name=name)
         return mgr
 
-    def write(self, path: str):
+    def write(self, path: str, num_threads: int = None):
+        """Write the BlockManager to disk.
+
+        Blocks are written concurrently in a thread pool. The size and a checksum
+        of each block's data are recorded in the metadata. When overwriting a
+        BlockManager previously written to ``path``, blocks whose checksum is
+        unchanged are moved into place instead of being written again.
+
+        Args:
+            path (str): The directory to write to.
+            num_threads (int, optional): The number of threads used to write
+                blocks. Defaults to None, in which case the default of
+                :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        """
+        self._load()
         meta = {
             "dtype": BlockManager,
             "columns": {},
+            "blocks": {},
             "_column_order": list(self.keys()),
         }
 
         # prepare directories
         columns_dir = os.path.join(path, "columns")
         blocks_dir = os.path.join(path, "blocks")
+        old_blocks_dir = os.path.join(path, "blocks.old")
         meta_path = os.path.join(path, "meta.yaml")
+        # previously written blocks that can be reused, keyed by checksum
+        old_blocks: Dict[str, str] = {}
         if os.path.isdir(path):
             if (
                 os.path.exists(meta_path)
                 and os.path.exists(columns_dir)
                 and os.path.exists(blocks_dir)
             ):
-                # if overwriting, ensure that old columns are removed
+                # if overwriting, ensure that old columns are removed, and set the
+                # old blocks aside so that unchanged ones can be reused
+                old_meta = dict(load_yaml(meta_path))
+                if os.path.exists(old_blocks_dir):
+                    shutil.rmtree(old_blocks_dir)
+                os.rename(blocks_dir, old_blocks_dir)
                 shutil.rmtree(columns_dir)
-                shutil.rmtree(blocks_dir)
+                for block_dir, block_meta in old_meta.get("blocks", {}).items():
+                    if block_meta.get("checksum") is not None:
+                        old_blocks[block_meta["checksum"]] = os.path.join(
+                            old_blocks_dir, os.path.basename(block_dir)
+                        )
             else:
                 # if path already points to a dir that wasn't previously holding a
                 # block manager, do not overwrite it. We'd like to protect against
@@ -318,14 +375,11 @@ class BlockManager(MutableMapping):
         # appropriately
         written_inputs: Dict[int, str] = {}
 
+        block_dirs: Dict[str, AbstractBlock] = {}
         for block_id, block_ref in self.topological_block_refs():
             block: AbstractBlock = block_ref.block
             block_dir = os.path.join(blocks_dir, str(block_id))
-
-            if isinstance(block, DeferredBlock):
-                block.write(block_dir, written_inputs=written_inputs)
-            else:
-                block.write(block_dir)
+            block_dirs[block_dir] = block
 
             for name, column in block_ref.items():
                 column_dir = os.path.join(columns_dir, name)
@@ -347,6 +401,42 @@ class BlockManager(MutableMapping):
                 # add the written column to the inputs
                 written_inputs[id(column)] = os.path.relpath(column_dir, path)
 
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            checksums = list(
+                executor.map(lambda block: block._checksum(), block_dirs.values())
+            )
+
+            def write_block(block_dir: str, block: AbstractBlock, old_block_dir: str):
+                if old_block_dir is not None:
+                    # the data is unchanged, only the metadata needs to be rewritten
+                    os.rename(old_block_dir, block_dir)
+                    block._write_metadata(block_dir)
+                elif isinstance(block, DeferredBlock):
+                    block.write(block_dir, written_inputs=written_inputs)
+                else:
+                    block.write(block_dir)
+                return _dir_nbytes(block_dir)
+
+            futures = {}
+            for (block_dir, block), checksum in zip(block_dirs.items(), checksums):
+                # each previously written block can only be reused once
+                old_block_dir = old_blocks.pop(checksum, None)
+                if old_block_dir is not None and not os.path.isdir(old_block_dir):
+                    old_block_dir = None
+                futures[block_dir] = (
+                    executor.submit(write_block, block_dir, block, old_block_dir),
+                    checksum,
+                )
+
+            for block_dir, (future, checksum) in futures.items():
+                meta["blocks"][os.path.relpath(block_dir, path)] = {
+                    "checksum": checksum,
+                    "nbytes": future.result(),
+                }
+
+        if os.path.exists(old_blocks_dir):
+            shutil.rmtree(old_blocks_dir)
+
         # write columns not in a block
         for name, column in self._columns.items():
             if name in meta["columns"]:
@@ -366,58 +456,109 @@ class BlockManager(MutableMapping):
         cls,
         path: str,
         columns: Sequence[str] = None,
+        lazy: bool = False,
+        mmap: bool = False,
+        max_loaded_blocks: int = None,
         **kwargs,
     ) -> BlockManager:
-        """Load a DataFrame stored on disk."""
-
+        """Load a DataFrame stored on disk.
+
+        Args:
+            path (str): The directory the BlockManager was written to.
+            columns (Sequence[str], optional): The subset of columns to read.
+                Defaults to None, in which case all columns are read.
+            lazy (bool): Whether to defer reading each block until one of its
+                columns is first accessed. Opening the BlockManager then only reads
+                its metadata. Operations that need every column (e.g. indexing rows,
+                writing or displaying the DataFrame) load all of the blocks, so lazy
+                reads pair well with ``mmap``. Defaults to False.
+            mmap (bool): Whether to memory map the blocks that support it (NumPy,
+                Torch, pandas and Arrow blocks), instead of reading them into
+                memory. Memory mapped NumPy and pandas data is read-only, while
+                Torch data is mapped copy-on-write. Blocks that were memory mapped
+                when written are always memory mapped. Defaults to False.
+            max_loaded_blocks (int, optional): With ``lazy``, the maximum number of
+                blocks to keep loaded when accessing individual columns. The least
+                recently accessed blocks are released and re-read from disk the
+                next time they are needed. Blocks whose data has been modified in
+                place are never released. Defaults to None, in which case blocks
+                are never released.
+        """
         # Load the metadata
         meta = dict(load_yaml(os.path.join(path, "meta.yaml")))
 
-        # maintain a dictionary mapping from paths to columns
-        # so that lambda blocks that depend on those columns don't load them again
-        read_inputs: Dict[int, Column] = {}
-
-        blocks = {}
+        reader = _BlockManagerReader(
+            path,
+            meta=meta,
+            mmap=mmap,
+            max_loaded_blocks=max_loaded_blocks,
+            column_kwargs=kwargs,
+        )
         mgr = cls()
-        for name, col_meta in meta["columns"].items():
-            column_dir = os.path.join(path, "columns", name)
+        for name in meta["_column_order"]:
             # load a subset of columns
             if columns is not None and name not in columns:
                 continue
+            mgr._columns[name] = _UNLOADED
 
-            if "block" in col_meta:
-                # read block or fetch it from `blocks` if it's already been read
-                block_meta = col_meta["block"]
-                if block_meta["block_dir"] not in blocks:
-                    blocks[block_meta["block_dir"]] = AbstractBlock.read(
-                        os.path.join(path, block_meta["block_dir"]),
-                        mmap=block_meta.get("mmap", False),
-                        read_inputs=read_inputs,
-                    )
-                block = blocks[block_meta["block_dir"]]
+        mgr._reader = reader
+        if not lazy:
+            mgr._load()
+            mgr._reader = None
+        return mgr
 
-                # read column, passing in a block_view
-                col = col_meta["dtype"].read(
-                    column_dir,
-                    _data=block[_deserialize_block_index(block_meta["block_index"])],
-                    _meta=col_meta,
-                    **kwargs,
-                )
-                mgr.add_column(col, name)
-                read_inputs[os.path.relpath(column_dir, path)] = col
+    def _load(self, names: Sequence[str] = None):
+        """Read the columns in ``names`` (or all columns) that have not yet
+        been loaded from disk."""
+        if self._reader is None:
+            return
 
-            else:
-                mgr.add_column(
-                    col_meta["dtype"].read(path=column_dir, _meta=col_meta, **kwargs),
-                    name,
-                )
-        mgr.reorder(meta["_column_order"])
-        return mgr
+        names = self._columns if names is None else names
+        for name in [name for name in names if self._columns.get(name) is _UNLOADED]:
+            col = self._reader.read_column(name)
+            # assign in place to maintain the column order
+            self._columns[name] = col
+            if col.is_blockable():
+                block_id = id(col._block)
+                if block_id in self._block_refs:
+                    self._block_refs[block_id].update(
+                        BlockRef(columns={name: col}, block=col._block)
+                    )
+                else:
+                    self._block_refs[block_id] = BlockRef(
+                        columns={name: col}, block=col._block
+                    )
+                self._column_to_block_id[name] = block_id
+
+        if self._reader.max_loaded_blocks is None and not any(
+            col is _UNLOADED for col in self._columns.values()
+        ):
+            # all of the columns have been loaded and none will be released
+            self._reader = None
+
+    def _evict(self):
+        """Release the least recently used blocks read from disk, returning
+        their columns to the unloaded state."""
+        for block_dir, block in self._reader.evict():
+            if block._mutated:
+                continue
+            for name in self._reader.block_columns(block_dir):
+                if self._column_to_block_id.get(name) != id(block):
+                    # the column has been removed or replaced
+                    continue
+                block_ref = self._block_refs[id(block)]
+                del block_ref[name]
+                if len(block_ref) == 0:
+                    self._block_refs.pop(id(block))
+                self._column_to_block_id.pop(name)
+                self._columns[name] = _UNLOADED
+                self._reader.release(name)
 
     @unmarked()
     def _repr_pandas_(self, max_rows: int = None):
         if max_rows is None:
             max_rows = meerkat.config.display.max_rows
+        self._load()
         cols = {}
         formatters = {}
         for name, column in self._columns.items():
@@ -450,6 +591,115 @@ class BlockManager(MutableMapping):
         return mgr
 
 
+class _BlockManagerReader:
+    """Reads the columns of a BlockManager written to disk, reading each block
+    at most once while it is in use."""
+
+    def __init__(
+        self,
+        path: str,
+        meta: Dict,
+        mmap: bool = False,
+        max_loaded_blocks: int = None,
+        column_kwargs: Dict = None,
+    ):
+        self.path = path
+        self.meta = meta
+        self.mmap = mmap
+        self.max_loaded_blocks = max_loaded_blocks
+        self.column_kwargs = {} if column_kwargs is None else column_kwargs
+
+        # maintain a dictionary mapping from paths to columns
+        # so that lambda blocks that depend on those columns don't load them again
+        self.read_inputs: Dict[str, Column] = {}
+        # the blocks read so far, in order of last access
+        self.blocks: OrderedDict[str, AbstractBlock] = OrderedDict()
+
+    def read_column(self, name: str) -> Column:
+        col_meta = self.meta["columns"][name]
+        column_dir = os.path.join(self.path, "columns", name)
+        if os.path.relpath(column_dir, self.path) in self.read_inputs:
+            # already read as the input to a deferred block
+            return self.read_inputs[os.path.relpath(column_dir, self.path)]
+
+        if "block" not in col_meta:
+            return col_meta["dtype"].read(
+                path=column_dir, _meta=col_meta, **self.column_kwargs
+            )
+
+        block_meta = col_meta["block"]
+        block = self._read_block(
+            block_meta["block_dir"], mmap=self.mmap or block_meta.get("mmap", False)
+        )
+
+        # read column, passing in a block_view
+        col = col_meta["dtype"].read(
+            column_dir,
+            _data=block[_deserialize_block_index(block_meta["block_index"])],
+            _meta=col_meta,
+            **self.column_kwargs,
+        )
+        self.read_inputs[os.path.relpath(column_dir, self.path)] = col
+        return col
+
+    def _read_block(self, block_dir: str, mmap: bool) -> AbstractBlock:
+        # read block or fetch it from `blocks` if it's already been read
+        if block_dir in self.blocks:
+            return self.blocks[block_dir]
+
+        block_path = os.path.join(self.path, block_dir)
+        op_meta_path = os.path.join(block_path, "data.op", "meta.yaml")
+        if os.path.exists(op_meta_path):
+            # the inputs of a deferred block must be read before the block itself
+            op_meta = dict(load_yaml(op_meta_path))
+            for input_path in list(op_meta["args"]) + list(op_meta["kwargs"].values()):
+                input_name = os.path.basename(input_path)
+                if (
+                    input_path not in self.read_inputs
+                    and input_name in self.meta["columns"]
+                ):
+                    self.read_column(input_name)
+
+        self.blocks[block_dir] = AbstractBlock.read(
+            block_path, mmap=mmap, read_inputs=self.read_inputs
+        )
+        return self.blocks[block_dir]
+
+    def touch(self, name: str):
+        """Mark the block of column ``name`` as the most recently used."""
+        block_meta = self.meta["columns"][name].get("block")
+        if block_meta is not None and block_meta["block_dir"] in self.blocks:
+            self.blocks.move_to_end(block_meta["block_dir"])
+
+    def evict(self) -> List[Tuple[str, AbstractBlock]]:
+        """Stop tracking the least recently used blocks beyond
+        ``max_loaded_blocks`` and return them."""
+        evicted = []
+        if self.max_loaded_blocks is None:
+            return evicted
+        while len(self.blocks) > self.max_loaded_blocks:
+            evicted.append(self.blocks.popitem(last=False))
+        return evicted
+
+    def block_columns(self, block_dir: str) -> List[str]:
+        return [
+            name
+            for name, col_meta in self.meta["columns"].items()
+            if "block" in col_meta and col_meta["block"]["block_dir"] == block_dir
+        ]
+
+    def release(self, name: str):
+        self.read_inputs.pop(os.path.join("columns", name), None)
+
+
+def _dir_nbytes(path: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
 def _serialize_block_index(index: BlockIndex) -> Union[Dict, str, int]:
     if index is not None and not isinstance(index, (int, str, slice)):
         raise ValueError("Can only serialize `BlockIndex` objects.")
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import shutil
 from dataclasses import dataclass
 from mmap import mmap
-from typing import Dict, Hashable, Sequence, Tuple, Union
+from typing import Dict, Hashable, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -13,7 +14,7 @@ from meerkat.columns.abstract import Column
 from meerkat.errors import ConsolidationError
 from meerkat.tools.lazy_loader import LazyLoader
 
-from .abstract import AbstractBlock, BlockIndex, BlockView
+from .abstract import CHUNK_BYTES, AbstractBlock, BlockIndex, BlockView, hash_array
 
 torch = LazyLoader("torch")
 
@@ -160,7 +161,14 @@ class NumPyBlock(AbstractBlock):
             else:
                 shutil.copy(self.data.filename, path)
         else:
-            np.save(path, self.data)
+            _save_array(path, self.data)
+
+    def _checksum(self) -> Optional[str]:
+        if self.data.dtype.hasobject:
+            return None
+        hasher = hashlib.blake2b(type(self).__name__.encode(), digest_size=16)
+        hash_array(hasher, self.data)
+        return hasher.hexdigest()
 
     @staticmethod
     def _read_data(
@@ -171,3 +179,26 @@ class NumPyBlock(AbstractBlock):
         if mmap:
             return np.load(data_path, mmap_mode="r")
         return np.load(data_path, allow_pickle=True)
+
+
+def _save_array(path: str, array: np.ndarray):
+    """Save ``array`` in the ``.npy`` format, like :func:`np.save`, but
+    streaming it to disk a chunk of rows at a time."""
+    if array.dtype.hasobject or array.ndim == 0:
+        np.save(path, array)
+        return
+
+    header = np.lib.format.header_data_from_array_1_0(array)
+    # chunks are always written in C order
+    header["fortran_order"] = False
+    with open(path, "wb") as f:
+        try:
+            np.lib.format.write_array_header_1_0(f, header)
+        except ValueError:
+            # the header is too large for version 1.0 of the format
+            f.seek(0)
+            np.lib.format.write_array_header_2_0(f, header)
+
+        chunk_size = max(CHUNK_BYTES // max(array[:1].nbytes, 1), 1)
+        for start in range(0, len(array), chunk_size):
+            f.write(np.ascontiguousarray(array[start : start + chunk_size]).data)
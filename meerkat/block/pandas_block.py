@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import os
 from dataclasses import dataclass
-from typing import Dict, Hashable, List, Sequence, Tuple, Union
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, Union
 
 import pandas as pd
 
@@ -12,7 +13,7 @@ from meerkat.columns.tensor.numpy import NumPyTensorColumn
 from meerkat.columns.tensor.torch import TorchTensorColumn
 from meerkat.tools.lazy_loader import LazyLoader
 
-from .abstract import AbstractBlock, BlockIndex, BlockView
+from .abstract import AbstractBlock, BlockIndex, BlockView, hash_array
 
 torch = LazyLoader("torch")
 
@@ -134,13 +135,36 @@ class PandasBlock(AbstractBlock):
         return BlockRef(block=block, columns=columns)
 
     def _write_data(self, path: str):
-        self.data.reset_index(drop=True).to_feather(os.path.join(path, "data.feather"))
+        # uncompressed, so that the file can be memory mapped when it is read
+        self.data.reset_index(drop=True).to_feather(
+            os.path.join(path, "data.feather"), compression="uncompressed"
+        )
+
+    def _checksum(self) -> Optional[str]:
+        try:
+            row_hashes = pd.util.hash_pandas_object(self.data, index=False)
+        except TypeError:
+            # columns holding unhashable objects
+            return None
+        hasher = hashlib.blake2b(type(self).__name__.encode(), digest_size=16)
+        hasher.update(repr(list(self.data.dtypes.items())).encode())
+        hash_array(hasher, row_hashes.to_numpy())
+        return hasher.hexdigest()
 
     @staticmethod
     def _read_data(
         path: str, mmap: bool = False, read_inputs: Dict[str, Column] = None
     ):
-        return pd.read_feather(os.path.join(path, "data.feather"))
+        path = os.path.join(path, "data.feather")
+        if not mmap:
+            return pd.read_feather(path)
+
+        from pyarrow import feather
+
+        # with `split_blocks`, numeric columns without nulls are views of the mapped
+        # file rather than copies, since they are not consolidated into 2D blocks
+        table = feather.read_table(path, memory_map=True)
+        return table.to_pandas(split_blocks=True)
 
     def mean(self):
         return self.data.mean()
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+from uuid import uuid4
+
+import dill
+import numpy as np
+
+from meerkat.tools.lazy_loader import LazyLoader
+
+torch = LazyLoader("torch")
+
+MISSING = object()
+
+
+class ResultCache:
+    """A least-recently-used cache for the outputs of a :class:`DeferredOp`,
+    with a budget on the number of bytes held in memory.
+
+    Entries are keyed by ``(namespace, position)``, where ``namespace`` identifies
+    the function and its inputs and ``position`` is the row the output was computed
+    for. If ``spill_dir`` is passed, entries evicted from memory are written to disk
+    and read back on the next lookup, instead of being recomputed. With
+    ``persist=True``, every entry is also written to ``spill_dir`` as soon as it is
+    put, unless it is put with ``persist=False``, and lookups fall back to entries
+    written by earlier processes. This is only safe for keys that are stable across
+    processes, which the namespaces of :class:`DeferredOp` are not, so deferred
+    columns can't use a persisted cache. If ``max_disk_bytes`` is passed, the
+    least recently used files in ``spill_dir`` are deleted when it grows beyond
+    it.
+
+    A single cache can be shared by many deferred columns.
+
+    Args:
+        max_bytes (int): The maximum number of bytes of outputs to hold in memory.
+            Defaults to 1 GiB.
+        spill_dir (str, optional): A directory to write evicted entries to. Defaults
+            to None, in which case evicted entries are dropped.
+        persist (bool): Whether to write every entry through to ``spill_dir``.
+            Defaults to False.
+        max_disk_bytes (int, optional): The maximum number of bytes of entries to
+            keep in ``spill_dir``. Defaults to None, in which case it is unbounded.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 2**30,
+        spill_dir: str = None,
+        persist: bool = False,
+        max_disk_bytes: int = None,
+    ):
+        if persist and spill_dir is None:
+            raise ValueError("Must pass `spill_dir` to persist a ResultCache.")
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.persist = persist
+        self.max_disk_bytes = max_disk_bytes
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+
+        self._entries: OrderedDict = OrderedDict()
+        self._nbytes = 0
+        self._spilled = set()
+        # the entries in `spill_dir` may have been written by other processes
+        self._disk_bytes = 0 if spill_dir is None else _dir_size(spill_dir)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of outputs held in memory."""
+        return self._nbytes
+
+    def get(self, key: Tuple[str, Hashable]) -> Any:
+        """Get the output cached under ``key``, or ``MISSING`` if there is
+        none."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+
+            if key in self._spilled or self.persist:
+                path = self._spill_path(key)
+                try:
+                    with open(path, "rb") as f:
+                        value = dill.load(f)
+                    # the modification time orders the files by recency of use
+                    os.utime(path)
+                except FileNotFoundError:
+                    # never written, or deleted to keep within `max_disk_bytes`
+                    self._spilled.discard(key)
+                else:
+                    self.hits += 1
+                    self._insert(key, value)
+                    return value
+
+            self.misses += 1
+            return MISSING
+
+    def put(self, key: Tuple[str, Hashable], value: Any, persist: bool = True):
+        """Cache ``value`` under ``key``. Pass ``persist=False`` to not write it
+        through to ``spill_dir``, e.g. if ``key`` is only meaningful in this
+        process."""
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[1]
+            if self.persist and persist:
+                self._spilled.discard(key)
+                self._spill(key, value)
+            self._insert(key, value)
+
+    def clear(self, namespace: str = None):
+        """Drop all entries or, if ``namespace`` is passed, only the entries in
+        ``namespace``."""
+        with self._lock:
+            keys = [
+                key
+                for key in list(self._entries) + list(self._spilled)
+                if namespace is None or key[0] == namespace
+            ]
+            for key in keys:
+                if key in self._entries:
+                    self._nbytes -= self._entries.pop(key)[1]
+                if key in self._spilled:
+                    self._spilled.remove(key)
+                    path = self._spill_path(key)
+                    if os.path.exists(path):
+                        self._disk_bytes -= os.path.getsize(path)
+                        os.remove(path)
+
+    def _insert(self, key: Tuple[str, Hashable], value: Any):
+        nbytes = _sizeof(value)
+        if nbytes > self.max_bytes:
+            self._spill(key, value)
+            return
+
+        self._entries[key] = (value, nbytes)
+        self._nbytes += nbytes
+        while self._nbytes > self.max_bytes:
+            evicted_key, (evicted, evicted_nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= evicted_nbytes
+            self._spill(evicted_key, evicted)
+
+    def _spill(self, key: Tuple[str, Hashable], value: Any):
+        if self.spill_dir is None or key in self._spilled:
+            return
+        path = self._spill_path(key)
+        with open(path, "wb") as f:
+            dill.dump(value, f)
+        self._spilled.add(key)
+        self._disk_bytes += os.path.getsize(path)
+        if self.max_disk_bytes is not None and self._disk_bytes > self.max_disk_bytes:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        # other processes may share the directory, so it is rescanned
+        files = []
+        for entry in os.scandir(self.spill_dir):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        self._disk_bytes = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._disk_bytes -= size
+
+    def _spill_path(self, key: Tuple[str, Hashable]) -> str:
+        namespace, position = key
+        if not isinstance(position, (int, np.integer)):
+            position = hashlib.blake2b(
+                repr(position).encode(), digest_size=16
+            ).hexdigest()
+        return os.path.join(self.spill_dir, f"{namespace}-{position}.pkl")
+
+    def __getstate__(self):
+        # in-memory entries are not shipped to other processes, but spilled
+        # entries remain readable from them
+        state = self.__dict__.copy()
+        state["_entries"] = OrderedDict()
+        state["_nbytes"] = 0
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+
+def make_namespace(fn: callable, inputs: Tuple[Hashable, ...]) -> str:
+    """Build a cache namespace from a function and the fingerprints of its
+    inputs.
+
+    The function is identified by a token that is unique to the function object
+    for as long as it is alive, so, unlike its ``id``, it is never reused by
+    another function. Namespaces are not stable across processes.
+    """
+    name = getattr(fn, "__qualname__", type(fn).__qualname__)
+    name = "".join(c if c.isalnum() or c in "_." else "_" for c in name)
+    digest = hashlib.blake2b(
+        repr((_fn_token(fn), inputs)).encode(), digest_size=8
+    ).hexdigest()
+    return f"{name}-{digest}"
+
+
+_fn_tokens: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+_fn_tokens_lock = threading.Lock()
+
+
+def _fn_token(fn: callable) -> str:
+    with _fn_tokens_lock:
+        try:
+            token = _fn_tokens.get(fn)
+            if token is None:
+                token = _fn_tokens[fn] = uuid4().hex
+            return token
+        except TypeError:
+            # functions that can't be weakly referenced get a token of their own
+            # on every call, so their outputs are never shared
+            return uuid4().hex
+
+
+def _dir_size(path: str) -> int:
+    size = 0
+    for entry in os.scandir(path):
+        try:
+            size += entry.stat().st_size
+        except FileNotFoundError:
+            pass
+    return size
+
+
+def _sizeof(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if torch.is_tensor(value):
+        return value.element_size() * value.nelement()
+    # avoid importing PIL, which is an optional dependency
+    pil_image = sys.modules.get("PIL.Image")
+    if pil_image is not None and isinstance(value, pil_image.Image):
+        return value.width * value.height * len(value.getbands())
+    if isinstance(value, dict):
+        return sum(_sizeof(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_sizeof(v) for v in value)
+    return sys.getsizeof(value)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import os
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, Hashable, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Hashable, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -12,7 +13,8 @@ from meerkat.columns.abstract import Column
 from meerkat.errors import ConsolidationError
 from meerkat.tools.lazy_loader import LazyLoader
 
-from .abstract import AbstractBlock, BlockIndex, BlockView
+from .abstract import AbstractBlock, BlockIndex, BlockView, hash_array
+from .numpy_block import _save_array
 
 torch = LazyLoader("torch")
 
@@ -185,10 +187,57 @@ class TorchBlock(AbstractBlock):
         return BlockRef(block=block, columns=columns)
 
     def _write_data(self, path: str):
-        torch.save(self.data, os.path.join(path, "data.pt"))
+        _write_tensor(path, self.data)
+
+    def _checksum(self) -> Optional[str]:
+        try:
+            data = self.data.detach().cpu().numpy()
+        except TypeError:
+            # dtypes without a numpy equivalent (e.g. bfloat16)
+            return None
+        hasher = hashlib.blake2b(type(self).__name__.encode(), digest_size=16)
+        hash_array(hasher, data)
+        return hasher.hexdigest()
 
     @staticmethod
     def _read_data(
         path: str, mmap: bool = False, read_inputs: Dict[str, Column] = None
     ):
+        return _read_tensor(path, mmap=mmap)
+
+
+def _write_tensor(path: str, data: "torch.Tensor"):
+    """Write ``data`` to ``data.npy`` in the directory ``path``, so that it can be
+    memory mapped when it is read.
+
+    Tensors that NumPy cannot hold (e.g. GPU or bfloat16 tensors) are written to
+    ``data.pt`` with :func:`torch.save` instead.
+    """
+    try:
+        array = data.detach().numpy() if data.device.type == "cpu" else None
+    except TypeError:
+        array = None
+
+    npy_path, pt_path = os.path.join(path, "data.npy"), os.path.join(path, "data.pt")
+    # a stale file in the other format would shadow the new one when reading
+    for stale_path in (pt_path, npy_path):
+        if os.path.lexists(stale_path):
+            os.remove(stale_path)
+
+    if array is None:
+        torch.save(data, pt_path)
+    else:
+        _save_array(npy_path, array)
+
+
+def _read_tensor(path: str, mmap: bool = False) -> "torch.Tensor":
+    """Read a tensor written with :func:`_write_tensor`, memory mapping it if
+    ``mmap``."""
+    npy_path = os.path.join(path, "data.npy")
+    if not os.path.exists(npy_path):
+        # written with `torch.save`, possibly by an older version of meerkat
         return torch.load(os.path.join(path, "data.pt"))
+
+    # the file is mapped copy-on-write, so the tensor is writable without the
+    # writes reaching the file
+    return torch.from_numpy(np.load(npy_path, mmap_mode="c" if mmap else None))
@@ -0,0 +1,492 @@
+from __future__ import annotations
+
+import copy
+import heapq
+import math
+from typing import Dict, List, Tuple, Type
+
+import numpy as np
+
+METRICS = ("dot", "cosine", "l2")
+
+
+class VectorIndex:
+    """An index over the rows of a two-dimensional tensor column, used to find
+    the rows most similar to a batch of query vectors.
+
+    Rows are identified by their position, in the order they were added. Scores
+    are similarities, so larger is more similar: the dot product for ``"dot"``, the
+    cosine similarity for ``"cosine"`` and the negative squared euclidean distance
+    for ``"l2"``.
+
+    Subclasses implement ``_add`` and ``_search``, and are registered under their
+    ``kind`` so they can be created with :meth:`VectorIndex.create`.
+
+    Args:
+        metric (str): The similarity metric, one of "dot", "cosine" or "l2".
+            Defaults to "dot".
+    """
+
+    kind: str = None
+    _registry: Dict[str, Type[VectorIndex]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.kind is not None:
+            VectorIndex._registry[cls.kind] = cls
+
+    def __init__(self, metric: str = "dot"):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric `{metric}`, expected one of {METRICS}.")
+        self.metric = metric
+        self._buffer: np.ndarray = None
+        self._size = 0
+
+    @classmethod
+    def create(cls, kind: str = "flat", metric: str = "dot", **kwargs) -> VectorIndex:
+        if kind not in cls._registry:
+            raise ValueError(
+                f"Unknown vector index `{kind}`, expected one of "
+                f"{list(cls._registry)}."
+            )
+        return cls._registry[kind](metric=metric, **kwargs)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The vectors in the index (normalized if the metric is cosine)."""
+        if self._buffer is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._buffer[: self._size]
+
+    def add(self, vectors: np.ndarray):
+        """Add rows to the end of the index."""
+        vectors = self._prepare(vectors)
+        if self._buffer is None:
+            self._buffer = vectors.copy()
+        else:
+            if vectors.shape[1] != self._buffer.shape[1]:
+                raise ValueError(
+                    f"Expected vectors with dimension {self._buffer.shape[1]}, got "
+                    f"{vectors.shape[1]}."
+                )
+            if self._size + len(vectors) > len(self._buffer):
+                # grow geometrically, so that repeated appends are amortized
+                buffer = np.empty(
+                    (max(2 * len(self._buffer), self._size + len(vectors)),)
+                    + self._buffer.shape[1:],
+                    dtype=self._buffer.dtype,
+                )
+                buffer[: self._size] = self.vectors
+                self._buffer = buffer
+            self._buffer[self._size : self._size + len(vectors)] = vectors
+        start = self._size
+        self._size += len(vectors)
+        self._add(vectors, np.arange(start, self._size))
+
+    def search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the ``k`` rows most similar to each of the queries.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The scores and positions of the matches,
+                each of shape ``(len(queries), k)`` and sorted by decreasing score.
+                Approximate indices may find fewer than ``k`` matches, in which case
+                the remaining positions are -1 (with score -inf).
+        """
+        queries = self._prepare(np.atleast_2d(queries))
+        k = min(k, len(self))
+        if k == 0:
+            return (
+                np.zeros((len(queries), 0), dtype=np.float32),
+                np.zeros((len(queries), 0), dtype=np.int64),
+            )
+        return self._search(queries, k)
+
+    def copy(self) -> VectorIndex:
+        return copy.deepcopy(self)
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError(
+                "Vector indices can only be built on two-dimensional data, got "
+                f"data with shape {vectors.shape}."
+            )
+        if self.metric == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+        return vectors
+
+    def _score(self, queries: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        # the vectors and queries are already normalized if the metric is cosine
+        metric = "dot" if self.metric == "cosine" else self.metric
+        return _score(queries, vectors, metric=metric)
+
+    def _add(self, vectors: np.ndarray, positions: np.ndarray):
+        pass
+
+    def _search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        raise NotImplementedError
+
+
+class FlatIndex(VectorIndex):
+    """An exact index, which scans all of the rows in chunks of ``chunk_size``
+    and keeps a running top-k, so memory is bounded for large columns."""
+
+    kind: str = "flat"
+
+    def __init__(self, metric: str = "dot", chunk_size: int = 2**16):
+        super().__init__(metric=metric)
+        self.chunk_size = chunk_size
+
+    def _search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        metric = "dot" if self.metric == "cosine" else self.metric
+        return flat_search(
+            self.vectors, queries, k=k, metric=metric, chunk_size=self.chunk_size
+        )
+
+
+class IVFIndex(VectorIndex):
+    """An inverted file index, which clusters the rows with k-means and only
+    scans the ``num_probes`` clusters whose centroids are most similar to a
+    query.
+
+    The centroids are trained on the first rows added to the index. Rows added
+    later are assigned to the existing centroids.
+
+    Args:
+        num_lists (int): The number of clusters. Defaults to the square root of the
+            number of rows the index is trained on.
+        num_probes (int): The number of clusters scanned per query. Defaults to 8.
+        num_iters (int): The number of k-means iterations. Defaults to 10.
+        seed (int): Seed for the k-means initialization. Defaults to 0.
+    """
+
+    kind: str = "ivf"
+
+    def __init__(
+        self,
+        metric: str = "dot",
+        num_lists: int = None,
+        num_probes: int = 8,
+        num_iters: int = 10,
+        seed: int = 0,
+    ):
+        super().__init__(metric=metric)
+        self.num_lists = num_lists
+        self.num_probes = num_probes
+        self.num_iters = num_iters
+        self.seed = seed
+        self.centroids: np.ndarray = None
+        self._assignments: List[np.ndarray] = []
+        self._lists: Tuple[np.ndarray, np.ndarray] = None
+
+    def _add(self, vectors: np.ndarray, positions: np.ndarray):
+        if len(vectors) == 0:
+            return
+        if self.centroids is None:
+            self.centroids = self._train(vectors)
+        self._assignments.append(self._assign(vectors))
+        self._lists = None
+
+    def _train(self, vectors: np.ndarray) -> np.ndarray:
+        num_lists = self.num_lists or int(math.sqrt(len(vectors)))
+        num_lists = min(max(num_lists, 1), len(vectors))
+
+        rng = np.random.default_rng(self.seed)
+        # train on a sample, which is plenty to place the centroids
+        sample = vectors[
+            rng.choice(len(vectors), min(len(vectors), 256 * num_lists), replace=False)
+        ]
+        centroids = sample[rng.choice(len(sample), num_lists, replace=False)]
+        for _ in range(self.num_iters):
+            assignments = _nearest(sample, centroids)
+            counts = np.bincount(assignments, minlength=num_lists)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            nonempty = counts > 0
+            # empty clusters keep their previous centroid
+            centroids[nonempty] = sums[nonempty] / counts[nonempty, None]
+        return centroids
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.concatenate(
+            [
+                _nearest(vectors[start : start + 2**16], self.centroids)
+                for start in range(0, len(vectors), 2**16)
+            ]
+        )
+
+    def _get_lists(self) -> Tuple[np.ndarray, np.ndarray]:
+        """The positions of the rows grouped by cluster, and the boundaries of
+        each cluster within them."""
+        if self._lists is None:
+            assignments = np.concatenate(self._assignments)
+            order = np.argsort(assignments, kind="stable")
+            bounds = np.searchsorted(
+                assignments[order], np.arange(len(self.centroids) + 1)
+            )
+            self._lists = (order, bounds)
+        return self._lists
+
+    def _search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        order, bounds = self._get_lists()
+        sizes = np.diff(bounds)
+        probe_order = np.argsort(
+            -_score(queries, self.centroids, metric=self.metric), axis=1
+        )
+
+        all_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        all_positions = np.full((len(queries), k), -1, dtype=np.int64)
+        for idx, (query, lists) in enumerate(zip(queries, probe_order)):
+            # probe more lists than `num_probes` if they hold fewer than k rows
+            num_probes = max(
+                self.num_probes,
+                int(np.searchsorted(np.cumsum(sizes[lists]), k)) + 1,
+            )
+            candidates = np.concatenate(
+                [order[bounds[i] : bounds[i + 1]] for i in lists[:num_probes]]
+            )
+            scores, positions = _topk(
+                self._score(query[None], self.vectors[candidates]), candidates, k
+            )
+            all_scores[idx, : scores.shape[1]] = scores[0]
+            all_positions[idx, : positions.shape[1]] = positions[0]
+        return all_scores, all_positions
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # consolidate the assignments, and don't persist the lists, they're rebuilt
+        if len(self._assignments) > 1:
+            state["_assignments"] = [np.concatenate(self._assignments)]
+        state["_lists"] = None
+        return state
+
+
+class HNSWIndex(VectorIndex):
+    """A hierarchical navigable small world graph index.
+
+    Each row is inserted into a stack of proximity graphs and queries are
+    answered with a greedy best-first search from the top of the stack down.
+    Insertion is incremental, so rows can be added at any time. Note that graph
+    construction is implemented in Python and is considerably slower than building
+    a flat or IVF index.
+
+    Args:
+        m (int): The number of neighbors each row is connected to per layer
+            (twice as many in the bottom layer). Defaults to 16.
+        ef_construction (int): The size of the candidate list used while
+            inserting. Defaults to 100.
+        ef_search (int): The size of the candidate list used while searching.
+            Larger values trade speed for recall. Defaults to 64.
+        seed (int): Seed for the random layer assignment. Defaults to 0.
+    """
+
+    kind: str = "hnsw"
+
+    def __init__(
+        self,
+        metric: str = "dot",
+        m: int = 16,
+        ef_construction: int = 100,
+        ef_search: int = 64,
+        seed: int = 0,
+    ):
+        super().__init__(metric=metric)
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self._rng = np.random.default_rng(seed)
+        # neighbors of each node, per layer, layer 0 contains all of the nodes
+        self._graph: List[Dict[int, List[int]]] = []
+        self._entry: int = None
+        self._max_level = -1
+
+    def _add(self, vectors: np.ndarray, positions: np.ndarray):
+        for position in positions:
+            self._insert(int(position))
+
+    def _insert(self, node: int):
+        level = int(-math.log(1 - self._rng.random()) / math.log(self.m))
+        while len(self._graph) <= level:
+            self._graph.append({})
+        for layer in range(level + 1):
+            self._graph[layer][node] = []
+
+        if self._entry is None:
+            self._entry, self._max_level = node, level
+            return
+
+        query = self.vectors[node]
+        entry = [self._entry]
+        for layer in range(self._max_level, level, -1):
+            entry = [self._search_layer(query, entry, ef=1, layer=layer)[0][1]]
+
+        for layer in range(min(level, self._max_level), -1, -1):
+            candidates = self._search_layer(
+                query, entry, ef=self.ef_construction, layer=layer
+            )
+            neighbors = self._select_neighbors(candidates, self.m)
+            self._graph[layer][node] = neighbors
+
+            max_neighbors = 2 * self.m if layer == 0 else self.m
+            for neighbor in neighbors:
+                connections = self._graph[layer][neighbor]
+                connections.append(node)
+                if len(connections) > max_neighbors:
+                    scores = self._node_scores(self.vectors[neighbor], connections)
+                    order = np.argsort(-scores, kind="stable")
+                    self._graph[layer][neighbor] = self._select_neighbors(
+                        [(scores[i], connections[i]) for i in order], max_neighbors
+                    )
+            entry = [candidate for _, candidate in candidates]
+
+        if level > self._max_level:
+            self._entry, self._max_level = node, level
+
+    def _select_neighbors(
+        self, candidates: List[Tuple[float, int]], m: int
+    ) -> List[int]:
+        """Select up to ``m`` neighbors from ``candidates`` (sorted by decreasing
+        similarity to the node being connected).
+
+        A candidate is preferred if it is more similar to the node than to any
+        neighbor selected so far, which keeps edges between clusters of similar
+        rows (the heuristic of Malkov & Yashunin). Remaining slots are filled with
+        the most similar of the other candidates.
+        """
+        selected, pruned = [], []
+        for score, candidate in candidates:
+            if len(selected) >= m:
+                break
+            if len(selected) == 0 or score > np.max(
+                self._node_scores(self.vectors[candidate], selected)
+            ):
+                selected.append(candidate)
+            else:
+                pruned.append(candidate)
+        return selected + pruned[: m - len(selected)]
+
+    def _node_scores(self, query: np.ndarray, nodes: List[int]) -> np.ndarray:
+        return self._score(query[None], self.vectors[nodes])[0]
+
+    def _search_layer(
+        self, query: np.ndarray, entry: List[int], ef: int, layer: int
+    ) -> List[Tuple[float, int]]:
+        """Best-first search of one layer of the graph, returns the ``ef`` most
+        similar nodes found as (score, node) tuples, most similar first."""
+        visited = set(entry)
+        scores = self._node_scores(query, entry)
+        # a max-heap of nodes to expand, and a min-heap of the best nodes found
+        candidates = [(-score, node) for score, node in zip(scores, entry)]
+        heapq.heapify(candidates)
+        results = [(score, node) for score, node in zip(scores, entry)]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        graph = self._graph[layer]
+        while candidates:
+            neg_score, node = heapq.heappop(candidates)
+            if len(results) >= ef and -neg_score < results[0][0]:
+                break
+            neighbors = [n for n in graph[node] if n not in visited]
+            if len(neighbors) == 0:
+                continue
+            visited.update(neighbors)
+            for score, neighbor in zip(self._node_scores(query, neighbors), neighbors):
+                if len(results) < ef or score > results[0][0]:
+                    heapq.heappush(candidates, (-score, neighbor))
+                    heapq.heappush(results, (score, neighbor))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+        return sorted(results, reverse=True)
+
+    def _search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        all_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        all_positions = np.full((len(queries), k), -1, dtype=np.int64)
+        for idx, query in enumerate(queries):
+            entry = [self._entry]
+            for layer in range(self._max_level, 0, -1):
+                entry = [self._search_layer(query, entry, ef=1, layer=layer)[0][1]]
+            results = self._search_layer(
+                query, entry, ef=max(self.ef_search, k), layer=0
+            )[:k]
+            all_scores[idx, : len(results)] = [score for score, _ in results]
+            all_positions[idx, : len(results)] = [node for _, node in results]
+        return all_scores, all_positions
+
+
+def flat_search(
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    k: int,
+    metric: str = "dot",
+    chunk_size: int = 2**16,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Exhaustively find the ``k`` rows of ``vectors`` most similar to each of
+    the ``queries``, scanning ``chunk_size`` rows at a time."""
+    queries = np.atleast_2d(queries)
+    k = min(k, len(vectors))
+    scores = np.zeros((len(queries), 0), dtype=np.float32)
+    positions = np.zeros((len(queries), 0), dtype=np.int64)
+    for start in range(0, len(vectors), chunk_size):
+        chunk = vectors[start : start + chunk_size]
+        chunk_scores, chunk_positions = _topk(
+            _score(queries, chunk, metric=metric),
+            np.arange(start, start + len(chunk)),
+            k,
+        )
+        # merge the top-k of the chunk with the running top-k
+        scores, positions = _topk(
+            np.concatenate([scores, chunk_scores], axis=1),
+            np.concatenate([positions, chunk_positions], axis=1),
+            k,
+        )
+    return scores, positions
+
+
+def _score(queries: np.ndarray, vectors: np.ndarray, metric: str) -> np.ndarray:
+    if metric == "cosine":
+        queries = queries / np.maximum(
+            np.linalg.norm(queries, axis=1, keepdims=True), 1e-12
+        )
+        vectors = vectors / np.maximum(
+            np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12
+        )
+    scores = queries @ vectors.T
+    if metric == "l2":
+        # -|q - v|^2 = 2 q.v - |v|^2 - |q|^2
+        scores = (
+            2 * scores
+            - (vectors**2).sum(axis=1)[None, :]
+            - (queries**2).sum(axis=1)[:, None]
+        )
+    return scores
+
+
+def _topk(
+    scores: np.ndarray, positions: np.ndarray, k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Select the top ``k`` scores in each row of ``scores``, sorted by
+    decreasing score, along with their ``positions`` (either one position per
+    column of ``scores``, or one per score)."""
+    k = min(k, scores.shape[1])
+    if positions.ndim == 1:
+        positions = np.broadcast_to(positions, scores.shape)
+    if k == 0:
+        return scores[:, :0], positions[:, :0]
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    top = np.take_along_axis(top, order, axis=1)
+    return (
+        np.take_along_axis(scores, top, axis=1),
+        np.take_along_axis(positions, top, axis=1),
+    )
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    return np.argmax(_score(vectors, centroids, metric="l2"), axis=1)
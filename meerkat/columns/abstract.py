@@ -43,6 +43,7 @@ from meerkat.tools.utils import convert_to_batch_column_fn, translate_index
 if TYPE_CHECKING:
     import torch
 
+    from meerkat.block.key_index import KeyIndex
     from meerkat.interactive.formatter.base import FormatterGroup
 
 torch = LazyLoader("torch")  # noqa: F811
@@ -69,6 +70,9 @@ class Column(
 
     _data: Sequence = None
 
+    # incremented whenever cells are set, see `meerkat.ops.view_cache`
+    _version: int = 0
+
     # Path to a log directory
     logdir: pathlib.Path = pathlib.Path.home() / "meerkat/"
 
@@ -157,9 +161,27 @@ class Column(
             keyidxs: The keyidxs to search for.
 
         Returns:
-            The posidxs of the given keyidxs.
+            The posidxs of the given keyidxs, in the order of the keyidxs.
         """
-        raise NotImplementedError()
+        return self._get_key_index().get_locs(keyidxs)
+
+    def _get_key_index(self) -> "KeyIndex":
+        """Get a hash index mapping the values in the column to their posidxs.
+
+        The index is built on first use and cached on the column's block, so it
+        is reused by all views that share the block. It is invalidated when the
+        column is mutated with ``__setitem__``.
+        """
+        from meerkat.block.key_index import KeyIndex
+
+        if not self.is_blockable():
+            return KeyIndex.from_column(self)
+
+        key_index = self._block._get_key_index(self._block_index)
+        if key_index is None:
+            key_index = KeyIndex.from_column(self)
+            self._block._set_key_index(self._block_index, key_index)
+        return key_index
 
     @property
     def data(self):
@@ -245,6 +267,10 @@ class Column(
         else:
             raise ValueError
 
+        self._version += 1
+        if self.is_blockable():
+            self._block._mark_mutated()
+
     def __setitem__(self, index, value):
         self._set(index, value)
 
@@ -543,8 +569,8 @@ class Column(
             batches of data
         """
         if (
-            self._get_batch.__func__ == Column._get_batch
-            and self._get.__func__ == Column._get
+            type(self)._get_batch == Column._get_batch
+            and type(self)._get == Column._get
         ):
             return torch.utils.data.DataLoader(
                 self.mz if materialize else self,
@@ -11,6 +11,7 @@ import yaml
 
 from meerkat.block.abstract import BlockView
 from meerkat.block.deferred_block import DeferredBlock, DeferredCellOp, DeferredOp
+from meerkat.block.result_cache import ResultCache
 from meerkat.cells.abstract import AbstractCell
 from meerkat.columns.abstract import Column
 from meerkat.errors import ConcatWarning, ImmutableError
@@ -65,6 +66,9 @@ class DeferredColumn(Column):
         num_blocks: int = None,
         blocks_per_window: int = None,
         batch_size: int = 1,
+        executor: str = None,
+        num_workers: int = None,
+        num_threads: int = None,
     ):
         from meerkat.ops.map import _materialize
 
@@ -75,11 +79,55 @@ class DeferredColumn(Column):
             num_blocks=num_blocks,
             blocks_per_window=blocks_per_window,
             batch_size=batch_size,
+            executor=executor,
+            num_workers=num_workers,
+            num_threads=num_threads,
         )
 
     def _set(self, index, value):
         raise ImmutableError("LambdaColumn is immutable.")
 
+    def enable_cache(
+        self,
+        max_bytes: int = 2**30,
+        spill_dir: str = None,
+        cache: ResultCache = None,
+    ) -> ResultCache:
+        """Cache the outputs of the column's function, so that materializing
+        the same rows again does not recompute them.
+
+        The cache is keyed by the function, the ids and versions of its input
+        columns and the row, so outputs are recomputed after an input is mutated in
+        place. It is shared with the views of this column (e.g. ``col[10:20]``)
+        created after it is enabled. It is also shared by the other columns computed
+        by the same call to the function (e.g. the columns of a DataFrame returned by
+        :func:`~meerkat.defer`) when they are materialized together. The cache is not
+        written to disk with the column.
+
+        Args:
+            max_bytes (int): The maximum number of bytes of outputs to hold in
+                memory. Defaults to 1 GiB.
+            spill_dir (str, optional): A directory to write outputs evicted from
+                memory to. Defaults to None, in which case evicted outputs are
+                recomputed when they are next needed.
+            cache (ResultCache, optional): An existing cache to use, e.g. one shared
+                with other columns. If passed, ``max_bytes`` and ``spill_dir`` are
+                ignored.
+
+        Returns:
+            ResultCache: The cache.
+        """
+        if cache is None:
+            cache = ResultCache(max_bytes=max_bytes, spill_dir=spill_dir)
+        self._block.data.enable_cache(cache)
+        self._data = self._block._get_data(self._block_index)
+        return cache
+
+    def disable_cache(self):
+        """Stop caching the outputs of the column's function."""
+        self._block.data.disable_cache()
+        self._data = self._block._get_data(self._block_index)
+
     @property
     def fn(self) -> Callable:
         """Subclasses like `ImageColumn` should be able to implement their own
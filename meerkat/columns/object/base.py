@@ -50,6 +50,14 @@ class ObjectColumn(Column):
             else:
                 yield self[i : i + batch_size]
 
+    @classmethod
+    def get_writer(cls, mmap: bool = False, template: Column = None):
+        if mmap:
+            from meerkat.writers.object_writer import ObjectStoreWriter
+
+            return ObjectStoreWriter()
+        return super().get_writer(mmap=mmap, template=template)
+
     @classmethod
     def concat(cls, columns: Sequence[ObjectColumn]):
         data = list(tz.concat([c.data for c in columns]))
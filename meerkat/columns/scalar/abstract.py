@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Any, List, Set, Tuple, Union
 
@@ -12,6 +13,7 @@ from meerkat.block.abstract import BlockView
 from meerkat.block.arrow_block import ArrowBlock
 from meerkat.block.pandas_block import PandasBlock
 from meerkat.columns.tensor.abstract import TensorColumn
+from meerkat.ops.expression import Expression, is_lazy
 from meerkat.tools.lazy_loader import LazyLoader
 
 from ..abstract import Column
@@ -26,6 +28,22 @@ if TYPE_CHECKING:
 ScalarColumnTypes = Union[np.ndarray, "torch.TensorType", pd.Series, List]
 
 
+def _lazy_operator(ufunc: np.ufunc, right: bool = False):
+    """Make an operator build a lazy :class:`~meerkat.ops.expression.Expression`
+    inside a :class:`~meerkat.lazy` context or when applied to an expression."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args):
+            if is_lazy(self, *args):
+                return Expression(ufunc, (*args, self) if right else (self, *args))
+            return fn(self, *args)
+
+        return wrapper
+
+    return decorator
+
+
 class StringMethods:
     def __init__(self, data: Column):
         self.column = data
@@ -195,6 +213,14 @@ class ScalarColumn(Column):
                 f"Cannot create `ScalarColumn` from object of type {type(data)}."
             )
 
+    @classmethod
+    def get_writer(cls, mmap: bool = False, template: Column = None):
+        if mmap:
+            from meerkat.writers.arrow_writer import ArrowIPCWriter
+
+            return ArrowIPCWriter(template=template)
+        return super().get_writer(mmap=mmap, template=template)
+
     def _dispatch_unary_function(
         self, compute_fn: str, _namespace: str = None, **kwargs
     ):
@@ -251,45 +277,59 @@ class ScalarColumn(Column):
     ):
         raise NotImplementedError()
 
+    @_lazy_operator(np.add)
     def __add__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "add", right=False)
 
+    @_lazy_operator(np.add, right=True)
     def __radd__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "add", right=True)
 
+    @_lazy_operator(np.subtract)
     def __sub__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "sub", right=False)
 
+    @_lazy_operator(np.subtract, right=True)
     def __rsub__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "sub", right=True)
 
+    @_lazy_operator(np.multiply)
     def __mul__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "mul", right=False)
 
+    @_lazy_operator(np.multiply, right=True)
     def __rmul__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "mul", right=True)
 
+    @_lazy_operator(np.true_divide)
     def __truediv__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "truediv", right=False)
 
+    @_lazy_operator(np.true_divide, right=True)
     def __rtruediv__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "truediv", right=True)
 
+    @_lazy_operator(np.floor_divide)
     def __floordiv__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "floordiv", right=False)
 
+    @_lazy_operator(np.floor_divide, right=True)
     def __rfloordiv__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "floordiv", right=True)
 
+    @_lazy_operator(np.remainder)
     def __mod__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "mod", right=False)
 
+    @_lazy_operator(np.remainder, right=True)
     def __rmod__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "mod", right=True)
 
+    @_lazy_operator(np.power)
     def __pow__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "pow", right=False)
 
+    @_lazy_operator(np.power, right=True)
     def __rpow__(self, other: ScalarColumn):
         return self._dispatch_arithmetic_function(other, "pow", right=True)
 
@@ -297,21 +337,27 @@ class ScalarColumn(Column):
     def _dispatch_comparison_function(self, other, compute_fn: str, **kwargs):
         raise NotImplementedError()
 
+    @_lazy_operator(np.equal)
     def __eq__(self, other: ScalarColumn):
         return self._dispatch_comparison_function(other, "eq")
 
+    @_lazy_operator(np.not_equal)
     def __ne__(self, other: ScalarColumn):
         return self._dispatch_comparison_function(other, "ne")
 
+    @_lazy_operator(np.less)
     def __lt__(self, other: ScalarColumn):
         return self._dispatch_comparison_function(other, "lt")
 
+    @_lazy_operator(np.less_equal)
     def __le__(self, other: ScalarColumn):
         return self._dispatch_comparison_function(other, "le")
 
+    @_lazy_operator(np.greater)
     def __gt__(self, other: ScalarColumn):
         return self._dispatch_comparison_function(other, "gt")
 
+    @_lazy_operator(np.greater_equal)
     def __ge__(self, other: ScalarColumn):
         return self._dispatch_comparison_function(other, "ge")
 
@@ -319,15 +365,19 @@ class ScalarColumn(Column):
     def _dispatch_logical_function(self, other, compute_fn: str, **kwargs):
         raise NotImplementedError()
 
+    @_lazy_operator(np.bitwise_and)
     def __and__(self, other: ScalarColumn):
         return self._dispatch_logical_function(other, "and")
 
+    @_lazy_operator(np.bitwise_or)
     def __or__(self, other: ScalarColumn):
         return self._dispatch_logical_function(other, "or")
 
+    @_lazy_operator(np.invert)
     def __invert__(self):
         return self._dispatch_logical_function(None, "invert")
 
+    @_lazy_operator(np.bitwise_xor)
     def __xor__(self, other: ScalarColumn):
         return self._dispatch_logical_function(other, "xor")
 
@@ -16,7 +16,7 @@ from meerkat.errors import ImmutableError
 from meerkat.tools.lazy_loader import LazyLoader
 
 from ..abstract import Column
-from .abstract import ScalarColumn, StringMethods
+from .abstract import ScalarColumn, StringMethods, _lazy_operator
 
 if TYPE_CHECKING:
     from meerkat import DataFrame
@@ -186,7 +186,7 @@ class ArrowScalarColumn(ScalarColumn):
         elif index.dtype == bool:
             data = self._data.filter(pa.array(index))
         else:
-            data = self._data.take(index)
+            data = ArrowBlock._take(self._data, index)
 
         if self._is_batch_index(index):
             return self._clone(data=data)
@@ -220,10 +220,6 @@ class ArrowScalarColumn(ScalarColumn):
             raise KeyError(f"keyidx {keyidx} not found in column.")
         return posidx.as_py()
 
-    def _keyidxs_to_posidxs(self, keyidxs: Sequence[Any]) -> np.ndarray:
-        # FIXME: this implementation is very slow. This should be done with indices
-        return np.array([self._keyidx_to_posidx(keyidx) for keyidx in keyidxs])
-
     def _repr_cell(self, index) -> object:
         return self.data[index]
 
@@ -395,6 +391,7 @@ class ArrowScalarColumn(ScalarColumn):
         else:
             return self._clone(pc.divide(self.data, other), **kwargs)
 
+    @_lazy_operator(np.add)
     def __add__(self, other: ScalarColumn):
         if self.dtype == pa.string():
             # pyarrow expects a final str used as the spearator
@@ -404,6 +401,7 @@ class ArrowScalarColumn(ScalarColumn):
 
         return self._dispatch_arithmetic_function(other, "add", right=False)
 
+    @_lazy_operator(np.add, right=True)
     def __radd__(self, other: ScalarColumn):
         if self.dtype == pa.string():
             return self._dispatch_arithmetic_function(
@@ -412,9 +410,11 @@ class ArrowScalarColumn(ScalarColumn):
 
         return self._dispatch_arithmetic_function(other, "add", right=False)
 
+    @_lazy_operator(np.true_divide)
     def __truediv__(self, other: ScalarColumn):
         return self._true_div(other, right=False)
 
+    @_lazy_operator(np.true_divide, right=True)
     def __rtruediv__(self, other: ScalarColumn):
         return self._true_div(other, right=True)
 
@@ -422,15 +422,19 @@ class ArrowScalarColumn(ScalarColumn):
         _true_div = self._true_div(other, right=right, **kwargs)
         return _true_div._clone(data=pc.floor(_true_div.data))
 
+    @_lazy_operator(np.floor_divide)
     def __floordiv__(self, other: ScalarColumn):
         return self._floor_div(other, right=False)
 
+    @_lazy_operator(np.floor_divide, right=True)
     def __rfloordiv__(self, other: ScalarColumn):
         return self._floor_div(other, right=True)
 
+    @_lazy_operator(np.remainder)
     def __mod__(self, other: ScalarColumn):
         raise NotImplementedError("Modulo is not supported by Arrow backend.")
 
+    @_lazy_operator(np.remainder, right=True)
     def __rmod__(self, other: ScalarColumn):
         raise NotImplementedError("Modulo is not supported by Arrow backend.")
 
@@ -5,11 +5,12 @@ import functools
 import logging
 import numbers
 import os
-from typing import TYPE_CHECKING, Any, Callable, List, Sequence, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.core.accessor import CachedAccessor
 from pandas.core.arrays.categorical import CategoricalAccessor
 from pandas.core.dtypes.common import (
@@ -33,6 +34,7 @@ from meerkat.block.pandas_block import PandasBlock
 from meerkat.columns.abstract import Column
 from meerkat.interactive.formatter.base import BaseFormatter
 from meerkat.mixins.aggregate import AggregationError
+from meerkat.ops.expression import Expression, is_lazy
 from meerkat.tools.lazy_loader import LazyLoader
 
 from .abstract import ScalarColumn, StringMethods
@@ -95,6 +97,167 @@ class _ReturnColumnMixin:
 
 
 class PandasStringMethods(StringMethods):
+    """String methods of a :class:`PandasScalarColumn`.
+
+    pandas implements string methods on object Series with a Python loop over the
+    elements. When a column holds only strings, the methods below are instead
+    computed with Arrow compute kernels on an Arrow copy of the column, which is
+    built once and reused until the column is modified. As with pandas' Arrow-backed
+    string dtype, regular expressions are then matched with RE2. Columns with
+    missing or non-string values, and arguments the kernels don't support, fall
+    back to pandas.
+    """
+
+    def __init__(self, data: Column):
+        super().__init__(data)
+        self._arrow = None
+
+    def _to_arrow(self) -> Tuple[Union[pa.Array, None], bool]:
+        """The column as an Arrow string array, or None if it holds anything other
+        than strings, and whether all of the strings are ASCII."""
+        data = self.column.data
+        block = getattr(self.column, "_block", None)
+        version = (self.column._version, None if block is None else block._version)
+        if (
+            self._arrow is not None
+            and self._arrow[0] is data
+            and self._arrow[1] == version
+        ):
+            return self._arrow[2:]
+
+        array, is_ascii = None, False
+        if data.dtype == object:
+            try:
+                array = pa.array(data, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                pass
+            if array is not None and (
+                not pa.types.is_string(array.type) or array.null_count > 0
+            ):
+                array = None
+            if array is not None:
+                is_ascii = pc.all(pc.string_is_ascii(array)).as_py() is not False
+        # keep a reference to `data`, so its id is not reused while cached
+        self._arrow = (data, version, array, is_ascii)
+        return array, is_ascii
+
+    def _dispatch_arrow(
+        self,
+        compute_fn: str,
+        fallback: Callable,
+        kwargs: dict,
+        ascii_only: bool = False,
+        **compute_kwargs,
+    ) -> ScalarColumn:
+        array, is_ascii = (None, False) if kwargs else self._to_arrow()
+        if array is None or (ascii_only and not is_ascii):
+            # Python and Arrow only agree on the case mappings and regex character
+            # classes of ASCII characters
+            return fallback(**kwargs)
+        try:
+            out = getattr(pc, compute_fn)(array, **compute_kwargs)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # e.g. a regex that RE2 does not support
+            return fallback(**kwargs)
+
+        if pa.types.is_integer(out.type):
+            # pandas returns lengths as int64
+            out = out.cast(pa.int64())
+        data = self.column.data
+        return self.column._clone(
+            data=pd.Series(
+                out.to_numpy(zero_copy_only=False), index=data.index, name=data.name
+            )
+        )
+
+    def len(self, **kwargs) -> ScalarColumn:
+        return self._dispatch_arrow("utf8_length", super().len, kwargs)
+
+    def isalnum(self, **kwargs) -> ScalarColumn:
+        return self._dispatch_arrow("utf8_is_alnum", super().isalnum, kwargs)
+
+    def isalpha(self, **kwargs) -> ScalarColumn:
+        return self._dispatch_arrow("utf8_is_alpha", super().isalpha, kwargs)
+
+    def islower(self, **kwargs) -> ScalarColumn:
+        return self._dispatch_arrow("utf8_is_lower", super().islower, kwargs)
+
+    def isupper(self, **kwargs) -> ScalarColumn:
+        return self._dispatch_arrow("utf8_is_upper", super().isupper, kwargs)
+
+    def isspace(self, **kwargs) -> ScalarColumn:
+        return self._dispatch_arrow("utf8_is_space", super().isspace, kwargs)
+
+    def lower(self, **kwargs) -> ScalarColumn:
+        return self._dispatch_arrow(
+            "ascii_lower", super().lower, kwargs, ascii_only=True
+        )
+
+    def upper(self, **kwargs) -> ScalarColumn:
+        return self._dispatch_arrow(
+            "ascii_upper", super().upper, kwargs, ascii_only=True
+        )
+
+    def strip(self, to_strip: str = None, **kwargs) -> ScalarColumn:
+        return self._strip("utf8_trim", super().strip, to_strip, kwargs)
+
+    def lstrip(self, to_strip: str = None, **kwargs) -> ScalarColumn:
+        return self._strip("utf8_ltrim", super().lstrip, to_strip, kwargs)
+
+    def rstrip(self, to_strip: str = None, **kwargs) -> ScalarColumn:
+        return self._strip("utf8_rtrim", super().rstrip, to_strip, kwargs)
+
+    def _strip(
+        self, compute_fn: str, fallback: Callable, to_strip: str, kwargs: dict
+    ) -> ScalarColumn:
+        fallback = functools.partial(fallback, to_strip=to_strip)
+        if to_strip is None:
+            return self._dispatch_arrow(f"{compute_fn}_whitespace", fallback, kwargs)
+        return self._dispatch_arrow(compute_fn, fallback, kwargs, characters=to_strip)
+
+    def startswith(self, pat: str, **kwargs) -> ScalarColumn:
+        if not isinstance(pat, str):
+            return super().startswith(pat, **kwargs)
+        return self._dispatch_arrow(
+            "starts_with",
+            functools.partial(super().startswith, pat),
+            kwargs,
+            pattern=pat,
+        )
+
+    def contains(self, pat: str, case: bool = True, regex: bool = True) -> ScalarColumn:
+        fallback = functools.partial(super().contains, pat, case=case, regex=regex)
+        if regex and not _is_literal(pat):
+            # RE2 differs from Python's re, e.g. "$" does not match before a
+            # trailing newline
+            return fallback()
+        return self._dispatch_arrow(
+            "match_substring",
+            fallback,
+            {},
+            ascii_only=not case,
+            pattern=pat,
+            ignore_case=not case,
+        )
+
+    def replace(
+        self, pat: str, repl: str, n: int = -1, regex: bool = False, **kwargs
+    ) -> ScalarColumn:
+        if not (isinstance(pat, str) and isinstance(repl, str)) or (
+            regex and not (_is_literal(pat) and "\\" not in repl)
+        ):
+            # RE2 differs from Python's re, e.g. in how it matches anchors and
+            # spells group references
+            return super().replace(pat, repl, n=n, regex=regex, **kwargs)
+        return self._dispatch_arrow(
+            "replace_substring",
+            functools.partial(super().replace, pat, repl, n=n, regex=regex),
+            kwargs,
+            pattern=pat,
+            replacement=repl,
+            max_replacements=None if n == -1 else n,
+        )
+
     def split(
         self, pat: str = None, n: int = -1, regex: bool = False, **kwargs
     ) -> "DataFrame":
@@ -139,6 +302,15 @@ class PandasStringMethods(StringMethods):
         )
 
 
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _is_literal(pat: Any) -> bool:
+    """Whether the regex ``pat`` only matches itself, so that it can be matched
+    as a plain substring."""
+    return isinstance(pat, str) and pat != "" and not _REGEX_SPECIAL_CHARS & set(pat)
+
+
 class _MeerkatDatetimeProperties(_ReturnColumnMixin, DatetimeProperties):
     pass
 
@@ -227,6 +399,9 @@ class PandasScalarColumn(
         super(PandasScalarColumn, self)._set_data(data)
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method == "__call__" and not kwargs and is_lazy(*inputs):
+            return Expression(ufunc, inputs)
+
         out = kwargs.get("out", ())
         for x in inputs + out:
             # Only support operations with instances of _HANDLED_TYPES.
@@ -354,10 +529,6 @@ class PandasScalarColumn(
         posidx = where_result[0][0]
         return int(posidx)
 
-    def _keyidxs_to_posidxs(self, keyidxs: Sequence[Any]) -> np.ndarray:
-        # FIXME: this implementation is very slow. This should be done with indices
-        return np.array([self._keyidx_to_posidx(keyidx) for keyidx in keyidxs])
-
     def sort(
         self, ascending: Union[bool, List[bool]] = True, kind: str = "quicksort"
     ) -> PandasScalarColumn:
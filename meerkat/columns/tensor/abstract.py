@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, List, Sequence, Union
 
 import numpy as np
 
@@ -14,6 +14,8 @@ torch = LazyLoader("torch")
 if TYPE_CHECKING:
     from torch import TensorType
 
+    from meerkat.block.vector_index import VectorIndex
+
     TensorColumnTypes = Union[np.ndarray, TensorType]
 
 
@@ -67,6 +69,52 @@ class TensorColumn(Column):
                 f"Cannot create `TensorColumn` from object of type {type(data)}."
             )
 
+    def create_vector_index(
+        self, kind: str = "flat", metric: str = "dot", **kwargs
+    ) -> "VectorIndex":
+        """Build an index over the rows of a two-dimensional column, which
+        :func:`~meerkat.search` uses to find the rows most similar to a query.
+
+        The index is stored on the column's block, so it is shared by all views of
+        the block and is written and read along with the DataFrame. When the column
+        is concatenated with other columns (e.g. ``mk.concat``), the index is
+        extended with their rows. It is dropped if the column is mutated.
+
+        Args:
+            kind (str): The kind of index: "flat" (exact), "ivf" or "hnsw" (both
+                approximate). Defaults to "flat".
+            metric (str): The similarity metric, one of "dot", "cosine" or "l2".
+                Defaults to "dot".
+            **kwargs: Passed to the index, see
+                :class:`~meerkat.block.vector_index.IVFIndex` and
+                :class:`~meerkat.block.vector_index.HNSWIndex`.
+
+        Returns:
+            VectorIndex: The index.
+        """
+        from meerkat.block.vector_index import VectorIndex
+
+        index = VectorIndex.create(kind=kind, metric=metric, **kwargs)
+        index.add(self.to_numpy())
+        self._block._set_vector_index(self._block_index, index)
+        return index
+
+    @property
+    def vector_index(self) -> "VectorIndex":
+        """The index built with :meth:`create_vector_index`, or None."""
+        return self._block._get_vector_index(self._block_index)
+
+    @staticmethod
+    def _concat_vector_index(columns: Sequence["TensorColumn"], out: "TensorColumn"):
+        # extend the vector index of the first column with the rows of the others
+        index = columns[0].vector_index
+        if index is None:
+            return
+        index = index.copy()
+        for column in columns[1:]:
+            index.add(column.to_numpy())
+        out._block._set_vector_index(out._block_index, index)
+
     # def _get_default_formatters(self):
     #     from meerkat.interactive.formatter import TensorFormatterGroup
 
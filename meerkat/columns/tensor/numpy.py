@@ -19,6 +19,7 @@ from meerkat.block.abstract import BlockView
 from meerkat.block.numpy_block import NumPyBlock
 from meerkat.columns.abstract import Column
 from meerkat.mixins.aggregate import AggregationError
+from meerkat.ops.expression import Expression, is_lazy
 from meerkat.tools.lazy_loader import LazyLoader
 from meerkat.writers.concat_writer import ConcatWriter
 
@@ -77,6 +78,9 @@ class NumPyTensorColumn(
     _HANDLED_TYPES = (np.ndarray, numbers.Number)
 
     def __array_ufunc__(self, ufunc: np.ufunc, method, *inputs, **kwargs):
+        if method == "__call__" and not kwargs and is_lazy(*inputs):
+            return Expression(ufunc, inputs)
+
         out = kwargs.get("out", ())
         for x in inputs + out:
             # Only support operations with instances of _HANDLED_TYPES.
@@ -183,7 +187,9 @@ class NumPyTensorColumn(
     @classmethod
     def concat(cls, columns: Sequence[NumPyTensorColumn]):
         data = np.concatenate([c.data for c in columns])
-        return columns[0]._clone(data=data)
+        out = columns[0]._clone(data=data)
+        cls._concat_vector_index(columns, out)
+        return out
 
     def is_equal(self, other: Column) -> bool:
         if other.__class__ != self.__class__:
@@ -195,7 +201,7 @@ class NumPyTensorColumn(
         if mmap:
             from meerkat.writers.numpy_writer import NumpyMemmapWriter
 
-            return NumpyMemmapWriter()
+            return NumpyMemmapWriter(template=template)
         else:
             return ConcatWriter(template=template, output_type=NumPyTensorColumn)
 
@@ -249,15 +255,6 @@ class NumPyTensorColumn(
         posidx = where_result[0][0]
         return int(posidx)
 
-    def _keyidxs_to_posidxs(self, keyidxs: Sequence[Any]) -> np.ndarray:
-        posidxs = np.where(np.isin(self.data, keyidxs))[0]
-
-        diff = np.setdiff1d(keyidxs, self.data[posidxs])
-        if len(diff) > 0:
-            raise KeyError(f"Key indexes {diff} not found in column.")
-
-        return posidxs
-
     def sort(
         self,
         ascending: Union[bool, List[bool]] = True,
@@ -3,7 +3,6 @@ from __future__ import annotations
 import abc
 import functools
 import logging
-import os
 from typing import TYPE_CHECKING, Callable, List, Mapping, Sequence, Tuple, Union
 
 import numpy as np
@@ -12,7 +11,7 @@ import pyarrow as pa
 from yaml.representer import Representer
 
 from meerkat.block.abstract import BlockView
-from meerkat.block.torch_block import TorchBlock
+from meerkat.block.torch_block import TorchBlock, _read_tensor, _write_tensor
 from meerkat.mixins.cloneable import CloneableMixin
 from meerkat.tools.lazy_loader import LazyLoader
 from meerkat.writers.concat_writer import ConcatWriter
@@ -154,13 +153,15 @@ class TorchTensorColumn(
     def concat(cls, columns: Sequence[TorchTensorColumn]):
         data = torch.cat([c.data for c in columns])
         if issubclass(cls, CloneableMixin):
-            return columns[0]._clone(data=data)
+            out = columns[0]._clone(data=data)
+            cls._concat_vector_index(columns, out)
+            return out
         return cls(data)
 
     @classmethod
     def get_writer(cls, mmap: bool = False, template: Column = None):
         if mmap:
-            return NumpyMemmapWriter()
+            return NumpyMemmapWriter(output_type=TorchTensorColumn, template=template)
         else:
             return ConcatWriter(template=template, output_type=TorchTensorColumn)
 
@@ -206,12 +207,11 @@ class TorchTensorColumn(
         return self._data
 
     def _write_data(self, path: str) -> None:
-        # Saving all cell data in a single pickle file
-        torch.save(self.data, os.path.join(path, "data.pt"))
+        _write_tensor(path, self.data)
 
     @staticmethod
-    def _read_data(path: str) -> "torch.Tensor":
-        return torch.load(os.path.join(path, "data.pt"))
+    def _read_data(path: str, mmap: bool = False, *args, **kwargs) -> "torch.Tensor":
+        return _read_tensor(path, mmap=mmap)
 
     def sort(
         self, ascending: Union[bool, List[bool]] = True, kind: str = "quicksort"
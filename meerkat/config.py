@@ -48,12 +48,25 @@ class DisplayConfig:
 
     show_audio: bool = True
 
+    # encoded image thumbnails served to the GUI are cached in memory, up to
+    # `thumbnail_cache_bytes`, and those of images read from files are optionally
+    # persisted to `thumbnail_cache_dir`, up to `thumbnail_cache_disk_bytes`
+    thumbnail_cache_bytes: int = 2**28
+    thumbnail_cache_dir: str = None
+    thumbnail_cache_disk_bytes: int = 2**32
+    thumbnail_threads: int = None
+
 
 @dataclass
 class SystemConfig:
     use_gpu: bool = True
     ssh_identity_file: str = os.path.join(Path.home(), ".meerkat/ssh/id_rsa")
 
+    # embeddings computed by `mk.embed` are cached on disk in
+    # `embedding_cache_dir`, up to `embedding_cache_bytes`, if it is set
+    embedding_cache_dir: str = None
+    embedding_cache_bytes: int = 2**34
+
 
 class DatasetsConfig:
     def __init__(self, root_dir: str = None):
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import numbers
 import os
 import pathlib
 import shutil
@@ -13,6 +14,7 @@ from typing import (
     Collection,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -29,6 +31,7 @@ import numpy as np
 import pandas as pd
 import pyarrow as pa
 from pandas._libs import lib
+from tqdm import tqdm
 
 import meerkat
 from meerkat.block.manager import BlockManager
@@ -47,6 +50,7 @@ from meerkat.mixins.identifiable import IdentifiableMixin
 from meerkat.mixins.indexing import IndexerMixin, MaterializationMixin
 from meerkat.mixins.inspect_fn import FunctionInspectorMixin
 from meerkat.mixins.reactifiable import ReactifiableMixin
+from meerkat.ops.expression import Expression
 from meerkat.provenance import ProvenanceMixin
 from meerkat.row import Row
 from meerkat.tools.lazy_loader import LazyLoader
@@ -65,11 +69,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# the number of bytes of input data per chunk evaluated by `DataFrame.filter`, sized
+# to fit in the L2/L3 cache
+FILTER_CHUNK_BYTES = 2**21
+
 Example = Dict
 Batch = Dict[str, Union[List, Column]]
 BatchOrDataset = Union[Batch, "DataFrame"]
 
 
+def _sort_incremental(*args, **kwargs):
+    # imported lazily, since `meerkat.ops.sort` depends on this module
+    from meerkat.ops.sort import _sort_incremental
+
+    return _sort_incremental(*args, **kwargs)
+
+
 class DataFrame(
     CloneableMixin,
     FunctionInspectorMixin,
@@ -431,27 +446,32 @@ class DataFrame(
         return self[-n:]
 
     def _get_loc(self, keyidx, materialize: bool = False):
-        if self.primary_key is None:
+        if self._primary_key is None:
             raise ValueError(
                 "Cannot use `loc` without a primary key. Set a primary key using "
                 "`set_primary_key`."
             )
+        # go through the block manager, rather than `self.primary_key`, to avoid
+        # creating a (reactive) view of the column on every lookup
+        key_index = self.data[self._primary_key]._get_key_index()
 
         if isinstance(
             keyidx, (np.ndarray, list, tuple, pd.Series, torch.Tensor, Column)
         ):
-            posidxs = self.primary_key._keyidxs_to_posidxs(keyidx)
+            if isinstance(keyidx, Column):
+                keyidx = keyidx.to_numpy()
+            posidxs = key_index.get_locs(keyidx)
             return self._clone(
                 data=self.data.apply("_get", index=posidxs, materialize=materialize)
             )
 
         else:
-            posidx = self.primary_key._keyidx_to_posidx(keyidx)
+            posidx = key_index.get_loc(keyidx)
             row = self.data.apply("_get", index=posidx, materialize=materialize)
             return {k: row[k] for k in self.columns}
 
     def _set_loc(self, keyidx: Union[str, int], column: str, value: any):
-        if self.primary_key is None:
+        if self._primary_key is None:
             raise ValueError(
                 "Cannot use `loc` without a primary key. Set a primary key using "
                 "`set_primary_key`."
@@ -462,7 +482,7 @@ class DataFrame(
         ):
             raise NotImplementedError("")
         else:
-            posidx = self.primary_key._keyidx_to_posidx(keyidx)
+            posidx = self.data[self._primary_key]._get_key_index().get_loc(keyidx)
             self[column][posidx] = value
             if self.has_inode():
                 mod = DataFrameModification(id=self.inode.id, scope=self.columns)
@@ -516,6 +536,12 @@ class DataFrame(
             # column index => multiple row selection (DataFrame)
             index_type = "row"
 
+        elif isinstance(posidx, Expression):
+            # lazy expression index => evaluated chunk by chunk into the positions
+            # of the selected rows, without materializing the mask
+            posidx = posidx.nonzero()
+            index_type = "row"
+
         else:
             raise TypeError("Invalid index type: {}".format(type(posidx)))
 
@@ -785,10 +811,17 @@ class DataFrame(
         primary_key: str = None,
         columns: Optional[Sequence[str]] = None,
         use_threads: bool = True,
+        backend: str = "pandas",
         **kwargs,
     ) -> DataFrame:
         """Create a DataFrame from a feather file. All of the columns will be
-        :class:`meerkat.ScalarColumn` with backend Pandas.
+        :class:`meerkat.ScalarColumn` with backend Pandas, or with backend Arrow if
+        ``backend="arrow"``.
+
+        With the Arrow backend, the file is memory-mapped and read with
+        :func:`pyarrow.feather.read_table`, so the columns of an uncompressed
+        file are views of the mapped file rather than copies in memory. Use
+        :meth:`iter_feather` to load a file that does not fit in memory.
 
         Args:
             filepath (str): The file path or buffer to load from.
@@ -797,17 +830,34 @@ class DataFrame(
                 Same as :func:`pandas.read_feather`.
             use_threads (bool): Whether to use threads to read the file.
                 Same as :func:`pandas.read_feather`.
-            **kwargs: Keyword arguments forwarded to :func:`pandas.read_feather`.
+            backend (str): The backend to use for the loading and resulting
+                columns, either "pandas" or "arrow". Defaults to "pandas".
+            **kwargs: Keyword arguments forwarded to :func:`pandas.read_feather`,
+                or to :func:`pyarrow.feather.read_table` with the Arrow backend.
 
         Returns:
             DataFrame: The constructed dataframe.
         """
-        df = cls.from_pandas(
-            pd.read_feather(
-                filepath, columns=columns, use_threads=use_threads, **kwargs
-            ),
-            index=False,
-        )
+        if backend == "arrow":
+            from pyarrow import feather
+
+            kwargs.setdefault("memory_map", isinstance(filepath, (str, os.PathLike)))
+            df = cls.from_arrow(
+                _drop_pandas_index(
+                    feather.read_table(
+                        filepath, columns=columns, use_threads=use_threads, **kwargs
+                    )
+                )
+            )
+        elif backend == "pandas":
+            df = cls.from_pandas(
+                pd.read_feather(
+                    filepath, columns=columns, use_threads=use_threads, **kwargs
+                ),
+                index=False,
+            )
+        else:
+            raise ValueError(f"Unsupported backend: {backend}.")
         if primary_key is not None:
             df.set_primary_key(primary_key, inplace=True)
         return df
@@ -820,31 +870,108 @@ class DataFrame(
         primary_key: str = None,
         engine: str = "auto",
         columns: Optional[Sequence[str]] = None,
+        filters: Optional[List] = None,
+        backend: str = "pandas",
         **kwargs,
     ) -> DataFrame:
         """Create a DataFrame from a parquet file. All of the columns will be
-        :class:`meerkat.ScalarColumn` with backend Pandas.
+        :class:`meerkat.ScalarColumn` with backend Pandas, or with backend Arrow if
+        ``backend="arrow"``.
+
+        With the Arrow backend, the file is memory-mapped and read with
+        :func:`pyarrow.parquet.read_table`, and the columns are built from the
+        Arrow table without converting strings to Python objects. Use
+        :meth:`iter_parquet` to load a file that does not fit in memory.
 
         Args:
             filepath (str): The file path or buffer to load from.
                 Same as :func:`pandas.read_parquet`.
-            engine (str): The parquet engine to use.
-                Same as :func:`pandas.read_parquet`.
-            columns (Optional[Sequence[str]]): The columns to load.
+            engine (str): The parquet engine to use with the Pandas backend.
                 Same as :func:`pandas.read_parquet`.
-            **kwargs: Keyword arguments forwarded to :func:`pandas.read_parquet`.
+            columns (Optional[Sequence[str]]): The columns to load. Only these
+                columns are read from the file.
+            filters (Optional[List]): The rows to load, as a predicate in the
+                format of :func:`pyarrow.parquet.read_table` (e.g.
+                ``[("year", ">=", 2020)]``). Row groups whose statistics rule the
+                predicate out are skipped without being read.
+            backend (str): The backend to use for the loading and resulting
+                columns, either "pandas" or "arrow". Defaults to "pandas".
+            **kwargs: Keyword arguments forwarded to :func:`pandas.read_parquet`,
+                or to :func:`pyarrow.parquet.read_table` with the Arrow backend.
 
         Returns:
             DataFrame: The constructed dataframe.
         """
-        df = cls.from_pandas(
-            pd.read_parquet(filepath, engine=engine, columns=columns, **kwargs),
-            index=False,
-        )
+        if filters is not None:
+            kwargs["filters"] = filters
+
+        if backend == "arrow":
+            import pyarrow.parquet as pq
+
+            kwargs.setdefault("memory_map", isinstance(filepath, (str, os.PathLike)))
+            df = cls.from_arrow(
+                _drop_pandas_index(pq.read_table(filepath, columns=columns, **kwargs))
+            )
+        elif backend == "pandas":
+            df = cls.from_pandas(
+                pd.read_parquet(filepath, engine=engine, columns=columns, **kwargs),
+                index=False,
+            )
+        else:
+            raise ValueError(f"Unsupported backend: {backend}.")
         if primary_key is not None:
             df.set_primary_key(primary_key, inplace=True)
         return df
 
+    @classmethod
+    def iter_parquet(
+        cls,
+        filepath: str,
+        batch_size: int = 2**16,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[List] = None,
+        primary_key: str = None,
+    ) -> Iterator[DataFrame]:
+        """Stream a parquet file as DataFrames of at most ``batch_size`` rows, with
+        :class:`meerkat.ArrowScalarColumn` columns.
+
+        Only one batch is held in memory at a time, so this can be used to
+        process files that are larger than memory.
+
+        Args:
+            filepath (str): The path of the file, or of a directory of files.
+            batch_size (int): The maximum number of rows per DataFrame. Defaults
+                to 65536.
+            columns (Optional[Sequence[str]]): The columns to load.
+            filters (Optional[List]): The rows to load. Same as
+                :meth:`from_parquet`.
+            primary_key (str): The primary key of each DataFrame.
+
+        Yields:
+            DataFrame: The batches of the file, in order.
+        """
+        return _iter_arrow_dataset(
+            cls, filepath, "parquet", batch_size, columns, filters, primary_key
+        )
+
+    @classmethod
+    def iter_feather(
+        cls,
+        filepath: str,
+        batch_size: int = 2**16,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[List] = None,
+        primary_key: str = None,
+    ) -> Iterator[DataFrame]:
+        """Stream a feather file as DataFrames of at most ``batch_size`` rows, with
+        :class:`meerkat.ArrowScalarColumn` columns.
+
+        See :meth:`iter_parquet` for the arguments.
+        """
+        return _iter_arrow_dataset(
+            cls, filepath, "feather", batch_size, columns, filters, primary_key
+        )
+
     @classmethod
     def from_json(
         cls,
@@ -1221,7 +1348,7 @@ class DataFrame(
     @reactive()
     def filter(
         self,
-        function: Optional[Callable] = None,
+        function: Optional[Union[Callable, Expression]] = None,
         with_indices=False,
         input_columns: Optional[Union[str, List[str]]] = None,
         is_batched_fn: bool = False,
@@ -1230,9 +1357,28 @@ class DataFrame(
         num_workers: int = 0,
         materialize: bool = True,
         pbar: bool = False,
+        limit: int = None,
+        chunk_size: int = None,
         **kwargs,
     ) -> Optional[DataFrame]:
-        """Filter operation on the DataFrame."""
+        """Filter operation on the DataFrame.
+
+        The predicate is evaluated chunk by chunk, and the positions of the
+        matching rows are collected as each chunk is evaluated, so only one chunk of
+        the inputs is materialized at a time.
+
+        Args:
+            function (Union[Callable, Expression]): The predicate, or a lazy
+                boolean :class:`~meerkat.ops.expression.Expression`.
+            limit (int, optional): Return at most the first ``limit`` matching
+                rows. Chunks after the one in which the ``limit``-th match is
+                found are not evaluated. Defaults to None.
+            chunk_size (int, optional): The number of rows per chunk. Defaults to
+                None, in which case chunks hold about ``FILTER_CHUNK_BYTES`` of
+                input data, so that they fit in the CPU's L2/L3 cache. If
+                ``num_workers`` is positive, the DataFrame is instead filtered in
+                one chunk, so that a single pool of worker processes is started.
+        """
 
         # Return if `self` has no examples
         if not len(self):
@@ -1241,6 +1387,19 @@ class DataFrame(
 
         # Get some information about the function
         df = self[input_columns] if input_columns is not None else self
+        if chunk_size is None and num_workers:
+            # every chunk is mapped with its own process pool, which costs far
+            # more to start than a cache-sized chunk saves
+            chunk_size = len(self)
+        elif chunk_size is None:
+            chunk_size = _filter_chunk_size(
+                self[[input_columns]] if isinstance(input_columns, str) else df,
+                batch_size=batch_size,
+            )
+
+        if isinstance(function, Expression):
+            return self[function.nonzero(chunk_size=chunk_size, limit=limit)]
+
         function_properties = df._inspect_function(
             function,
             with_indices,
@@ -1250,21 +1409,26 @@ class DataFrame(
         )
         assert function_properties.bool_output, "function must return boolean."
 
-        # Map to get the boolean outputs and indices
+        # Map over each chunk to get the boolean outputs and indices
         logger.info("Running `filter`, a new DataFrame will be returned.")
-        outputs = self.map(
-            function=function,
-            with_indices=with_indices,
-            input_columns=input_columns,
-            is_batched_fn=is_batched_fn,
-            batch_size=batch_size,
-            drop_last_batch=drop_last_batch,
-            num_workers=num_workers,
-            materialize=materialize,
-            pbar=pbar,
-            **kwargs,
-        )
-        indices = np.where(outputs)[0]
+        selected, num_selected = [], 0
+        for start in tqdm(range(0, len(self), chunk_size), disable=not pbar):
+            outputs = self[start : start + chunk_size].map(
+                function=function,
+                with_indices=with_indices,
+                input_columns=input_columns,
+                is_batched_fn=is_batched_fn,
+                batch_size=batch_size,
+                drop_last_batch=drop_last_batch,
+                num_workers=num_workers,
+                materialize=materialize,
+                **kwargs,
+            )
+            selected.append(np.where(outputs)[0] + start)
+            num_selected += len(selected[-1])
+            if limit is not None and num_selected >= limit:
+                break
+        indices = np.concatenate(selected)[:limit]
 
         # filter returns a new dataframe
         return self[indices]
@@ -1295,7 +1459,7 @@ class DataFrame(
             validate=validate,
         )
 
-    @reactive()
+    @reactive(incremental_fn=_sort_incremental)
     def sort(
         self,
         by: Union[str, List[str]],
@@ -1500,7 +1664,14 @@ class DataFrame(
         *args,
         **kwargs,
     ) -> DataFrame:
-        """Load a DataFrame stored on disk."""
+        """Load a DataFrame stored on disk.
+
+        Keyword arguments are passed to :meth:`BlockManager.read`. In particular,
+        pass ``lazy=True`` to only read the blocks of the columns that are accessed,
+        ``mmap=True`` to memory map the blocks that support it, and
+        ``max_loaded_blocks`` to release the least recently accessed blocks of a
+        lazily read DataFrame.
+        """
         from meerkat.datasets.utils import download_df, extract_tar_file
 
         # URL
@@ -1687,5 +1858,66 @@ def is_listlike(obj) -> bool:
     return is_column or is_sequential
 
 
+def _filter_chunk_size(df: DataFrame, batch_size: int = 1) -> int:
+    row_nbytes = 0
+    for column in df.columns:
+        data = df.data[column].data
+        nbytes = getattr(data, "nbytes", None)
+        # columns that don't expose their size (e.g. deferred columns) are counted
+        # as one pointer per row
+        row_nbytes += nbytes / len(df) if isinstance(nbytes, numbers.Integral) else 8
+    chunk_size = int(FILTER_CHUNK_BYTES // max(row_nbytes, 1))
+    # chunks hold whole batches, so batched functions see full batches
+    return max(batch_size, chunk_size - chunk_size % batch_size)
+
+
+def _pandas_index_columns(schema: pa.Schema) -> List[str]:
+    # files written from pandas store a non-default index as extra columns, which
+    # are dropped like the index is with the Pandas backend
+    metadata = schema.pandas_metadata or {}
+    return [
+        name
+        for name in metadata.get("index_columns", [])
+        if isinstance(name, str) and name in schema.names
+    ]
+
+
+def _drop_pandas_index(table: pa.Table) -> pa.Table:
+    index_columns = _pandas_index_columns(table.schema)
+    return table.drop(index_columns) if index_columns else table
+
+
+def _iter_arrow_dataset(
+    cls: Type[DataFrame],
+    filepath: str,
+    format: str,
+    batch_size: int,
+    columns: Optional[Sequence[str]],
+    filters: Optional[List],
+    primary_key: Optional[str],
+) -> Iterator[DataFrame]:
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    dataset = ds.dataset(filepath, format=format)
+    if columns is None:
+        index_columns = _pandas_index_columns(dataset.schema)
+        columns = [name for name in dataset.schema.names if name not in index_columns]
+    if filters is not None and not isinstance(filters, ds.Expression):
+        filters = pq.filters_to_expression(filters)
+
+    # the scanner skips the row groups ruled out by `filters` and reads the rest
+    # a batch at a time
+    for batch in dataset.to_batches(
+        columns=list(columns), filter=filters, batch_size=batch_size
+    ):
+        if batch.num_rows == 0:
+            continue
+        df = cls.from_arrow(pa.Table.from_batches([batch]))
+        if primary_key is not None:
+            df.set_primary_key(primary_key, inplace=True)
+        yield df
+
+
 DataFrame.mark = DataFrame._react
 DataFrame.unmark = DataFrame._no_react
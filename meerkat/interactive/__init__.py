@@ -23,6 +23,7 @@ from meerkat.interactive.graph import (  # noqa: F401
 )
 from meerkat.interactive.modification import DataFrameModification, Modification
 from meerkat.interactive.page import Page, page
+from meerkat.interactive.profiling import profiler
 from meerkat.interactive.startup import start
 from meerkat.interactive.state import State
 from meerkat.interactive.utils import print
@@ -70,6 +71,7 @@ __all__ = [
     "Website",
     # <<<< Utilities >>>>
     "print",
+    "profiler",
 ]
 
 # Add core components to the top-level namespace.
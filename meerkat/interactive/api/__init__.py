@@ -3,6 +3,7 @@ from .routers import (  # noqa: F401
     dataframe,
     endpoint,
     llm,
+    metrics,
     page,
     sliceby,
     store,
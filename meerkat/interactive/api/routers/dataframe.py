@@ -1,10 +1,14 @@
+import json
 from typing import Any, Dict, List, Optional, Union
 
-from fastapi import HTTPException
+import pyarrow as pa
+from fastapi import HTTPException, Response
 from pydantic import BaseModel, StrictInt, StrictStr
 
 from meerkat.dataframe import DataFrame
 from meerkat.interactive.endpoint import Endpoint, endpoint
+from meerkat.interactive.profiling import profiler
+from meerkat.ops.view_cache import _column_version
 
 
 class ColumnInfo(BaseModel):
@@ -86,10 +90,15 @@ def _get_column_infos(
     return out
 
 
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
 class RowsResponse(BaseModel):
     columnInfos: List[ColumnInfo]
     posidxs: List[int] = None
-    rows: List[List[Any]]
+    # row-major by default, or column-major if requested with `column_major`
+    rows: List[List[Any]] = None
+    columnData: List[List[Any]] = None
     fullLength: int
     primaryKey: Optional[str] = None
 
@@ -105,8 +114,24 @@ def rows(
     columns: List[str] = Endpoint.EmbeddedBody(None),
     formatter: Union[str, Dict[str, str]] = Endpoint.EmbeddedBody("base"),
     shuffle: bool = Endpoint.EmbeddedBody(False),
+    column_major: bool = Endpoint.EmbeddedBody(False),
+    response_format: str = Endpoint.EmbeddedBody("json"),
 ) -> RowsResponse:
-    """Get rows from a DataFrame as a JSON object."""
+    """Get rows from a DataFrame as a JSON object.
+
+    Cells are encoded a column at a time. With ``column_major``, the encoded
+    cells are returned as a list of columns in ``columnData`` instead of a list
+    of rows in ``rows``. With ``response_format="arrow"``, the response is an
+    Arrow IPC stream with one column per requested column, and the rest of the
+    response in the schema metadata under ``meerkat``. Columns whose encodings
+    do not fit an Arrow type are sent as JSON strings and listed in
+    ``jsonColumns``.
+    """
+    if response_format not in ("json", "arrow"):
+        raise ValueError(
+            f"Unknown response_format `{response_format}`, "
+            "expected 'json' or 'arrow'."
+        )
     if columns is None:
         columns = df.columns
     if isinstance(formatter, str):
@@ -114,6 +139,17 @@ def rows(
     full_length = len(df)
     column_infos = _get_column_infos(df, columns, formatter_placeholders=formatter)
 
+    # encodings are cached by the column they came from and the key of each row,
+    # and the versions of the column and the primary key, so that mutating
+    # either in place invalidates them
+    key_version = (
+        None if df.primary_key_name is None else _column_version(df.primary_key)
+    )
+    sources = {
+        info.name: (_column_version(df[info.name]), key_version)
+        for info in column_infos
+    }
+
     if shuffle:
         df = df.shuffle()
 
@@ -138,25 +174,77 @@ def rows(
                 )
             df = df.loc[keyidxs]
         else:
-            # FIXME(sabri): this will only work if key_column is a pandas column
-            df = df[df[key_column].isin(keyidxs)]
+            # rows are returned in the order of `keyidxs`, skipping missing keys
+            key_posidxs, found = df[key_column]._get_key_index().lookup(keyidxs)
+            df = df[key_posidxs[found]]
     else:
         raise ValueError()
 
-    rows = []
-    for row in df:
-        rows.append(
-            [
-                df[info.name]
-                .formatters[formatter.get(info.name, "base")]
-                .encode(row[info.name])
-                for info in column_infos
-            ]
+    if df.primary_key_name is not None:
+        row_keys = df.primary_key.to_numpy().tolist()
+    elif not shuffle and posidxs is not None:
+        row_keys = posidxs
+    else:
+        row_keys = None
+
+    # encode a column at a time so formatters can batch work across cells
+    encoded = []
+    for info in column_infos:
+        column = df[info.name]
+        keys = (
+            None
+            if row_keys is None
+            else [(sources[info.name], key) for key in row_keys]
         )
+        column_formatter = column.formatters[formatter.get(info.name, "base")]
+        with profiler.span("formatter", type(column_formatter).__name__):
+            encoded.append(column_formatter.encode_batch(column, keys=keys))
+
+    if response_format == "arrow":
+        return Response(
+            content=_to_arrow_ipc(
+                column_infos,
+                encoded,
+                fullLength=full_length,
+                posidxs=posidxs,
+                primaryKey=df.primary_key_name,
+            ),
+            media_type=ARROW_STREAM_MEDIA_TYPE,
+        )
+
     return RowsResponse(
         columnInfos=column_infos,
-        rows=rows,
+        rows=None if column_major else [list(row) for row in zip(*encoded)],
+        columnData=encoded if column_major else None,
         fullLength=full_length,
         posidxs=posidxs,
         primaryKey=df.primary_key_name,
     )
+
+
+def _to_arrow_ipc(
+    column_infos: List[ColumnInfo], encoded: List[List[Any]], **metadata
+) -> bytes:
+    arrays, json_columns = [], []
+    for info, values in zip(column_infos, encoded):
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # e.g. numbers mixed with "NaN" strings
+            arrays.append(pa.array([json.dumps(value) for value in values]))
+            json_columns.append(info.name)
+
+    metadata = {
+        "columnInfos": [info.dict() for info in column_infos],
+        "jsonColumns": json_columns,
+        **metadata,
+    }
+    table = pa.Table.from_arrays(
+        arrays,
+        names=[info.name for info in column_infos],
+        metadata={"meerkat": json.dumps(metadata)},
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,26 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException
+
+from meerkat.interactive.api.main import app
+from meerkat.interactive.profiling import profiler
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/")
+def metrics() -> Dict[str, Any]:
+    """Get the latencies and counts recorded by the profiler (see
+    :mod:`meerkat.interactive.profiling`)."""
+    return profiler.stats()
+
+
+@router.get("/trace/")
+def trace() -> Dict[str, Any]:
+    """Get the last Chrome trace recorded by the profiler."""
+    if profiler.last_trace is None:
+        raise HTTPException(status_code=404, detail="No trace has been recorded.")
+    return profiler.last_trace
+
+
+app.include_router(router)
@@ -6,6 +6,7 @@ from fastapi.encoders import jsonable_encoder
 
 from meerkat.interactive.endpoint import Endpoint, endpoint
 from meerkat.interactive.graph import Store, trigger
+from meerkat.interactive.graph.locking import lock_nodes
 from meerkat.interactive.modification import StoreModification
 from meerkat.interactive.utils import get_custom_json_encoder, is_equal
 from meerkat.state import state
@@ -43,8 +44,9 @@ def update(store: Store, value=Endpoint.EmbeddedBody()):
     # Ready the modification queue
     state.modification_queue.ready()
 
-    # Set the new value of the store
-    store.set(value)
+    # Set the new value of the store, waiting for endpoints that are using it
+    with lock_nodes(write=[store.inode] if store.has_inode() else []):
+        store.set(value)
 
     # Trigger on the store modification: leads to modifications on the graph
     try:
@@ -9,6 +9,7 @@ from meerkat.columns.scalar import ScalarColumn
 from meerkat.dataframe import DataFrame
 from meerkat.interactive.app.src.lib.component.abstract import Component
 from meerkat.interactive.graph import Store, reactive
+from meerkat.ops.view_cache import view_cache
 
 
 def filter_by_operator(*args, **kwargs):
@@ -149,6 +150,24 @@ def filter(
         # we view so that the result is a different dataframe than the input
         return data.view()
 
+    columns = [criterion.column for criterion in criteria]
+    spec = (
+        "filter",
+        tuple(
+            (criterion.column, criterion.op, repr(criterion.value))
+            for criterion in criteria
+        ),
+    )
+    indices = view_cache.get(data, columns, spec)
+    if indices is None:
+        indices = np.flatnonzero(_get_mask(data, criteria))
+        view_cache.put(data, columns, spec, indices)
+    return data[indices]
+
+
+def _get_mask(
+    data: Union["DataFrame", "Column"], criteria: List[FilterCriterion]
+) -> np.ndarray:
     # Filter pandas series columns.c
     # TODO (arjundd): Make this more efficient to perform filtering sequentially.
     all_masks = []
@@ -189,8 +208,7 @@ def filter(
         # the .data accessor is an interim solution.
         mask = _operator_str_to_func[criterion.op](col.data, value)
         all_masks.append(np.asarray(mask))
-    mask = np.stack(all_masks, axis=1).all(axis=1)
-    return data[mask]
+    return np.stack(all_masks, axis=1).all(axis=1)
 
 
 class Filter(Component):
@@ -10,8 +10,10 @@ from fastapi import APIRouter, Body
 from pydantic import BaseModel, create_model
 
 from meerkat.interactive.graph import Store, trigger, unmarked
+from meerkat.interactive.graph.locking import lock_nodes
 from meerkat.interactive.graph.store import _unpack_stores_from_object
 from meerkat.interactive.node import Node, NodeMixin
+from meerkat.interactive.profiling import profiler
 from meerkat.interactive.types import T
 from meerkat.mixins.identifiable import IdentifiableMixin, is_meerkat_id
 from meerkat.state import state
@@ -249,21 +251,28 @@ class Endpoint(IdentifiableMixin, NodeMixin, Generic[T]):
         # Ready the ModificationQueue so that it can be used to track
         # modifications made by the endpoint
         state.modification_queue.ready()
-        state.progress_queue.add(
+        name = (
             self.fn.func.__name__ if isinstance(self.fn, partial) else self.fn.__name__
         )
+        state.progress_queue.add(name)
 
-        try:
-            # The function should not add any operations to the graph.
-            with unmarked():
-                result = partial_fn()
-        except Exception as e:
-            # Unready the modification queue
-            state.modification_queue.unready()
-            raise e
+        # The function may modify the objects it is bound to, so other
+        # endpoints that use them wait for it to finish. Endpoints bound to
+        # other objects run concurrently.
+        bound_nodes = _get_bound_nodes(partial_fn)
 
-        with unmarked():
-            modifications = trigger()
+        with profiler.interaction(name):
+            try:
+                # The function should not add any operations to the graph.
+                with unmarked(), lock_nodes(write=bound_nodes):
+                    result = partial_fn()
+            except Exception as e:
+                # Unready the modification queue
+                state.modification_queue.unready()
+                raise e
+
+            with unmarked(), profiler.span("trigger", name):
+                modifications = trigger()
 
         # End the progress bar
         state.progress_queue.add(None)
@@ -458,6 +467,14 @@ class Endpoint(IdentifiableMixin, NodeMixin, Generic[T]):
 
             _fn = self.fn
 
+        # Time requests to the route when profiling is enabled
+        route_fn = _fn
+
+        @wraps(route_fn)
+        def _fn(*args, **kwargs):
+            with profiler.span("route", f"{self.prefix}{self.route}"):
+                return route_fn(*args, **kwargs)
+
         # Make FastAPI endpoint for POST requests
         self.router.add_api_route(
             self.route + "/" if not self.route.endswith("/") else self.route,
@@ -777,6 +794,28 @@ def _resolve_id_to_obj(value):
     return value
 
 
+def _get_bound_nodes(fn: partial) -> typing.List[Node]:
+    """The nodes of the objects that are bound to ``fn``, either directly or
+    by the id of their node."""
+    # `Endpoint.partial` names its partials, so they are not flattened when
+    # they are wrapped in another partial
+    bound = []
+    while isinstance(fn, partial):
+        bound.extend(list(fn.args) + list(fn.keywords.values()))
+        fn = fn.func
+
+    nodes = []
+    for arg in bound:
+        if isinstance(arg, NodeMixin):
+            if arg.has_inode():
+                nodes.append(arg.inode)
+        elif isinstance(arg, str) and is_meerkat_id(arg):
+            node = state.identifiables.nodes.get(arg)
+            if node is not None:
+                nodes.append(node)
+    return nodes
+
+
 def _is_annotation_store(type_hint) -> bool:
     """Check if a type hint is a Store or a Union of Stores.
 
@@ -2,7 +2,17 @@ from __future__ import annotations
 
 import collections
 from abc import ABC, abstractmethod, abstractproperty
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Sequence,
+    Type,
+    Union,
+)
 
 import yaml
 
@@ -10,6 +20,7 @@ from meerkat.columns.deferred.base import DeferredCell
 from meerkat.tools.utils import MeerkatDumper, MeerkatLoader
 
 if TYPE_CHECKING:
+    from meerkat.columns.abstract import Column
     from meerkat.interactive.app.src.lib.component.abstract import BaseComponent
 
 
@@ -246,6 +257,25 @@ class BaseFormatter(ABC):
         """
         return cell
 
+    def encode_batch(
+        self, column: Column, keys: Sequence[Hashable] = None
+    ) -> List[Any]:
+        """Encode every cell in a column.
+
+        Formatters that can encode many cells faster than one at a time should
+        override this method.
+
+        Args:
+            column (Column): The cells to encode.
+            keys (Sequence[Hashable], optional): A key for each cell that is stable
+                across calls, which formatters may use to cache encodings. Defaults
+                to None, in which case nothing is cached.
+
+        Returns:
+            List[Any]: The encoded cells.
+        """
+        return [self.encode(column[i]) for i in range(len(column))]
+
     @abstractproperty
     def props(self):
         return self._props
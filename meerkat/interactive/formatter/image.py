@@ -1,13 +1,17 @@
 import base64
 import os
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
 
 import numpy as np
 from PIL import Image as PILImage
 
 from meerkat import env
+from meerkat.block.result_cache import MISSING, ResultCache
+from meerkat.columns.abstract import Column
 from meerkat.columns.deferred.base import DeferredCell
+from meerkat.config import config
 from meerkat.interactive.formatter.icon import IconFormatter
 from meerkat.tools.lazy_loader import LazyLoader
 
@@ -16,6 +20,27 @@ from .base import BaseFormatter, FormatterGroup
 
 torch = LazyLoader("torch")
 
+_thumbnail_cache: Optional[ResultCache] = None
+
+
+def get_thumbnail_cache() -> ResultCache:
+    """Get the cache of encoded images shared by all image formatters.
+
+    The cache is created on first use from the ``thumbnail_cache_bytes``,
+    ``thumbnail_cache_dir`` and ``thumbnail_cache_disk_bytes`` options in
+    ``mk.config.display``. If a directory is set, the encodings of images read
+    from files are persisted there and reused across processes.
+    """
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        _thumbnail_cache = ResultCache(
+            max_bytes=config.display.thumbnail_cache_bytes,
+            spill_dir=config.display.thumbnail_cache_dir,
+            persist=config.display.thumbnail_cache_dir is not None,
+            max_disk_bytes=config.display.thumbnail_cache_disk_bytes,
+        )
+    return _thumbnail_cache
+
 
 class ImageFormatter(BaseFormatter):
     component_class = Image
@@ -64,6 +89,54 @@ class ImageFormatter(BaseFormatter):
                 ftype=ftype, im_base_64=base64.b64encode(buffer.getvalue()).decode()
             )
 
+    def encode_batch(
+        self, column: Column, keys: Sequence[Hashable] = None
+    ) -> List[str]:
+        """Encode every image in a column, reusing cached encodings where
+        possible and encoding the rest in parallel.
+
+        Encodings are cached under the formatter's ``max_size`` and ``mode`` and
+        the key of each cell, so cells without a key are always encoded. Only the
+        encodings of images read from files, which are keyed by the path,
+        modification time and size of the file, are persisted.
+        """
+        cells = [column[i] for i in range(len(column))]
+        if keys is None:
+            keys = [None] * len(cells)
+        cache = get_thumbnail_cache()
+        namespace = self._cache_namespace()
+        positions = [self._cache_position(cell, key) for cell, key in zip(cells, keys)]
+
+        out = [
+            MISSING if position is None else cache.get((namespace, position))
+            for position, _ in positions
+        ]
+        misses = [i for i, value in enumerate(out) if value is MISSING]
+        for i, value in zip(misses, self._encode_many([cells[i] for i in misses])):
+            position, persist = positions[i]
+            if position is not None:
+                cache.put((namespace, position), value, persist=persist)
+            out[i] = value
+        return out
+
+    def _encode_many(self, cells: List[Any]) -> List[str]:
+        if len(cells) <= 1:
+            return [self.encode(cell) for cell in cells]
+        # decoding, resizing and compressing images mostly releases the GIL
+        with ThreadPoolExecutor(config.display.thumbnail_threads) as executor:
+            return list(executor.map(self.encode, cells))
+
+    def _cache_namespace(self) -> str:
+        size = "full" if self.max_size is None else "x".join(map(str, self.max_size))
+        return f"image-{size}-{self.mode}"
+
+    def _cache_position(
+        self, cell: Any, key: Hashable
+    ) -> Tuple[Optional[Hashable], bool]:
+        """The position of ``cell`` in the cache, and whether the position is
+        stable across processes."""
+        return key, False
+
     @property
     def props(self) -> Dict[str, Any]:
         return {"classes": self.classes}
@@ -119,6 +192,21 @@ class DeferredImageFormatter(ImageFormatter):
         image = image()
         return super().encode(image, skip_copy=True)
 
+    def _cache_position(
+        self, cell: Any, key: Hashable
+    ) -> Tuple[Optional[Hashable], bool]:
+        # images loaded from files are keyed by the path, modification time and
+        # size of the file, which are stable across columns and processes
+        absolute_path = getattr(cell, "absolute_path", None)
+        if isinstance(absolute_path, (str, os.PathLike)):
+            try:
+                stat = os.stat(absolute_path)
+            except OSError:
+                # e.g. a url, which is not encoded
+                return key, False
+            return (str(absolute_path), stat.st_mtime_ns, stat.st_size), True
+        return key, False
+
 
 class DeferredImageFormatterGroup(ImageFormatterGroup):
     formatter_class: type = DeferredImageFormatter
@@ -1,11 +1,12 @@
 import math
 import textwrap
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, List, Sequence
 
 import numpy as np
 import pandas as pd
 from pandas.io.formats.format import format_array
 
+from meerkat.columns.abstract import Column
 from meerkat.interactive.app.src.lib.component.core.number import Number
 from meerkat.interactive.formatter.base import BaseFormatter, FormatterGroup
 from meerkat.interactive.formatter.icon import IconFormatter
@@ -50,6 +51,31 @@ class NumberFormatter(BaseFormatter):
             return cell.as_py()
         return str(cell)
 
+    def encode_batch(self, column: Column, keys: Sequence[Hashable] = None) -> List:
+        from meerkat.columns.scalar.arrow import ArrowScalarColumn
+        from meerkat.columns.scalar.pandas import PandasScalarColumn
+
+        if isinstance(column, ArrowScalarColumn):
+            # cells of arrow columns are python values, see `encode`
+            return [
+                "NaN" if isinstance(value, float) and math.isnan(value) else str(value)
+                for value in column.data.to_pylist()
+            ]
+
+        if isinstance(column, PandasScalarColumn) and isinstance(
+            column.dtype, np.dtype
+        ):
+            values = column.data.to_numpy()
+            if values.dtype.kind in "biu":
+                return values.tolist()
+            if values.dtype.kind == "f":
+                out = values.tolist()
+                for i in np.flatnonzero(np.isnan(values)):
+                    out[i] = "NaN"
+                return out
+
+        return super().encode_batch(column, keys=keys)
+
     def html(self, cell: Any):
         cell = self.encode(cell)
         if isinstance(cell, str):
@@ -1,5 +1,6 @@
-from typing import Any
+from typing import Any, Dict, Hashable, List, Sequence
 
+from meerkat.columns.abstract import Column
 from meerkat.interactive.app.src.lib.component.core.tensor import Tensor
 
 from .base import Formatter, FormatterGroup
@@ -18,6 +19,19 @@ class TensorFormatter(Formatter):
             "dtype": str(cell.dtype),
         }
 
+    def encode_batch(
+        self, column: Column, keys: Sequence[Hashable] = None
+    ) -> List[Dict[str, Any]]:
+        from meerkat.columns.tensor.abstract import TensorColumn
+
+        if not isinstance(column, TensorColumn):
+            return super().encode_batch(column, keys=keys)
+
+        # convert the whole slice in one call rather than one row at a time
+        data = column.data
+        shape, dtype = list(data.shape[1:]), str(data.dtype)
+        return [{"data": row, "shape": shape, "dtype": dtype} for row in data.tolist()]
+
 
 class TensorFormatterGroup(FormatterGroup):
     def __init__(self, dtype: str = None):
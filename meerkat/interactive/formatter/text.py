@@ -1,9 +1,12 @@
 import textwrap
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, List, Sequence
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.io.formats.format import format_array
 
+from meerkat.columns.abstract import Column
 from meerkat.interactive.app.src.lib.component.core.text import Text
 from meerkat.interactive.formatter.base import BaseFormatter, FormatterGroup
 from meerkat.interactive.formatter.icon import IconFormatter
@@ -27,6 +30,26 @@ class TextFormatter(BaseFormatter):
     def encode(self, cell: Any):
         return str(cell)
 
+    def encode_batch(
+        self, column: Column, keys: Sequence[Hashable] = None
+    ) -> List[str]:
+        from meerkat.columns.scalar.arrow import ArrowScalarColumn
+        from meerkat.columns.scalar.pandas import PandasScalarColumn
+
+        if isinstance(column, ArrowScalarColumn) and (
+            pa.types.is_string(column.data.type)
+            or pa.types.is_large_string(column.data.type)
+        ):
+            # str() of an arrow scalar is str() of its python value
+            return pc.fill_null(column.data, "None").to_pylist()
+
+        if isinstance(column, PandasScalarColumn) and (
+            isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufUO"
+        ):
+            return [str(value) for value in column.data.to_numpy()]
+
+        return super().encode_batch(column, keys=keys)
+
     @property
     def props(self) -> Dict[str, Any]:
         return {"classes": self.classes}
@@ -1,7 +1,8 @@
 import logging
-from typing import List
+from typing import Dict, List, Optional
 
 from meerkat.errors import TriggerError
+from meerkat.interactive.graph.locking import lock_nodes
 from meerkat.interactive.graph.marking import (
     is_unmarked_context,
     is_unmarked_fn,
@@ -11,8 +12,9 @@ from meerkat.interactive.graph.marking import (
 from meerkat.interactive.graph.operation import Operation
 from meerkat.interactive.graph.reactivity import is_reactive_fn, reactive
 from meerkat.interactive.graph.store import Store, StoreFrontend, make_store
-from meerkat.interactive.modification import Modification
-from meerkat.interactive.node import _topological_sort
+from meerkat.interactive.modification import DataFrameModification, Modification
+from meerkat.interactive.node import Node, NodeMixin, _topological_sort
+from meerkat.interactive.profiling import profiler
 from meerkat.state import state
 
 __all__ = [
@@ -30,6 +32,7 @@ __all__ = [
     "make_store",
     "Operation",
     "trigger",
+    "coalesce_modifications",
 ]
 
 
@@ -49,7 +52,9 @@ def trigger() -> List[Modification]:
     """
     # Get all the modifications collected so far
     # This clears the modification queue
-    modifications = state.modification_queue.clear()
+    queued = state.modification_queue.clear()
+    modifications = coalesce_modifications(queued)
+    profiler.count("modification.coalesced", len(queued) - len(modifications))
 
     # Stop tracking modifications since we're triggering with what we have
     state.modification_queue.unready()
@@ -64,10 +69,32 @@ def trigger() -> List[Modification]:
     # We need to do this to skip operations where inputs are not changed.
     order = [
         node.obj
-        for node in _topological_sort(root_nodes)
+        for node in _topological_sort(list(root_nodes))
         if isinstance(node.obj, Operation)
     ]
 
+    # The nodes modified so far, and the columns modified in each
+    scopes = _get_scopes(modifications)
+
+    # Operations update the nodes downstream of the modified ones, and read
+    # their other inputs, which must not change while the pipeline runs
+    write = _get_downstream(root_nodes)
+    read = [
+        arg.inode
+        for op in order
+        for arg in list(op.args) + list(op.kwargs.values())
+        if isinstance(arg, NodeMixin) and arg.has_inode()
+    ]
+
+    with lock_nodes(read=read, write=write):
+        new_modifications = _run_operations(order, scopes)
+
+    return coalesce_modifications(modifications + new_modifications)
+
+
+def _run_operations(
+    order: List[Operation], scopes: Dict[Node, Optional[set]]
+) -> List[Modification]:
     new_modifications = []
     if len(order) > 0:
         logger.debug(
@@ -88,8 +115,15 @@ def trigger() -> List[Modification]:
                 {"op": op.fn.__name__, "progress": int(i / len(order) * 100)}
             )
 
+            # Operations are only run if one of their inputs was modified, and
+            # not, e.g., if the operation upstream of them was skipped
+            if not any(node.children.get(op.inode, False) for node in scopes):
+                logger.debug(f"Skipping {op.fn.__name__}: no inputs were modified.")
+                profiler.count("operation.unaffected")
+                continue
+
             try:
-                mods = op()
+                mods = op(delta=op.get_delta(scopes) or None)
             except Exception as e:
                 # TODO (sabri): Change this to a custom error type
                 raise TriggerError("Exception in trigger. " + str(e)) from e
@@ -97,8 +131,61 @@ def trigger() -> List[Modification]:
             # TODO: check this
             # mods = [mod for mod in mods if not isinstance(mod, StoreModification)]
             new_modifications.extend(mods)
+            _update_scopes(scopes, mods)
 
         state.progress_queue.add({"op": "Done!", "progress": 100})
         logger.debug("Done running trigger pipeline.")
 
-    return modifications + new_modifications
+    return new_modifications
+
+
+def _get_downstream(root_nodes: List[Node]) -> List[Node]:
+    """The nodes triggered by ``root_nodes``, including themselves."""
+    nodes = dict.fromkeys(root_nodes)
+    stack = list(root_nodes)
+    while stack:
+        for child in stack.pop().trigger_children:
+            if child not in nodes:
+                nodes[child] = None
+                stack.append(child)
+    return list(nodes)
+
+
+def coalesce_modifications(modifications: List[Modification]) -> List[Modification]:
+    """Merge modifications of the same object, so that each object is only
+    traversed and sent to the frontend once.
+
+    Modifications of the same DataFrame are merged into one with the union of
+    their scopes. Of the modifications of the same Store, only the last, which
+    holds the latest value, is kept. Merged modifications take the position of
+    the first modification of their object.
+    """
+    coalesced = {}
+    for mod in modifications:
+        key = (type(mod), mod.id)
+        if key in coalesced and isinstance(mod, DataFrameModification):
+            scope = list(dict.fromkeys(coalesced[key].scope + mod.scope))
+            mod = DataFrameModification(id=mod.id, scope=scope)
+        coalesced[key] = mod
+    return list(coalesced.values())
+
+
+def _get_scopes(modifications: List[Modification]) -> Dict[Node, Optional[set]]:
+    scopes = {}
+    _update_scopes(scopes, modifications)
+    return scopes
+
+
+def _update_scopes(
+    scopes: Dict[Node, Optional[set]], modifications: List[Modification]
+) -> None:
+    for mod in modifications:
+        node = mod.node
+        if node is None:
+            continue
+        scope = set(mod.scope) if isinstance(mod, DataFrameModification) else None
+        if node in scopes:
+            scope = (
+                None if scope is None or scopes[node] is None else scope | scopes[node]
+            )
+        scopes[node] = scope
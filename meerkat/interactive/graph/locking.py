@@ -0,0 +1,115 @@
+"""Read/write locks over the nodes of the computation graph.
+
+Endpoints run concurrently in the thread pool of the API server. Each endpoint
+takes write locks on the nodes it was bound to while its function runs, and
+:func:`~meerkat.interactive.graph.trigger` takes write locks on the nodes it
+updates and read locks on the other inputs of the operations it runs. So
+endpoints that touch disjoint parts of the graph run in parallel, and those
+that touch the same nodes run one at a time.
+
+Locks are always taken together with :func:`lock_nodes`, which acquires them in
+a fixed order so that two endpoints cannot deadlock on each other.
+"""
+import threading
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterable
+
+from meerkat.interactive.node import Node
+
+
+class ReadWriteLock:
+    """A reentrant lock that is held by any number of readers or by one
+    writer.
+
+    A thread that holds the write lock can take it again and can take the read
+    lock. Writers are preferred over new readers, so a stream of readers does
+    not starve a writer.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers: Counter = Counter()
+        self._writer = None
+        self._writes = 0
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer != me and not self._readers[me]:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+            self._readers[me] += 1
+
+    def release_read(self):
+        me = threading.get_ident()
+        with self._cond:
+            self._readers[me] -= 1
+            if not self._readers[me]:
+                del self._readers[me]
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer != me:
+                self._waiting_writers += 1
+                try:
+                    # a reader may upgrade to a writer once it is the only reader
+                    while self._writer is not None or any(
+                        thread != me for thread in self._readers
+                    ):
+                        self._cond.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = me
+            self._writes += 1
+
+    def release_write(self):
+        with self._cond:
+            self._writes -= 1
+            if not self._writes:
+                self._writer = None
+                self._cond.notify_all()
+
+
+_locks: "weakref.WeakKeyDictionary[Node, ReadWriteLock]" = weakref.WeakKeyDictionary()
+_locks_lock = threading.Lock()
+
+
+def get_lock(node: Node) -> ReadWriteLock:
+    """The lock of ``node``, which is created on first use."""
+    with _locks_lock:
+        lock = _locks.get(node)
+        if lock is None:
+            lock = _locks[node] = ReadWriteLock()
+        return lock
+
+
+@contextmanager
+def lock_nodes(read: Iterable[Node] = (), write: Iterable[Node] = ()):
+    """Hold read locks on the nodes in ``read`` and write locks on the nodes in
+    ``write`` for the duration of the block.
+
+    Nodes in both are write locked. The locks are acquired in the order of the
+    node ids.
+    """
+    modes = {node: False for node in read}
+    modes.update({node: True for node in write})
+
+    acquired = []
+    try:
+        for node in sorted(modes, key=lambda node: node.id):
+            lock = get_lock(node)
+            if modes[node]:
+                lock.acquire_write()
+                acquired.append(lock.release_write)
+            else:
+                lock.acquire_read()
+                acquired.append(lock.release_read)
+        yield
+    finally:
+        for release in reversed(acquired):
+            release()
@@ -1,6 +1,6 @@
 import inspect
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
 
 from meerkat.interactive.graph.marking import unmarked
 from meerkat.interactive.graph.utils import _replace_nodes_with_nodeables
@@ -9,7 +9,8 @@ from meerkat.interactive.modification import (
     Modification,
     StoreModification,
 )
-from meerkat.interactive.node import NodeMixin
+from meerkat.interactive.node import Node, NodeMixin
+from meerkat.interactive.profiling import profiler
 from meerkat.interactive.types import Primitive
 
 if TYPE_CHECKING:
@@ -43,6 +44,7 @@ class Operation(NodeMixin):
         kwargs: Dict[str, Any],
         result: Any,
         skip_fn: Callable[..., bool] = None,
+        incremental_fn: Callable[..., Optional[List[str]]] = None,
     ):
         super().__init__()
         self.fn = fn
@@ -51,6 +53,7 @@ class Operation(NodeMixin):
         self.result = result
 
         self.skip_fn = skip_fn
+        self.incremental_fn = incremental_fn
         self.cache = None
         if self.skip_fn is None:
             self._skip_parameters = None
@@ -106,14 +109,58 @@ class Operation(NodeMixin):
             args[0] = _replace_nodes_with_nodeables(self.args[0], unwrap_stores=False)
         return args, kwargs
 
-    def __call__(self) -> List[Modification]:
+    def get_delta(
+        self, scopes: Dict[Node, Optional[set]]
+    ) -> Dict[str, Optional[List[str]]]:
+        """Get the inputs of the operation that were modified.
+
+        Args:
+            scopes: The nodes modified so far, mapped to the columns that were
+                modified, or None if the node is not a DataFrame.
+
+        Returns:
+            Dict[str, Optional[List[str]]]: The names of the parameters of ``fn``
+                whose inputs were modified, mapped to the modified columns (or None
+                if unknown). Empty if no input was modified.
+        """
+        try:
+            params = inspect.getcallargs(self.fn, *self.args, **self.kwargs)
+        except TypeError:
+            params = {i: arg for i, arg in enumerate(self.args)}
+            params.update(self.kwargs)
+
+        delta = {}
+        for param, value in params.items():
+            modified = [node for node in _iter_nodes(value) if node in scopes]
+            if not modified:
+                continue
+            if any(scopes[node] is None for node in modified):
+                delta[param] = None
+            else:
+                delta[param] = sorted(set().union(*(scopes[n] for n in modified)))
+        return delta
+
+    def __call__(
+        self, delta: Dict[str, Optional[List[str]]] = None
+    ) -> List[Modification]:
         """Execute the operation. Unpack the arguments and keyword arguments
         and call the function. Then, update the result Reference with the
         result and return a list of modifications.
 
         These modifications describe the delta changes made to the
         result Reference, and are used to update the state of the GUI.
+
+        If the operation has an ``incremental_fn`` and ``delta`` (see
+        :meth:`get_delta`) is passed, ``incremental_fn`` is first given the chance
+        to update the result DataFrame in place. It is called with the current
+        result, ``delta`` and the arguments of ``fn``, and must return either
+        the columns of the result it updated or ``NotImplemented``, in which case
+        ``fn`` is run as usual.
         """
+        with profiler.span("operation", self.fn.__name__):
+            return self._run(delta)
+
+    def _run(self, delta: Dict[str, Optional[List[str]]]) -> List[Modification]:
 
         logger.debug(f"Running {repr(self)}")
 
@@ -128,8 +175,22 @@ class Operation(NodeMixin):
             # FIXME: We are deferencing the nodes again, which we dont need to do.
             self._reset_cache()
             if skip:
+                profiler.count("operation.skipped")
                 return []
 
+        if self.incremental_fn is not None and delta is not None:
+            with unmarked():
+                scope = self.incremental_fn(self.result, delta, *args, **kwargs)
+            if scope is not NotImplemented:
+                profiler.count("operation.incremental")
+                logger.debug(f"Operation({self.fn.__name__}): updated {scope}")
+                if not scope:
+                    return []
+                return [
+                    DataFrameModification(id=self.result.inode.id, scope=list(scope))
+                ]
+
+        profiler.count("operation.recomputed")
         with unmarked():
             update = self.fn(*args, **kwargs)
 
@@ -212,6 +273,22 @@ def _update_result(
         return update
 
 
+def _iter_nodes(obj: Any) -> Iterator[Node]:
+    if isinstance(obj, Node):
+        yield obj
+    elif isinstance(obj, NodeMixin):
+        if obj.has_inode():
+            yield obj.inode
+    elif isinstance(obj, slice):
+        yield from _iter_nodes([obj.start, obj.stop, obj.step])
+    elif isinstance(obj, (list, tuple)):
+        for x in obj:
+            yield from _iter_nodes(x)
+    elif isinstance(obj, dict):
+        for x in obj.values():
+            yield from _iter_nodes(x)
+
+
 def _validate_and_extract_skip_fn(*, skip_fn, fn) -> set:
     # Skip functions should have arguments that start with `old_` and `new_`
     # followed by the same keyword argument name.
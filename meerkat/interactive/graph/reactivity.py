@@ -1,6 +1,6 @@
 import types
 from functools import partial, wraps
-from typing import Callable, Iterator
+from typing import Callable, Iterator, List, Optional
 
 from meerkat.interactive.graph.marking import is_unmarked_context, unmarked
 from meerkat.interactive.graph.operation import (
@@ -39,6 +39,7 @@ def reactive(
     fn: Callable = None,
     nested_return: bool = False,
     skip_fn: Callable[..., bool] = None,
+    incremental_fn: Callable[..., Optional[List[str]]] = None,
 ) -> Callable:
     """Internal decorator that is used to mark a function as reactive.
     This is only meant for internal use, and users should use the
@@ -78,6 +79,9 @@ def reactive(
         fn: See :func:`react`.
         nested_return: See :func:`react`.
         skip_fn: See :func:`react`.
+        incremental_fn: A function that updates the result of ``fn`` in place when
+            only part of its inputs changed, instead of re-running ``fn``. See
+            :meth:`Operation.__call__`.
 
     Returns:
         See :func:`react`.
@@ -88,7 +92,12 @@ def reactive(
     if fn is None:
         # need to make passing args to the args optional
         # note: all of the args passed to the decorator MUST be optional
-        return partial(reactive, nested_return=nested_return, skip_fn=skip_fn)
+        return partial(
+            reactive,
+            nested_return=nested_return,
+            skip_fn=skip_fn,
+            incremental_fn=incremental_fn,
+        )
 
     # Built-in functions cannot be wrapped in reactive.
     # They have to be converted to a lambda function first and then run.
@@ -252,6 +261,7 @@ def reactive(
                     kwargs=kwargs,
                     result=result,
                     skip_fn=skip_fn,
+                    incremental_fn=incremental_fn,
                 )
 
                 # For normal functions
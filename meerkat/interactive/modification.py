@@ -38,6 +38,13 @@ class DataFrameModification(Modification):
     scope: List[str]
     type: str = "ref"
 
+    def add_to_queue(self):
+        # sorts and filters cached for the modified columns are now stale
+        from meerkat.ops.view_cache import view_cache
+
+        view_cache.invalidate(self.id, columns=self.scope)
+        super().add_to_queue()
+
     @property
     def node(self) -> "Node":
         from meerkat.state import state
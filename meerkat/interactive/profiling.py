@@ -0,0 +1,209 @@
+"""Opt-in latency instrumentation for the interactive backend.
+
+When enabled, the profiler records the latency of every endpoint, graph
+operation and formatter run in a histogram per name, counts events such as
+operations that were re-run or skipped, and can record a Chrome trace of one
+interaction. The stats are available from :meth:`Profiler.stats` and on the
+``/metrics/`` route of the API.
+
+.. code-block:: python
+
+    from meerkat.interactive.profiling import profiler
+
+    profiler.enable()
+    ...  # interact with the GUI
+    profiler.stats()["latency"]["endpoint"]
+
+    # record a trace of the next endpoint that is run
+    profiler.trace_next("trace.json")
+"""
+import bisect
+import json
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+# upper bounds of the histogram buckets, in milliseconds
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """A latency histogram with fixed, roughly logarithmic buckets."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float):
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket it falls in."""
+        rank, seen = q * self.count, 0
+        for bound, count in zip(BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p90_ms": self.quantile(0.9),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": self.max_ms,
+            "buckets": {
+                **{f"le_{b}": c for b, c in zip(BUCKETS_MS, self.counts)},
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class Profiler:
+    """Records latencies and event counts of the interactive backend.
+
+    The profiler is disabled by default, in which case recording is a no-op.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[str, Histogram]] = defaultdict(
+            lambda: defaultdict(Histogram)
+        )
+        self._counters: Counter = Counter()
+
+        self._trace_events: Optional[List[Dict[str, Any]]] = None
+        self._trace_path: Optional[str] = None
+        self._trace_next = False
+        self.last_trace: Optional[Dict[str, Any]] = None
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Drop all recorded latencies, counts and traces."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self.last_trace = None
+
+    @contextmanager
+    def span(self, category: str, name: str):
+        """Time the enclosed block and record it under ``category`` and
+        ``name``, e.g. ``("operation", "sort")``."""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self._histograms[category][name].add((end - start) * 1e3)
+                if self._trace_events is not None:
+                    self._trace_events.append(
+                        {
+                            "name": name,
+                            "cat": category,
+                            "ph": "X",
+                            "ts": start * 1e6,
+                            "dur": (end - start) * 1e6,
+                            "pid": os.getpid(),
+                            "tid": threading.get_ident(),
+                        }
+                    )
+
+    def count(self, name: str, n: int = 1):
+        """Increment the counter ``name``, e.g. ``"operation.skipped"``."""
+        if self.enabled:
+            with self._lock:
+                self._counters[name] += n
+
+    @contextmanager
+    def trace(self, path: str = None):
+        """Record a Chrome trace of the spans in the enclosed block.
+
+        The trace is kept in ``last_trace`` and, if ``path`` is passed, written
+        there as JSON that can be opened in ``chrome://tracing`` or Perfetto.
+        Tracing enables the profiler for the duration of the block.
+        """
+        enabled = self.enabled
+        self.enabled = True
+        with self._lock:
+            self._trace_events = []
+        try:
+            yield
+        finally:
+            with self._lock:
+                events, self._trace_events = self._trace_events, None
+            self.enabled = enabled
+            self.last_trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+            if path is not None:
+                with open(path, "w") as f:
+                    json.dump(self.last_trace, f)
+
+    def trace_next(self, path: str = None):
+        """Record a trace (see :meth:`trace`) of the next endpoint that is run,
+        e.g. the next click in the GUI."""
+        self._trace_next = True
+        self._trace_path = path
+
+    @contextmanager
+    def interaction(self, name: str):
+        """Time an endpoint run, tracing it if :meth:`trace_next` was
+        called."""
+        if self._trace_next:
+            self._trace_next = False
+            with self.trace(self._trace_path), self.span("endpoint", name):
+                yield
+        else:
+            with self.span("endpoint", name):
+                yield
+
+    def stats(self) -> Dict[str, Any]:
+        """The recorded latencies by category and name, the event counts, and
+        the hits and misses of the backend's caches."""
+        with self._lock:
+            latency = {
+                category: {name: h.to_dict() for name, h in histograms.items()}
+                for category, histograms in self._histograms.items()
+            }
+            counters = dict(self._counters)
+        return {
+            "enabled": self.enabled,
+            "latency": latency,
+            "counters": counters,
+            "caches": _cache_stats(),
+        }
+
+
+def _cache_stats() -> Dict[str, Dict[str, int]]:
+    from meerkat.interactive.formatter import image
+    from meerkat.ops.view_cache import view_cache
+
+    caches = {"view": view_cache, "thumbnail": image._thumbnail_cache}
+    return {
+        name: {"hits": cache.hits, "misses": cache.misses, "entries": len(cache)}
+        for name, cache in caches.items()
+        if cache is not None
+    }
+
+
+profiler = Profiler()
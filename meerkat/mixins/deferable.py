@@ -6,6 +6,7 @@ from pandas.util._decorators import doc
 from meerkat.ops.map import defer
 
 if TYPE_CHECKING:
+    from meerkat.block.result_cache import ResultCache
     from meerkat.columns.abstract import Column
     from meerkat.columns.deferred.base import DeferredColumn
     from meerkat.dataframe import DataFrame
@@ -27,6 +28,7 @@ class DeferrableMixin:
         outputs: Union[Mapping[any, str], Sequence[str]] = None,
         output_type: Union[Mapping[str, Type["Column"]], Type["Column"]] = None,
         materialize: bool = True,
+        cache: "ResultCache" = None,
     ) -> Union["DataFrame", "DeferredColumn"]:
         return defer(
             data=self,
@@ -37,4 +39,5 @@ class DeferrableMixin:
             outputs=outputs,
             output_type=output_type,
             materialize=materialize,
+            cache=cache,
         )
@@ -1,11 +1,19 @@
-from typing import Callable, Union
-
+import hashlib
+import math
+import os
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
 import PIL
+from tqdm import tqdm
 
 import meerkat as mk
 from meerkat.tools.lazy_loader import LazyLoader
-from meerkat.tools.utils import choose_device
+from meerkat.tools.utils import choose_device, dump_yaml, load_yaml
 
+from .cache import EmbeddingCache, encoder_key, row_keys
 from .clip import clip
 from .encoder import Encoder
 from .registry import encoders
@@ -16,7 +24,7 @@ bit = LazyLoader(".bit")
 
 torch = LazyLoader("torch")
 
-__all__ = ["clip", "bit", "transformers", "robust", "embed"]
+__all__ = ["clip", "bit", "transformers", "robust", "embed", "EmbeddingCache"]
 
 
 def infer_modality(col: mk.Column):
@@ -50,6 +58,7 @@ def embed(
     num_workers: int = 0,
     batch_size: int = 128,
     pbar: bool = True,
+    cache: Union[str, EmbeddingCache] = None,
     **kwargs,
 ) -> Union[mk.DataFrame, mk.Column]:
     """Embed a column of data with an encoder from the encoder registry.
@@ -90,11 +99,21 @@ def embed(
             Defaults to None, in which case it is ``"{encoder}({input_col})"``.
         device (Union[int, str], optional): The device on which. Defaults to "cpu".
         mmap_dir (str, optional): The path to directory where a memory-mapped file
-            containing the embeddings will be written. Defaults to None, in which case
-            the embeddings are not memmapped.
-        num_workers (int, optional): Number of worker processes used to load the data
-            from disk. Defaults to 4.
+            containing the embeddings will be written. Progress is checkpointed in
+            the directory after every batch, so an interrupted run with the same
+            ``mmap_dir``, ``out_col``, encoder and input rows resumes from the last
+            written batch.
+            Defaults to None, in which case the embeddings are not memmapped.
+        num_workers (int, optional): Number of worker processes used to load and
+            preprocess the data. Batches are prefetched, so that loading overlaps
+            with encoding. Defaults to 0.
         batch_size (int, optional): Size of the batches to  used . Defaults to 128.
+        cache (Union[str, EmbeddingCache], optional): An on-disk cache of
+            embeddings, or the path to one, that is consulted before encoding and
+            populated afterwards. Only rows that are not in the cache are encoded.
+            The cache is only used with encoders passed by name. Defaults to None,
+            in which case ``mk.config.system.embedding_cache_dir`` is used if it is
+            set.
         **kwargs: Additional keyword arguments are passed to the encoder. To see
             supported arguments for each encoder, see the encoder documentation (e.g.
             :func:`~domino._embed.clip`).
@@ -120,8 +139,19 @@ def embed(
         # pyarrow.lib.StringScalars in a mk.ArrowArrayColumn
         if modality == "text" and isinstance(col, mk.ArrowScalarColumn):
             col = mk.ScalarColumn(col.to_pandas())
+    if cache is None and mk.config.system.embedding_cache_dir is not None:
+        cache = mk.config.system.embedding_cache_dir
+    if isinstance(cache, str):
+        cache = EmbeddingCache(cache, max_bytes=mk.config.system.embedding_cache_bytes)
+
+    keys = None
     if isinstance(encoder, str):
+        encoder_id = encoder_key(encoder, modality, **kwargs)
+        if cache is not None:
+            keys = row_keys(col, encoder_id)
         encoder = encoders.get(encoder, device=device, **kwargs)
+    else:
+        encoder_id = None
 
     if isinstance(encoder, dict):
         if modality not in encoder:
@@ -130,8 +160,7 @@ def embed(
             )
         encoder = encoder[modality]
 
-    out = _embed(
-        col=col,
+    embed_kwargs = dict(
         encode=encoder.encode,
         preprocess=encoder.preprocess,
         collate=encoder.collate,
@@ -140,7 +169,13 @@ def embed(
         num_workers=num_workers,
         batch_size=batch_size,
         pbar=pbar,
+        key=out_col,
+        encoder_id=encoder_id,
     )
+    if keys is None:
+        out = _embed(col=col, **embed_kwargs)
+    else:
+        out = _embed_cached(col=col, keys=keys, cache=cache, **embed_kwargs)
 
     if isinstance(data, mk.DataFrame):
         data[out_col] = out
@@ -159,13 +194,36 @@ def _embed(
     num_workers: int = 0,
     batch_size: int = 128,
     pbar: bool = True,
+    key: str = None,
+    prefetch: int = 2,
+    encoder_id: str = None,
 ):
+    """Encode ``col`` in batches of ``batch_size``.
+
+    Batches are preprocessed by a ``DataLoader`` with ``num_workers`` worker
+    processes and prefetched on a background thread, so that loading and
+    preprocessing the next batches overlaps with encoding the current one.
+
+    If ``mmap_dir`` is passed, the embeddings are written batch by batch to a
+    memory-mapped file in it, and progress is checkpointed after every batch. The
+    checkpoint records a fingerprint of the encoder, identified by ``encoder_id``
+    or else by its functions, and of the rows of ``col``. A later run with the
+    same ``mmap_dir``, ``key`` and fingerprint resumes from the last written batch.
+    Columns with rows that cannot be fingerprinted are always encoded from the
+    start.
+    """
+    from meerkat.writers.numpy_writer import NumpyMemmapWriter
+
     def _encode(x):
         out = encode(_prepare_input(x))
         if torch.is_tensor(out):
             out = out.cpu().detach().numpy()
         return out
 
+    if len(col) == 0:
+        # there are no rows to encode, so the shape of the embeddings is unknown
+        return mk.NumPyTensorColumn(np.empty((0,), dtype=np.float32))
+
     if device is None:
         device = "cuda" if torch.cuda.is_available() else "cpu"
 
@@ -184,17 +242,174 @@ def _embed(
             x = x.to(device)
         return x
 
-    with torch.no_grad():
-        out = embed_input.map(
-            _encode,
-            pbar=pbar,
-            is_batched_fn=True,
-            batch_size=batch_size,
-            # num_workers=num_workers,
-            # mmap=mmap_dir is not None,
-            # mmap_path=None
-            # if mmap_dir is None
-            # else os.path.join(mmap_dir, "emb_mmap.npy"),
-            # flush_size=128,
+    writer, start = None, 0
+    if mmap_dir is not None:
+        os.makedirs(mmap_dir, exist_ok=True)
+        mmap_path = os.path.join(mmap_dir, "emb_mmap.npy")
+        checkpoint_path = os.path.join(mmap_dir, "emb_checkpoint.yaml")
+        if encoder_id is None:
+            encoder_id = repr(
+                [_callable_id(fn) for fn in (encode, preprocess, collate)]
+            )
+        fingerprint = _input_fingerprint(col, encoder_id)
+        checkpoint = _load_checkpoint(
+            checkpoint_path, key=key, length=len(col), fingerprint=fingerprint
+        )
+        if checkpoint is not None and os.path.exists(mmap_path):
+            writer = NumpyMemmapWriter(
+                path=mmap_path, mode="r+", shape=tuple(checkpoint["shape"])
+            )
+            writer._pointer = start = checkpoint["completed"]
+
+    batches = embed_input[start:].batch(batch_size=batch_size, num_workers=num_workers)
+    outs = []
+    with torch.no_grad(), tqdm(
+        total=math.ceil(len(col) / batch_size),
+        initial=start // batch_size,
+        disable=not pbar,
+    ) as progress:
+        for batch in _prefetch(batches, size=prefetch):
+            out = _encode(batch)
+            if mmap_dir is None:
+                outs.append(out)
+            else:
+                if not isinstance(out, np.ndarray):
+                    raise ValueError(
+                        "Can only write embeddings to `mmap_dir` if the encoder "
+                        f"returns tensors or arrays, not {type(out)}."
+                    )
+                if writer is None:
+                    writer = NumpyMemmapWriter(
+                        path=mmap_path,
+                        mode="w+",
+                        dtype=out.dtype,
+                        shape=(len(col), *out.shape[1:]),
+                    )
+                writer.write(out)
+                writer.flush()
+                # write the checkpoint atomically, so that an interrupted run
+                # never leaves a partial one behind
+                dump_yaml(
+                    {
+                        "key": key,
+                        "length": len(col),
+                        "fingerprint": fingerprint,
+                        "shape": list(writer.shape),
+                        "completed": writer._pointer,
+                    },
+                    f"{checkpoint_path}.tmp",
+                )
+                os.replace(f"{checkpoint_path}.tmp", checkpoint_path)
+            progress.update()
+
+    if mmap_dir is None:
+        return mk.concat([mk.column(out) for out in outs])
+    return writer.finalize()
+
+
+def _embed_cached(
+    col: mk.Column, keys: List[Optional[str]], cache: EmbeddingCache, **kwargs
+):
+    """Embed ``col`` with :func:`_embed`, reading the embeddings of the rows
+    with ``keys`` that are in ``cache`` from it and writing the others to it."""
+    from meerkat.writers.numpy_writer import NumpyMemmapWriter
+
+    cached = cache.get_many(keys)
+    missing = [i for i, value in enumerate(cached) if value is None]
+
+    if missing:
+        out = _embed(col=col if len(missing) == len(col) else col[missing], **kwargs)
+        if not isinstance(out, mk.NumPyTensorColumn):
+            # the encoder does not return arrays, so they can't be cached
+            return out
+        cache.put_many(
+            [keys[i] for i in missing if keys[i] is not None],
+            [row for i, row in zip(missing, out.data) if keys[i] is not None],
         )
-    return out
+        if len(missing) == len(col):
+            return out
+        for i, row in zip(missing, out.data):
+            cached[i] = row
+
+    if kwargs["mmap_dir"] is None:
+        return mk.NumPyTensorColumn(np.stack(cached))
+    writer = NumpyMemmapWriter(
+        path=os.path.join(kwargs["mmap_dir"], "emb_mmap_cached.npy"),
+        mode="w+",
+        dtype=cached[0].dtype,
+        shape=(len(cached), *cached[0].shape),
+    )
+    writer.write(np.stack(cached))
+    return writer.finalize()
+
+
+def _load_checkpoint(
+    path: str, key: str, length: int, fingerprint: Optional[str]
+) -> Optional[dict]:
+    if fingerprint is None or not os.path.exists(path):
+        return None
+    checkpoint = load_yaml(path)
+    if (
+        checkpoint["key"] != key
+        or checkpoint["length"] != length
+        or checkpoint.get("fingerprint") != fingerprint
+    ):
+        return None
+    return checkpoint
+
+
+def _input_fingerprint(col: mk.Column, encoder_id: str) -> Optional[str]:
+    """Hash the rows of ``col`` and the encoder identified by ``encoder_id``, or
+    return None if some row cannot be keyed."""
+    keys = row_keys(col, encoder_id)
+    if any(key is None for key in keys):
+        return None
+    return hashlib.blake2b("\n".join(keys).encode(), digest_size=20).hexdigest()
+
+
+def _callable_id(fn: Optional[Callable]) -> Optional[str]:
+    if fn is None:
+        return None
+    qualname = getattr(fn, "__qualname__", type(fn).__qualname__)
+    return f"{getattr(fn, '__module__', None)}.{qualname}"
+
+
+def _prefetch(iterable: Iterable, size: int = 2) -> Iterator:
+    """Iterate over ``iterable`` on a background thread, staying up to ``size``
+    items ahead of the consumer."""
+    if size <= 0:
+        yield from iterable
+        return
+
+    done = object()
+    items = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def _produce():
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    return
+                items.put((item, None))
+            items.put((done, None))
+        except BaseException as e:
+            items.put((done, e))
+
+    thread = threading.Thread(target=_produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+        # unblock the producer if it is waiting on a full queue
+        while thread.is_alive():
+            try:
+                items.get(timeout=0.1)
+            except queue.Empty:
+                pass
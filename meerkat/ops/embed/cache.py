@@ -0,0 +1,201 @@
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+import meerkat as mk
+from meerkat.tools.lazy_loader import LazyLoader
+
+torch = LazyLoader("torch")
+
+
+class EmbeddingCache:
+    """An on-disk store of embeddings that is shared across ``mk.embed`` calls,
+    processes and notebooks, with a budget on the number of bytes stored.
+
+    Embeddings are content-addressed: each is keyed by a hash of the encoder that
+    computed it (see :func:`encoder_key`) and of the row it was computed for (see
+    :func:`row_keys`). Rows loaded from files are keyed by the path,
+    modification time and size of the file, and other rows by their contents, so
+    the same image embedded in two different DataFrames is only encoded once.
+
+    The store is a SQLite database at ``path``. When it grows beyond ``max_bytes``,
+    the least recently used embeddings are evicted.
+
+    Args:
+        path (str): The path to the database. If it is a directory, the database
+            is created in it.
+        max_bytes (int): The maximum number of bytes of embeddings to store.
+            Defaults to 16 GiB.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 2**34):
+        if os.path.isdir(path) or not os.path.splitext(path)[1]:
+            os.makedirs(path, exist_ok=True)
+            path = os.path.join(path, "embeddings.sqlite")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, data BLOB, dtype TEXT, shape TEXT, "
+                "nbytes INTEGER, last_access REAL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_access "
+                "ON embeddings (last_access)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # the database may be shared by several processes, so writers wait for
+        # each other rather than failing
+        return sqlite3.connect(self.path, timeout=60)
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of embeddings stored."""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COALESCE(SUM(nbytes), 0) FROM embeddings"
+            ).fetchone()[0]
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Get the embeddings stored under ``keys``, with None for the keys that
+        have none."""
+        found = {}
+        with self._lock, self._connect() as conn:
+            # SQLite limits the number of parameters in a query
+            for start in range(0, len(keys), 512):
+                chunk = list(keys[start : start + 512])
+                rows = conn.execute(
+                    "SELECT key, data, dtype, shape FROM embeddings WHERE key IN "
+                    f"({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, data, dtype, shape in rows:
+                    shape = tuple(int(dim) for dim in shape.split(",") if dim)
+                    found[key] = np.frombuffer(data, dtype=dtype).reshape(shape)
+            conn.executemany(
+                "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                [(time.time(), key) for key in found],
+            )
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return [found.get(key) for key in keys]
+
+    def put_many(self, keys: Sequence[str], values: Sequence[np.ndarray]):
+        """Store ``values`` under ``keys``, evicting the least recently used
+        embeddings if the store grows beyond ``max_bytes``."""
+        now = time.time()
+        rows = []
+        for key, value in zip(keys, values):
+            value = np.ascontiguousarray(value)
+            rows.append(
+                (
+                    key,
+                    value.tobytes(),
+                    value.dtype.str,
+                    ",".join(str(dim) for dim in value.shape),
+                    value.nbytes,
+                    now,
+                )
+            )
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        excess = (
+            conn.execute("SELECT COALESCE(SUM(nbytes), 0) FROM embeddings").fetchone()[
+                0
+            ]
+            - self.max_bytes
+        )
+        if excess <= 0:
+            return
+        evicted, freed = [], 0
+        for key, nbytes in conn.execute(
+            "SELECT key, nbytes FROM embeddings ORDER BY last_access"
+        ):
+            if freed >= excess:
+                break
+            evicted.append((key,))
+            freed += nbytes
+        conn.executemany("DELETE FROM embeddings WHERE key = ?", evicted)
+
+    def clear(self):
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM embeddings")
+
+
+def encoder_key(encoder: str, modality: str, **kwargs) -> str:
+    """Build the part of the cache keys that identifies an encoder from the
+    registry, the modality it encodes and the keyword arguments it was built
+    with."""
+    return repr((encoder, modality, sorted(kwargs.items())))
+
+
+def row_keys(col: mk.Column, encoder_key: str) -> List[Optional[str]]:
+    """Build the cache keys of the rows of ``col`` for the encoder identified by
+    ``encoder_key``, with None for rows that cannot be keyed."""
+    if isinstance(col, mk.FileColumn):
+        base_dir = col.base_dir
+        paths = col.data.args[0]
+        row_ids = [
+            _file_id(path if base_dir is None else os.path.join(base_dir, path))
+            for path in paths
+        ]
+    else:
+        row_ids = [_content_id(col[i]) for i in range(len(col))]
+
+    return [
+        None
+        if row_id is None
+        else hashlib.blake2b(
+            encoder_key.encode() + b"\x00" + row_id, digest_size=20
+        ).hexdigest()
+        for row_id in row_ids
+    ]
+
+
+def _file_id(path: str) -> bytes:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # e.g. a url, which is keyed by the url alone
+        return f"file:{path}".encode()
+    return f"file:{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+
+
+def _content_id(value: Any) -> Optional[bytes]:
+    if isinstance(value, str):
+        data = value.encode()
+    elif isinstance(value, bytes):
+        data = value
+    elif torch.is_tensor(value):
+        value = value.cpu().numpy()
+        data = repr((value.dtype.str, value.shape)).encode() + value.tobytes()
+    elif isinstance(value, np.ndarray):
+        data = repr((value.dtype.str, value.shape)).encode() + value.tobytes()
+    else:
+        # avoid importing PIL, which is an optional dependency
+        pil_image = sys.modules.get("PIL.Image")
+        if pil_image is None or not isinstance(value, pil_image.Image):
+            return None
+        data = repr((value.mode, value.size)).encode() + value.tobytes()
+    return b"content:" + hashlib.blake2b(data, digest_size=20).digest()
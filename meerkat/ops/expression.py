@@ -0,0 +1,262 @@
+"""Lazy column expressions that are evaluated in one fused, chunked pass.
+
+By default, every arithmetic, comparison and logical operator on a column is
+computed eagerly and allocates a full column for its result, so a chained
+expression like ``(df["a"] * 2 + df["b"]) > df["c"]`` allocates three columns
+of ``len(df)`` rows. Inside a :class:`lazy` context, the operators instead build
+an :class:`Expression` tree. The tree is evaluated chunk by chunk when it is
+materialized with :meth:`Expression.evaluate` or used to index a DataFrame, and
+the intermediates of each chunk are written into buffers that are reused across
+chunks, so only the result is allocated in full.
+
+.. code-block:: python
+
+    import meerkat as mk
+
+    with mk.lazy():
+        mask = (df["a"] * 2 + df["b"]) > df["c"]
+
+    df[mask]  # evaluated without allocating `df["a"] * 2` or `... + df["b"]`
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from meerkat.columns.abstract import Column
+
+
+_IS_LAZY_CONTEXT: List[bool] = []
+
+DEFAULT_CHUNK_SIZE = 2**16
+
+
+class lazy:
+    """A context manager and decorator inside which operators on
+    :class:`ScalarColumn` and :class:`NumPyTensorColumn` build lazy
+    :class:`Expression` objects instead of computing their results.
+
+    Operators on an :class:`Expression` are always lazy, inside the context or
+    not.
+
+    Args:
+        lazy (bool): Whether operators should be lazy. Pass False to compute
+            operators eagerly inside an enclosing lazy context. Defaults to True.
+    """
+
+    def __init__(self, lazy: bool = True):
+        self._lazy = lazy
+
+    def __call__(self, func):
+        from functools import wraps
+
+        @wraps(func)
+        def decorate_context(*args, **kwargs):
+            with self.__class__(self._lazy):
+                return func(*args, **kwargs)
+
+        return decorate_context
+
+    def __enter__(self):
+        _IS_LAZY_CONTEXT.append(self._lazy)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        _IS_LAZY_CONTEXT.pop(-1)
+
+
+def is_lazy_context() -> bool:
+    """Whether the code is in a :class:`lazy` context."""
+    return len(_IS_LAZY_CONTEXT) > 0 and _IS_LAZY_CONTEXT[-1]
+
+
+def is_lazy(*operands: Any) -> bool:
+    """Whether an operator on ``operands`` should build an :class:`Expression`.
+
+    Operators on Arrow columns with nulls are computed eagerly inside a
+    :class:`lazy` context, since NumPy has no equivalent of Arrow's nulls.
+    """
+    if any(isinstance(x, Expression) for x in operands):
+        return True
+    return is_lazy_context() and not any(_has_arrow_nulls(x) for x in operands)
+
+
+class Expression(np.lib.mixins.NDArrayOperatorsMixin):
+    """A lazy application of a NumPy ufunc to columns, scalars and other
+    expressions.
+
+    Expressions support the same operators as columns, and NumPy ufuncs (e.g.
+    ``np.sqrt(expr)``) applied to them are lazy as well.
+
+    Args:
+        ufunc (np.ufunc): The ufunc to apply.
+        operands (Tuple): The operands of the ufunc. Columns must all have the
+            same length.
+    """
+
+    def __init__(self, ufunc: np.ufunc, operands: Tuple[Any, ...]):
+        from meerkat.columns.abstract import Column
+
+        self.ufunc = ufunc
+        self.operands = tuple(operands)
+
+        lengths = {len(x) for x in self._leaves() if isinstance(x, Column)}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"Cannot apply `{ufunc.__name__}` to columns of different lengths "
+                f"{sorted(lengths)}."
+            )
+        if any(_has_arrow_nulls(x) for x in self.operands):
+            raise ValueError(
+                f"Cannot apply `{ufunc.__name__}` lazily to an ArrowScalarColumn with "
+                "nulls. Compute it eagerly inside `mk.lazy(False)` instead."
+            )
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs, **kwargs):
+        if method != "__call__" or kwargs or ufunc.nout != 1:
+            return NotImplemented
+        return Expression(ufunc, inputs)
+
+    def __len__(self) -> int:
+        from meerkat.columns.abstract import Column
+
+        for leaf in self._leaves():
+            if isinstance(leaf, Column):
+                return len(leaf)
+        raise ValueError("Expression does not reference any columns.")
+
+    def __bool__(self):
+        raise ValueError(
+            "The truth value of an Expression is ambiguous. Use `&` and `|` rather "
+            "than `and` and `or`."
+        )
+
+    def __repr__(self) -> str:
+        return f"Expression({self._repr()})"
+
+    def _repr(self) -> str:
+        from meerkat.columns.abstract import Column
+
+        operands = [
+            x._repr()
+            if isinstance(x, Expression)
+            else f"{type(x).__name__}(len={len(x)})"
+            if isinstance(x, Column)
+            else repr(x)
+            for x in self.operands
+        ]
+        return f"{self.ufunc.__name__}({', '.join(operands)})"
+
+    def _leaves(self):
+        for x in self.operands:
+            if isinstance(x, Expression):
+                yield from x._leaves()
+            else:
+                yield x
+
+    def evaluate(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> "Column":
+        """Evaluate the expression into a column.
+
+        The result is a :class:`ScalarColumn` if any of the columns in the
+        expression is a :class:`ScalarColumn`, and a :class:`NumPyTensorColumn`
+        otherwise.
+
+        Args:
+            chunk_size (int): The number of rows to evaluate at a time. Each node
+                of the expression holds a buffer of this many rows. Defaults to
+                65536.
+        """
+        from meerkat.columns.scalar import ScalarColumn
+        from meerkat.columns.tensor.numpy import NumPyTensorColumn
+
+        out = None
+        for start, stop, chunk in self._iter_chunks(chunk_size):
+            if out is None:
+                out = np.empty((len(self), *chunk.shape[1:]), dtype=chunk.dtype)
+            out[start:stop] = chunk
+        if out is None:
+            # the expression has no rows, so evaluate an empty chunk for the
+            # dtype and shape of the result
+            out = np.asarray(self._evaluate_chunk(0, 0, {}, {}))
+
+        if any(isinstance(x, ScalarColumn) for x in self._leaves()):
+            return ScalarColumn(out)
+        return NumPyTensorColumn(out)
+
+    def nonzero(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, limit: int = None
+    ) -> np.ndarray:
+        """The positions of the rows for which the expression is true, without
+        materializing the full mask.
+
+        Args:
+            chunk_size (int): The number of rows to evaluate at a time. Defaults to
+                65536.
+            limit (int, optional): Return at most the first ``limit`` positions,
+                and stop evaluating once they are found. Defaults to None.
+        """
+        positions, num_positions = [], 0
+        for start, _, chunk in self._iter_chunks(chunk_size):
+            positions.append(np.flatnonzero(chunk) + start)
+            num_positions += len(positions[-1])
+            if limit is not None and num_positions >= limit:
+                break
+        if not positions:
+            return np.array([], dtype=np.int64)
+        return np.concatenate(positions)[:limit]
+
+    def _iter_chunks(self, chunk_size: int):
+        arrays = {}
+        buffers = {}
+        length = len(self)
+        for start in range(0, length, chunk_size):
+            stop = min(start + chunk_size, length)
+            yield start, stop, self._evaluate_chunk(start, stop, arrays, buffers)
+
+    def _evaluate_chunk(
+        self, start: int, stop: int, arrays: Dict[int, Any], buffers: Dict[int, Any]
+    ) -> np.ndarray:
+        from meerkat.columns.abstract import Column
+
+        inputs = []
+        for x in self.operands:
+            if isinstance(x, Expression):
+                inputs.append(x._evaluate_chunk(start, stop, arrays, buffers))
+            elif isinstance(x, Column):
+                if id(x) not in arrays:
+                    arrays[id(x)] = _to_numpy(x)
+                inputs.append(arrays[id(x)][start:stop])
+            else:
+                inputs.append(x)
+
+        # every node writes its chunks into a buffer that is allocated on the
+        # first chunk and reused for the rest
+        buffer = buffers.get(id(self))
+        if buffer is None:
+            out = self.ufunc(*inputs)
+            if isinstance(out, np.ndarray):
+                buffers[id(self)] = np.empty(
+                    (stop - start, *out.shape[1:]), dtype=out.dtype
+                )
+            return out
+        return self.ufunc(*inputs, out=buffer[: stop - start])
+
+
+def _has_arrow_nulls(x: Any) -> bool:
+    from meerkat.columns.scalar.arrow import ArrowScalarColumn
+
+    return isinstance(x, ArrowScalarColumn) and x.data.null_count > 0
+
+
+def _to_numpy(column: "Column") -> np.ndarray:
+    from meerkat.columns.scalar.arrow import ArrowScalarColumn
+    from meerkat.columns.scalar.pandas import PandasScalarColumn
+    from meerkat.columns.tensor.numpy import NumPyTensorColumn
+
+    if isinstance(column, NumPyTensorColumn):
+        return column.data
+    if isinstance(column, PandasScalarColumn):
+        return column.data.to_numpy()
+    if isinstance(column, ArrowScalarColumn):
+        return column.data.to_numpy(zero_copy_only=False)
+    return column.to_numpy()
@@ -1,14 +1,29 @@
 import warnings
 from inspect import signature
-from typing import TYPE_CHECKING, Callable, Dict, Mapping, Sequence, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import meerkat.tools.docs as docs
 from meerkat.block.abstract import BlockView
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from meerkat.block.result_cache import ResultCache
     from meerkat.columns.abstract import Column
     from meerkat.columns.deferred.base import DeferredColumn
     from meerkat.dataframe import DataFrame
+    from meerkat.writers.abstract import AbstractWriter
 
 
 _SHARED_DOCS_ = {
@@ -113,6 +128,52 @@ _SHARED_DOCS_ = {
         pbar (bool): Show a progress bar. Defaults to False.
         """
     ),
+    "executor": docs.Arg(
+        """
+        executor (str, optional): How to parallelize the computation on a single
+            machine. If ``"process"``, the rows are split into contiguous shards that
+            are materialized by a pool of ``num_workers`` processes. This is a good
+            fit for CPU-bound functions. If ``"thread"``, each batch of
+            ``batch_size`` rows is materialized concurrently by a pool of
+            ``num_threads`` threads, which is a good fit for I/O-bound functions
+            (e.g. downloading or reading files). Outputs are returned in row order
+            either way. Defaults to None, in which case the rows are materialized
+            serially, unless a positive ``num_workers`` or ``num_threads`` is
+            passed.
+        """
+    ),
+    "num_workers": docs.Arg(
+        """
+        num_workers (int, optional): The number of worker processes to use when
+            ``executor="process"``. Defaults to None, in which case the number of
+            CPUs on the machine is used.
+        """
+    ),
+    "num_threads": docs.Arg(
+        """
+        num_threads (int, optional): The number of threads to use when
+            ``executor="thread"``. Each thread materializes a whole batch of
+            ``batch_size`` rows at a time, so rows in different batches overlap
+            but the rows of one batch are computed one after another. For I/O-bound
+            functions that are not batched, keep ``batch_size`` small (e.g. the
+            default of 1) so that every row can overlap with the others. Defaults to
+            None, in which case the default of
+            :class:`concurrent.futures.ThreadPoolExecutor` is used.
+        """
+    ),
+    "output_path": docs.Arg(
+        """
+        output_path (str, optional): A directory to write the outputs to as they are
+            computed, rather than holding them in memory. Tensor outputs are written
+            to a NumPy memmap, scalar outputs to an Arrow IPC file and object outputs
+            to a file of pickled chunks, and the returned columns are backed by
+            these files. Scalar outputs are returned as
+            :class:`ArrowScalarColumn`, and object outputs as a
+            :class:`DeferredColumn` that loads the objects when materialized. If
+            the function has multiple outputs, each is written to a subdirectory
+            named after its column. Defaults to None.
+        """
+    ),
 }
 
 
@@ -126,6 +187,7 @@ def defer(
     outputs: Union[Mapping[any, str], Sequence[str]] = None,
     output_type: Union[Mapping[str, Type["Column"]], Type["Column"]] = None,
     materialize: bool = True,
+    cache: "ResultCache" = None,
 ) -> Union["DataFrame", "DeferredColumn"]:
     """Create one or more DeferredColumns that lazily applies a function to
     each row in ${data}.
@@ -179,6 +241,9 @@ def defer(
         ${outputs}
         ${output_type}
         ${materialize}
+        cache (ResultCache, optional): A cache for the outputs of ``function``, so
+            that materializing the same rows again does not recompute them. See
+            :meth:`DeferredColumn.enable_cache`. Defaults to None.
 
     Returns:
         Union[DataFrame, DeferredColumn]: A :class:`DeferredColumn` or a
@@ -292,6 +357,8 @@ def defer(
         return_format=type(outputs) if outputs is not None else None,
         materialize_inputs=materialize,
     )
+    if cache is not None:
+        op.enable_cache(cache)
 
     block = DeferredBlock.from_block_data(data=op)
 
@@ -374,6 +441,10 @@ def map(
     num_blocks: int = 100,
     blocks_per_window: int = 10,
     pbar: bool = False,
+    executor: str = None,
+    num_workers: int = None,
+    num_threads: int = None,
+    output_path: str = None,
     **kwargs,
 ):
     """Create a new :class:`Column` or :class:`DataFrame` by applying a
@@ -428,6 +499,10 @@ def map(
         blocks_per_window (int): When using Ray, the number of blocks to process
             in a single Ray task. Defaults to 10.
         pbar (bool): Show a progress bar. Defaults to False.
+        ${executor}
+        ${num_workers}
+        ${num_threads}
+        ${output_path}
 
     Returns:
         Union[DataFrame, Column]: A :class:`Column` or a :class:`DataFrame`.
@@ -487,6 +562,10 @@ def map(
         use_ray=use_ray,
         num_blocks=num_blocks,
         blocks_per_window=blocks_per_window,
+        executor=executor,
+        num_workers=num_workers,
+        num_threads=num_threads,
+        output_path=output_path,
     )
 
 
@@ -497,6 +576,10 @@ def _materialize(
     use_ray: bool,
     num_blocks: int,
     blocks_per_window: int,
+    executor: str = None,
+    num_workers: int = None,
+    num_threads: int = None,
+    output_path: str = None,
 ):
     import logging
 
@@ -509,7 +592,8 @@ def _materialize(
     import meerkat as mk
     from meerkat.columns.abstract import column
 
-    from .concat import concat
+    if use_ray and output_path is not None:
+        raise ValueError("`output_path` is not supported with `use_ray=True`.")
 
     if use_ray:
         import ray
@@ -611,12 +695,282 @@ def _materialize(
                 f"Unsupported output type {data._output_type} with `use_ray=True`."
             )
 
+    # as with `torch.utils.data.DataLoader`, zero workers (or threads) means that
+    # the data is materialized in the main process
+    if executor is None and num_workers:
+        executor = "process"
+    elif executor is None and num_threads:
+        executor = "thread"
+
+    if executor not in (None, "process", "thread"):
+        raise ValueError(
+            f"Unsupported executor '{executor}'. Expected one of None, 'process' or "
+            "'thread'."
+        )
+
+    if executor == "process" and len(data) > 0:
+        return _materialize_process(
+            data,
+            batch_size=batch_size,
+            pbar=pbar,
+            num_workers=num_workers,
+            output_path=output_path,
+        )
+    elif executor == "thread" and len(data) > 0:
+        return _materialize_thread(
+            data,
+            batch_size=batch_size,
+            pbar=pbar,
+            num_threads=num_threads,
+            output_path=output_path,
+        )
     else:
-        result = []
-        for batch_start in tqdm(range(0, len(data), batch_size), disable=not pbar):
-            result.append(
-                data._get(
-                    slice(batch_start, batch_start + batch_size, 1), materialize=True
+        result = (
+            data._get(slice(batch_start, batch_start + batch_size, 1), materialize=True)
+            for batch_start in tqdm(range(0, len(data), batch_size), disable=not pbar)
+        )
+        return _collect(result, length=len(data), output_path=output_path)
+
+
+def _collect(
+    batches: Iterable[Union["DataFrame", "Column"]],
+    length: int,
+    output_path: str = None,
+) -> Union["DataFrame", "Column"]:
+    """Concatenate the materialized ``batches`` in memory or, if ``output_path``
+    is passed, write them to disk one at a time as they are consumed."""
+    import os
+
+    import meerkat as mk
+
+    from .concat import concat
+
+    if output_path is None:
+        return concat(list(batches))
+
+    writers = None
+    for batch in batches:
+        columns = (
+            list(batch.items()) if isinstance(batch, mk.DataFrame) else [(None, batch)]
+        )
+        if writers is None:
+            primary_key = getattr(batch, "primary_key_name", None)
+            writers = {
+                name: _open_writer(
+                    column,
+                    length=length,
+                    path=output_path
+                    if name is None
+                    else os.path.join(output_path, name),
                 )
+                for name, column in columns
+            }
+        for name, column in columns:
+            writers[name].write(
+                column.to_numpy() if isinstance(column, mk.TensorColumn) else column
             )
-        return concat(result)
+
+    if writers is None:
+        # there were no rows, so there is nothing to write
+        return concat([])
+
+    outputs = {name: writer.finalize() for name, writer in writers.items()}
+    if None in outputs:
+        return outputs[None]
+    return mk.DataFrame(outputs, primary_key=primary_key)
+
+
+def _open_writer(column: "Column", length: int, path: str) -> "AbstractWriter":
+    import os
+
+    import meerkat as mk
+
+    try:
+        writer = type(column).get_writer(mmap=True, template=column)
+    except ValueError:
+        raise ValueError(
+            f"Cannot write outputs of type `{type(column).__name__}` to "
+            "`output_path`."
+        )
+
+    if isinstance(column, mk.TensorColumn):
+        array = column.to_numpy()
+        writer.open(
+            os.path.join(path, "data.npy"),
+            array.dtype,
+            mode="w+",
+            shape=(length, *array.shape[1:]),
+        )
+    elif isinstance(column, mk.ScalarColumn):
+        writer.open(os.path.join(path, "data.arrow"))
+    else:
+        writer.open(os.path.join(path, "data.pkl"))
+    return writer
+
+
+# The data being materialized by a worker process. It is shipped once per worker by
+# `_init_process_worker` rather than once per shard.
+_WORKER_DATA = None
+
+
+def _dill_dumps(obj: object) -> bytes:
+    import io
+
+    import dill
+    import numpy as np
+
+    class Pickler(dill.Pickler):
+        def reducer_override(self, obj):
+            if isinstance(obj, np.memmap):
+                # dill tries to pickle the underlying `mmap.mmap` of memmapped
+                # arrays, so we ship their values instead
+                return np.asarray(obj).__reduce__()
+            return NotImplemented
+
+    buffer = io.BytesIO()
+    with warnings.catch_warnings():
+        # dill cannot locate some meerkat objects by reference (e.g.
+        # `meerkat.provenance` is shadowed by a function of the same name) and falls
+        # back to pickling them by value, which is fine for shipping between
+        # processes.
+        warnings.simplefilter("ignore", dill.PicklingWarning)
+        Pickler(buffer, byref=True, recurse=True).dump(obj)
+    return buffer.getvalue()
+
+
+def _init_process_worker(payload: bytes):
+    import dill
+
+    global _WORKER_DATA
+    _WORKER_DATA = dill.loads(payload)
+
+
+def _materialize_shard(start: int, stop: int, batch_size: int) -> bytes:
+    from .concat import concat
+
+    result = concat(
+        [
+            _WORKER_DATA._get(
+                slice(batch_start, min(batch_start + batch_size, stop), 1),
+                materialize=True,
+            )
+            for batch_start in range(start, stop, batch_size)
+        ]
+    )
+    # objects unpickled by value in the worker can't be pickled by reference on the
+    # way back, so the result is shipped with dill as well
+    return _dill_dumps(result)
+
+
+def _materialize_process(
+    data: Union["DataFrame", "Column"],
+    batch_size: int,
+    pbar: bool,
+    num_workers: int = None,
+    output_path: str = None,
+):
+    """Materialize ``data`` by sharding its rows across a pool of processes.
+
+    The rows are split into contiguous shards aligned to ``batch_size``, so that
+    each function call sees the same batches it would see in the serial path.
+    Shards are returned in order and concatenated per column type with
+    :func:`~meerkat.concat`, or written to ``output_path`` as they arrive. At most
+    two shards per worker are in flight, so that finished shards don't pile up
+    in memory while an earlier one is still being materialized.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    import dill
+    from tqdm import tqdm
+
+    if num_workers is None:
+        num_workers = os.cpu_count()
+
+    if num_workers < 1:
+        raise ValueError("`num_workers` must be a positive integer.")
+
+    # Use a few shards per worker so that a slow shard doesn't stall the pool.
+    num_batches = (len(data) + batch_size - 1) // batch_size
+    num_shards = min(num_batches, num_workers * 4)
+    shard_size = batch_size * ((num_batches + num_shards - 1) // num_shards)
+    starts = list(range(0, len(data), shard_size))
+    stops = [min(start + shard_size, len(data)) for start in starts]
+
+    num_workers = min(num_workers, len(starts))
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        initializer=_init_process_worker,
+        initargs=(_dill_dumps(data),),
+    ) as pool:
+        shards = _map_bounded(
+            pool,
+            _materialize_shard,
+            starts,
+            stops,
+            [batch_size] * len(starts),
+            window=2 * num_workers,
+        )
+        result = (
+            dill.loads(shard)
+            for shard in tqdm(shards, total=len(starts), disable=not pbar)
+        )
+        return _collect(result, length=len(data), output_path=output_path)
+
+
+def _materialize_thread(
+    data: Union["DataFrame", "Column"],
+    batch_size: int,
+    pbar: bool,
+    num_threads: int = None,
+    output_path: str = None,
+):
+    """Materialize ``data`` by fanning its batches out across a pool of threads.
+
+    Each batch goes through the same ``_get`` path as in the serial loop, so the
+    ``return_format`` handling of the underlying :class:`DeferredOp` is unchanged.
+    Batches are returned in order, with at most two batches per thread in flight.
+    """
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    from tqdm import tqdm
+
+    def _get_batch(batch_start: int):
+        return data._get(
+            slice(batch_start, batch_start + batch_size, 1), materialize=True
+        )
+
+    if num_threads is None:
+        # the default of `ThreadPoolExecutor`
+        num_threads = min(32, (os.cpu_count() or 1) + 4)
+
+    starts = range(0, len(data), batch_size)
+    with ThreadPoolExecutor(max_workers=num_threads) as pool:
+        result = tqdm(
+            _map_bounded(pool, _get_batch, starts, window=2 * num_threads),
+            total=len(starts),
+            disable=not pbar,
+        )
+        return _collect(result, length=len(data), output_path=output_path)
+
+
+def _map_bounded(
+    pool: "Executor", fn: Callable, *iterables: Iterable, window: int
+) -> Iterator:
+    """Like ``pool.map(fn, *iterables)``, but submit the next call only once the
+    results of the ones before it are consumed, with at most ``window`` calls in
+    flight."""
+    from collections import deque
+
+    pending = deque()
+    try:
+        for args in zip(*iterables):
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(pool.submit(fn, *args))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
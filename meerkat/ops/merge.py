@@ -1,17 +1,26 @@
 import collections.abc
-from typing import List, Sequence, Union
+from typing import List, Sequence, Tuple, Union
 
 import numpy as np
+import pandas as pd
+import pyarrow as pa
 
 from meerkat import DataFrame, ObjectColumn
+from meerkat.columns.abstract import Column
 from meerkat.columns.deferred.base import DeferredColumn
 from meerkat.columns.scalar import ScalarColumn
+from meerkat.columns.scalar.arrow import ArrowScalarColumn
+from meerkat.columns.scalar.pandas import PandasScalarColumn
 from meerkat.columns.tensor.abstract import TensorColumn
+from meerkat.columns.tensor.numpy import NumPyTensorColumn
 from meerkat.columns.tensor.torch import TorchTensorColumn
 from meerkat.errors import MergeError
 from meerkat.interactive.graph import reactive
 from meerkat.ops.decorators import check_primary_key
 from meerkat.provenance import capture_provenance
+from meerkat.tools.lazy_loader import LazyLoader
+
+torch = LazyLoader("torch")
 
 
 @capture_provenance(capture_args=["left_on", "on", "right_on", "how"])
@@ -82,39 +91,35 @@ def merge(
     _check_merge_columns(left, left_on)
     _check_merge_columns(right, right_on)
 
-    # convert mk.DataFrame to pd.DataFrame so we can apply Pandas merge
-    # (1) only include columns we are joining on
-    left_df = left[left_on].to_pandas()
-    right_df = right[right_on].to_pandas()
-    # (2) add index columns, which we'll use to reconstruct the columns we excluded from
-    # the Pandas merge
-    if ("__right_indices__" in right_df) or ("__left_indices__" in left_df):
-        raise MergeError(
-            "The column names '__right_indices__' and '__left_indices__' cannot appear "
-            "in the right and left panels respectively. They are used by merge."
-        )
-    left_df["__left_indices__"] = np.arange(len(left_df))
-    right_df["__right_indices__"] = np.arange(len(right_df))
-
-    # apply pandas merge
-    merged_df = left_df.merge(
-        right_df,
-        how=how,
-        left_on=left_on,
-        right_on=right_on,
-        sort=sort,
-        validate=validate,
-        suffixes=suffixes,
+    if how not in ("inner", "outer", "left", "right"):
+        raise ValueError(f"Invalid merge type `{how}`.")
+
+    # factorize the join keys of both panels into a shared space of integer codes,
+    # then compute the row indices of the join directly from the codes
+    left_codes, right_codes, num_codes = _factorize_keys(
+        [left[name] for name in left_on], [right[name] for name in right_on]
     )
-    left_indices = merged_df.pop("__left_indices__").values
-    right_indices = merged_df.pop("__right_indices__").values
-    merged_df = merged_df[list(set(left_on) & set(right_on))]
+    _validate_keys(left_codes, right_codes, num_codes, validate)
+    left_indices, right_indices = _join_indices(
+        left_codes, right_codes, num_codes, how=how
+    )
+
+    if sort:
+        # codes are assigned in sorted key order, so sorting the codes sorts the keys
+        # gather from each side only where it has a row, since a side with no
+        # rows has no codes to gather from
+        codes = np.empty(len(left_indices), dtype=left_codes.dtype)
+        from_left = left_indices >= 0
+        codes[from_left] = left_codes[left_indices[from_left]]
+        codes[~from_left] = right_codes[right_indices[~from_left]]
+        order = np.argsort(codes, kind="stable")
+        left_indices, right_indices = left_indices[order], right_indices[order]
 
     # reconstruct other columns not in the `left_on & right_on` using `left_indices`
     # and `right_indices`, the row order returned by merge
     def _cols_to_construct(df: DataFrame):
-        # don't construct columns in both `left_on` and `right_on` because we use
-        # `merged_df` for these
+        # don't construct columns in both `left_on` and `right_on` because we
+        # construct these from both panels below
         return [k for k in df.keys() if k not in (set(left_on) & set(right_on))]
 
     left_cols_to_construct = _cols_to_construct(left)
@@ -145,57 +150,246 @@ def merge(
     else:
         merged = None
 
+    # add columns in both `left_on` and `right_on`, casting to the column type in
+    # left and filling in the keys of rows missing from left with those in right
+    shared_on = [name for name in left_on if name in right_on]
+    key_columns = {
+        name: _construct_key(left[name], right[name], left_indices, right_indices)
+        for name in shared_on
+    }
     if merged is not None:
-        # add columns in both `left_on` and `right_on`,
-        # casting to the column type in left
-        for name, column in merged_df.items():
-            merged.add_column(name, left[name]._clone(data=column.values))
+        for name, column in key_columns.items():
+            merged.add_column(name, column)
             merged.data.reorder(merged.columns[-1:] + merged.columns[:-1])
     else:
-        merged = DataFrame.from_pandas(merged_df)
+        merged = DataFrame(key_columns)
 
     # set primary key if either the `left` or `right` has a primary key in the result
-    # note, the `check_primary_key` wrapper wrapper ensures that the primary_key is
-    # actually valid
-    if (left.primary_key_name is not None) and left.primary_key_name in merged:
-        merged.set_primary_key(left.primary_key_name, inplace=True)
-    elif (right.primary_key_name is not None) and right.primary_key_name in merged:
-        merged.set_primary_key(right.primary_key_name, inplace=True)
+    # that is still valid, e.g. many-to-many merges duplicate the keys of both panels
+    for df in (left, right):
+        name = df.primary_key_name
+        if name is not None and name in merged and merged[name]._is_valid_primary_key():
+            merged.set_primary_key(name, inplace=True)
+            break
 
     return merged
 
 
-def _construct_from_indices(df: DataFrame, indices: np.ndarray):
-    if np.isnan(indices).any():
-        # when performing "outer", "left", and "right" merges, column indices output
-        # by pandas merge can include `nan` in rows corresponding to merge keys that
-        # only appear in one of the two panels. For these columns, we convert the
-        # column to  ListColumn, and fill with "None" wherever indices is "nan".
-        data = {}
-        for name, col in df.items():
-            if isinstance(col, (TorchTensorColumn, TorchTensorColumn, ScalarColumn)):
-                new_col = col[indices.astype(int)]
-
-                if isinstance(new_col, TorchTensorColumn):
-                    new_col = new_col.to(float)
-                elif isinstance(new_col, ScalarColumn):
-                    if new_col.dtype != "object":
-                        new_col = new_col.astype(float)
-                else:
-                    new_col = new_col.astype(float)
-
-                new_col[np.isnan(indices)] = np.nan
-                data[name] = new_col
-            else:
-                data[name] = ObjectColumn(
-                    [None if np.isnan(index) else col[int(index)] for index in indices]
-                )
-        return df._clone(data=data)
+def _factorize_keys(
+    left_columns: List[Column], right_columns: List[Column]
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Map the join keys of the left and right panels to integer codes, such
+    that two rows share a code if and only if they share a key.
+
+    Codes are assigned in sorted key order, so sorting by code sorts by key.
+    Returns the left codes, the right codes and the number of distinct codes.
+    """
+    left_codes = np.zeros(len(left_columns[0]), dtype=np.int64)
+    right_codes = np.zeros(len(right_columns[0]), dtype=np.int64)
+    num_codes = 1
+    for left_column, right_column in zip(left_columns, right_columns):
+        # the hash table is built once over the keys of both panels, and `nan`s are
+        # treated as regular keys (i.e. they match each other) like in pandas
+        codes, uniques = pd.factorize(
+            np.concatenate([_key_values(left_column), _key_values(right_column)]),
+            sort=True,
+            use_na_sentinel=False,
+        )
+        if num_codes * len(uniques) >= np.iinfo(np.int64).max:
+            # compress the codes of the previous key columns to avoid overflow
+            codes_so_far, uniques_so_far = pd.factorize(
+                np.concatenate([left_codes, right_codes]), sort=True
+            )
+            left_codes = codes_so_far[: len(left_codes)]
+            right_codes = codes_so_far[len(left_codes) :]
+            num_codes = len(uniques_so_far)
+        left_codes = left_codes * len(uniques) + codes[: len(left_codes)]
+        right_codes = right_codes * len(uniques) + codes[len(left_codes) :]
+        num_codes *= len(uniques)
+
+    if len(left_columns) > 1:
+        # the combined codes are sparse, compress them so they can be counted
+        codes, uniques = pd.factorize(
+            np.concatenate([left_codes, right_codes]), sort=True
+        )
+        left_codes, right_codes = codes[: len(left_codes)], codes[len(left_codes) :]
+        num_codes = len(uniques)
+    return left_codes, right_codes, num_codes
+
+
+def _key_values(column: Column) -> np.ndarray:
+    if isinstance(column, ObjectColumn):
+        # avoid `np.array`, which would broadcast hashable sequences (e.g. tuples)
+        return np.fromiter(column.data, dtype=object, count=len(column))
+    elif isinstance(column, ArrowScalarColumn) and isinstance(column.data, pa.Array):
+        return column.data.to_numpy(zero_copy_only=False)
+    return column.to_numpy()
+
+
+def _validate_keys(
+    left_codes: np.ndarray, right_codes: np.ndarray, num_codes: int, validate: str
+):
+    if validate is None or validate in ("many_to_many", "m:m"):
+        return
+    elif validate in ("one_to_one", "1:1"):
+        check_left, check_right, kind = True, True, "one-to-one"
+    elif validate in ("one_to_many", "1:m"):
+        check_left, check_right, kind = True, False, "one-to-many"
+    elif validate in ("many_to_one", "m:1"):
+        check_left, check_right, kind = False, True, "many-to-one"
     else:
-        # if there are no `nan`s in the indices, then we can just lazy index the
-        # original column
+        raise ValueError(f"`{validate}` is not a valid argument for `validate`.")
+
+    if check_left and (np.bincount(left_codes, minlength=num_codes) > 1).any():
+        raise MergeError(
+            f"Merge keys are not unique in left dataset; not a {kind} merge."
+        )
+    if check_right and (np.bincount(right_codes, minlength=num_codes) > 1).any():
+        raise MergeError(
+            f"Merge keys are not unique in right dataset; not a {kind} merge."
+        )
+
+
+def _join_indices(
+    left_codes: np.ndarray, right_codes: np.ndarray, num_codes: int, how: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the row indices into the left and right panels of each row in
+    the merged DataFrame. Rows that are missing from one of the panels are
+    marked with index -1.
+
+    Inner merges preserve the order of the left keys, left and right merges
+    preserve the order of the left and right panels respectively, and outer
+    merges order the rows of the left panel before the unmatched rows of the
+    right panel.
+    """
+    if how == "inner":
+        # build the table on the smaller panel, and probe it with the larger one
+        if len(left_codes) < len(right_codes):
+            right_indices, left_indices = _probe(left_codes, right_codes, num_codes)
+            order = np.argsort(left_indices, kind="stable")
+            return left_indices[order], right_indices[order]
+        return _probe(right_codes, left_codes, num_codes)
+    elif how == "right":
+        right_indices, left_indices = _probe(
+            left_codes, right_codes, num_codes, keep_unmatched=True
+        )
+        return left_indices, right_indices
+
+    left_indices, right_indices = _probe(
+        right_codes, left_codes, num_codes, keep_unmatched=True
+    )
+    if how == "outer":
+        unmatched = np.where(
+            np.bincount(left_codes, minlength=num_codes)[right_codes] == 0
+        )[0]
+        left_indices = np.concatenate(
+            [left_indices, np.full(len(unmatched), -1, dtype=np.int64)]
+        )
+        right_indices = np.concatenate([right_indices, unmatched])
+    return left_indices, right_indices
+
+
+def _probe(
+    build_codes: np.ndarray,
+    probe_codes: np.ndarray,
+    num_codes: int,
+    keep_unmatched: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Match every row in the probe panel with the rows in the build panel
+    that share its key. Returns the probe indices and build indices of the
+    matches, in the order of the probe panel.
+
+    The table maps each code to the run of build rows with that code in a
+    (stable) sort of the build codes, so all matches are gathered at once.
+    """
+    counts = np.bincount(build_codes, minlength=num_codes)
+    starts = np.cumsum(counts) - counts
+    build_order = np.argsort(build_codes, kind="stable")
+
+    num_matches = counts[probe_codes]
+    num_rows = np.maximum(num_matches, 1) if keep_unmatched else num_matches
+    probe_indices = np.repeat(np.arange(len(probe_codes)), num_rows)
+
+    # the offset of each output row within the run of rows for its probe row
+    offsets = np.arange(len(probe_indices)) - np.repeat(
+        np.cumsum(num_rows) - num_rows, num_rows
+    )
+    matched = np.repeat(num_matches > 0, num_rows)
+    build_indices = np.full(len(probe_indices), -1, dtype=np.int64)
+    build_indices[matched] = build_order[
+        np.repeat(starts[probe_codes], num_rows)[matched] + offsets[matched]
+    ]
+    return probe_indices, build_indices
+
+
+def _construct_key(
+    left_column: Column,
+    right_column: Column,
+    left_indices: np.ndarray,
+    right_indices: np.ndarray,
+) -> Column:
+    missing = left_indices < 0
+    if not missing.any():
+        return left_column[left_indices]
+    left_values, right_values = _key_values(left_column), _key_values(right_column)
+    try:
+        # e.g. so that longer strings from the right are not truncated
+        dtype = np.result_type(left_values.dtype, right_values.dtype)
+    except TypeError:
+        dtype = object
+    values = np.empty(len(left_indices), dtype=dtype)
+    values[~missing] = left_values[left_indices[~missing]]
+    values[missing] = right_values[right_indices[missing]]
+    return left_column._clone(data=values)
+
+
+def _construct_from_indices(df: DataFrame, indices: np.ndarray):
+    missing = indices < 0
+    if not missing.any():
+        # if there are no missing rows, then we can just lazy index the original
+        # column
         return df[indices]
 
+    # when performing "outer", "left", and "right" merges, rows corresponding to merge
+    # keys that only appear in one of the two panels are missing from the other. We
+    # fill these with nulls, using the null representation of each column's backend
+    return df._clone(
+        data={name: _take_with_nulls(col, indices, missing) for name, col in df.items()}
+    )
+
+
+def _take_with_nulls(col: Column, indices: np.ndarray, missing: np.ndarray) -> Column:
+    if isinstance(col, ArrowScalarColumn):
+        # arrow supports null indices natively, and preserves the type of the column
+        return col._clone(data=col.data.take(pa.array(indices, mask=missing)))
+    elif isinstance(col, PandasScalarColumn):
+        # extension arrays fill with their own missing value, numpy arrays are cast
+        # to a dtype that can hold `nan` (e.g. int64 -> float64)
+        data = col.data.array if col.data.dtype.kind == "O" else col.data.values
+        return col._clone(
+            data=pd.Series(pd.api.extensions.take(data, indices, allow_fill=True))
+        )
+    elif isinstance(col, NumPyTensorColumn):
+        return col._clone(
+            data=pd.api.extensions.take(col.data, indices, allow_fill=True)
+        )
+    elif isinstance(col, TorchTensorColumn):
+        data = col.data[torch.as_tensor(np.where(missing, 0, indices))].to(float)
+        data[torch.as_tensor(missing)] = np.nan
+        return col._clone(data=data)
+    elif isinstance(col, ObjectColumn):
+        # index -1 selects the trailing `None`
+        values = np.fromiter(col.data, dtype=object, count=len(col))
+        return col._clone(data=list(np.append(values, None)[indices]))
+
+    # columns without a representation for nulls (e.g. deferred columns) are
+    # materialized into an ObjectColumn, with `None` in the missing rows
+    values = np.full(len(indices), None, dtype=object)
+    values[np.where(~missing)[0]] = np.fromiter(
+        col[indices[~missing]], dtype=object, count=int((~missing).sum())
+    )
+    return ObjectColumn(values)
+
 
 def _check_merge_columns(df: DataFrame, on: List[str]):
     for name in on:
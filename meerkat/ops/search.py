@@ -1,8 +1,9 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Tuple, Union
 
 import numpy as np
 
 from meerkat import DataFrame, NumPyTensorColumn, TensorColumn, TorchTensorColumn
+from meerkat.block.vector_index import METRICS, flat_search
 from meerkat.tools.lazy_loader import LazyLoader
 
 torch = LazyLoader("torch")
@@ -17,64 +18,103 @@ def search(
     by: str = None,
     k: int = None,
     metric: str = "dot",
-) -> DataFrame:
-    """Compute a sort a DataFrame. If a DataFrame, sort by the values in the
-    specified columns. Similar to ``sort_values`` in pandas.
+    use_index: bool = True,
+) -> Union[DataFrame, List[DataFrame]]:
+    """Find the rows of a DataFrame whose embeddings in column ``by`` are most
+    similar to ``query``.
+
+    If the column has a vector index (see
+    :meth:`~meerkat.TensorColumn.create_vector_index`) with a matching ``metric``,
+    the index is used to answer the query. Otherwise, the whole column is scanned.
 
     Args:
-        data (Union[DataFrame, AbstractColumn]): DataFrame or Column to sort.
-        by (Union[str, List[str]]): The columns to sort by. Ignored if data is a Column.
-        ascending (Union[bool, List[bool]]): Whether to sort in ascending or
-            descending order. If a list, must be the same length as `by`.Defaults
-            to True.
-        kind (str): The kind of sort to use. Defaults to 'quicksort'. Options
-            include 'quicksort', 'mergesort', 'heapsort', 'stable'.
+        data (DataFrame): The DataFrame to search.
+        query (np.ndarray): A query vector, or a batch of query vectors with shape
+            ``(num_queries, dim)``.
+        by (str): The name of a two-dimensional TensorColumn holding the
+            embeddings to search.
+        k (int, optional): The number of rows to return per query. Defaults to
+            None, in which case all of the rows are ranked. An index is only used
+            when ``k`` is passed.
+        metric (str): The similarity metric, one of "dot", "cosine" or "l2".
+            Defaults to "dot".
+        use_index (bool): Whether to use the column's vector index, if it has one.
+            Defaults to True.
 
     Return:
-        DataFrame: A sorted view of DataFrame.
+        Union[DataFrame, List[DataFrame]]: A view of the ``k`` most similar rows,
+            most similar first. For a batch of queries, a list with one view per
+            query.
     """
-    by = data[by]
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric `{metric}`, expected one of {METRICS}.")
 
+    by = data[by]
     if not isinstance(by, TensorColumn):
-        raise ValueError("")
+        raise ValueError(f"Can only search on a TensorColumn, not {type(by)}.")
+
+    if not torch.is_tensor(query):
+        query = np.asarray(query)
+
+    is_batch = len(query.shape) > 1
+    k = len(by) if k is None else min(k, len(by))
+    index = by.vector_index if use_index else None
 
-    # convert query to same backend as by
-    if isinstance(by, TorchTensorColumn):
-        import torch
+    if index is not None and index.metric == metric and k < len(by):
+        if torch.is_tensor(query):
+            query = query.detach().cpu().numpy()
+        _, indices = index.search(query, k=k)
 
+    elif isinstance(by, TorchTensorColumn):
         if not torch.is_tensor(query):
             query = torch.tensor(query)
-
-        fn = _torch_search
+        _, indices = _torch_search(query=query, by=by.data, metric=metric, k=k)
+        indices = indices.cpu().numpy()
 
     elif isinstance(by, NumPyTensorColumn):
         if torch.is_tensor(query):
             query = query.detach().cpu().numpy()
-        elif not isinstance(query, np.ndarray):
-            query = np.array(query)
-
-        fn = _numpy_search
+        _, indices = _numpy_search(query=query, by=by.data, metric=metric, k=k)
     else:
-        raise ValueError("")
+        raise ValueError(f"Cannot search on a column of type {type(by)}.")
 
-    _, indices = fn(query=query, by=by.data, metric=metric, k=k)
-    return data[indices]
+    # approximate indices mark missing matches with -1
+    results = [data[row[row >= 0]] for row in indices]
+    return results if is_batch else results[0]
 
 
 def _torch_search(
     query: "torch.Tensor", by: "torch.Tensor", metric: str, k: int
-) -> "torch.Tensor":
+) -> Tuple["torch.Tensor", "torch.Tensor"]:
     if len(query.shape) == 1:
         query = query.unsqueeze(0)
 
+    if not torch.is_floating_point(by):
+        by = by.float()
+    query = query.to(device=by.device, dtype=by.dtype)
+
     if metric == "dot":
-        scores = torch.matmul(by, query.T).squeeze()
+        scores = torch.matmul(query, by.T)
+    elif metric == "cosine":
+        scores = torch.matmul(
+            torch.nn.functional.normalize(query, dim=1),
+            torch.nn.functional.normalize(by, dim=1).T,
+        )
+    elif metric == "l2":
+        scores = -torch.cdist(query, by) ** 2
     else:
-        raise ValueError("")
+        raise ValueError(f"Unknown metric `{metric}`, expected one of {METRICS}.")
 
-    scores, indices = torch.topk(scores, k=k)
+    scores, indices = torch.topk(scores, k=k, dim=1)
     return scores, indices
 
 
-def _numpy_search(query: "torch.Tensor", by: "torch.Tensor", metric: str, k: int):
-    raise NotImplementedError()
+def _numpy_search(
+    query: np.ndarray, by: np.ndarray, metric: str, k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    return flat_search(
+        by.astype(np.float32, copy=False),
+        np.atleast_2d(query).astype(np.float32, copy=False),
+        k=k,
+        metric=metric,
+    )
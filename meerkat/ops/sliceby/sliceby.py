@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import warnings
 from functools import wraps
 from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
 
 import numpy as np
-
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from meerkat.columns.abstract import Column
+from meerkat.columns.scalar import ScalarColumn
+from meerkat.columns.scalar.arrow import ArrowScalarColumn
+from meerkat.columns.scalar.pandas import PandasScalarColumn
+from meerkat.columns.tensor.numpy import NumPyTensorColumn
+from meerkat.columns.tensor.torch import TorchTensorColumn
 from meerkat.dataframe import DataFrame
 from meerkat.interactive.graph.reactivity import reactive
+from meerkat.mixins.aggregate import AggregationError
 from meerkat.mixins.identifiable import IdentifiableMixin
 
 
@@ -52,23 +63,38 @@ class SliceBy(IdentifiableMixin):
 
         # self.gui = SliceByGUI(self)
         self.slice = SliceIndexer(self)
+        self._segments_cache = None
 
     def __len__(self) -> int:
         return len(self.slices)
 
     def mean(self, *args, **kwargs) -> DataFrame:
-        return self._aggregate(lambda x: x.mean(*args, **kwargs))
+        return self._reduce("mean", *args, **kwargs)
 
     @sets_only
     def count(self, *args, **kwargs) -> DataFrame:
-        return self._aggregate(lambda x: len(x))
+        return self._reduce("count")
 
     @sets_only
     def median(self, *args, **kwargs) -> DataFrame:
-        return self._aggregate(lambda x: x.median(*args, **kwargs))
+        return self._reduce("median", *args, **kwargs)
+
+    @sets_only
+    def sum(self, *args, **kwargs) -> DataFrame:
+        return self._reduce("sum", *args, **kwargs)
+
+    @sets_only
+    def min(self, *args, **kwargs) -> DataFrame:
+        return self._reduce("min", *args, **kwargs)
+
+    @sets_only
+    def max(self, *args, **kwargs) -> DataFrame:
+        return self._reduce("max", *args, **kwargs)
 
     @sets_only
-    def aggregate(self, function: Callable, accepts_df: bool = False) -> DataFrame:
+    def aggregate(
+        self, function: Union[Callable, str], accepts_df: bool = False
+    ) -> DataFrame:
         """_summary_
 
         Args:
@@ -78,6 +104,11 @@ class SliceBy(IdentifiableMixin):
         Returns:
             DataFrame: _description_
         """
+        if isinstance(function, str) and not accepts_df:
+            # built-in aggregations (e.g. "mean") are vectorized across slices
+            if function not in ["mean", "count", "median", "sum", "min", "max"]:
+                raise ValueError(f"{function} is not a valid aggregation")
+            return self._reduce(function)
         return self._aggregate(f=function, accepts_df=accepts_df)
 
     @property
@@ -90,8 +121,8 @@ class SliceBy(IdentifiableMixin):
         # means will be a list of dictionaries where each element in the dict
         out = []
 
-        # TODO (Sabri): This is an extremely slow way of doing this – we need to
-        # vectorize it
+        # arbitrary functions can't be vectorized, so we apply them slice by slice.
+        # Built-in reductions (e.g. `mean`) are vectorized in `_reduce`.
         for slice_key in self.slice_keys:
             if self.slice_type == "scores":
                 raise NotImplementedError
@@ -103,20 +134,94 @@ class SliceBy(IdentifiableMixin):
 
             out.append(slice_values)
 
-        from meerkat.dataframe import DataFrame
-
         # create DataFrame as a list of rows.
         out = DataFrame(out)
+        return self._add_slice_keys(out)
+
+    def _reduce(self, how: str, *args, nuisance: str = "drop", **kwargs) -> DataFrame:
+        """Apply the reduction ``how`` to every slice at once.
+
+        Instead of materializing each slice, the rows of all slices are gathered
+        into one contiguous array per column (see ``_segments``), which is reduced
+        segment-wise with NumPy. Columns that do not support a vectorized reduction
+        (e.g. non-numeric columns, or unsupported arguments) fall back to applying
+        the column's own aggregation to each slice.
+        """
+        if nuisance not in ["drop", "raise", "warn"]:
+            raise ValueError(f"{nuisance} is not a valid nuisance option")
+
+        if self.slice_type == "scores":
+            if len(self.slices) > 0:
+                raise NotImplementedError
+            return self._add_slice_keys(DataFrame())
+
+        order, starts, lengths = self._segments
+        out = {}
+        for name, column in self.data.items():
+            if name in self.by:
+                # the by columns are replaced by the slice keys
+                continue
+
+            if how == "count":
+                out[name] = lengths
+                continue
+
+            result = (
+                _segment_reduce(column, how, order, starts, lengths, **kwargs)
+                if len(args) == 0
+                else None
+            )
+            if result is None:
+                try:
+                    result = [
+                        getattr(column[self.slices[key]], how)(*args, **kwargs)
+                        for key in self.slice_keys
+                    ]
+                except AggregationError as e:
+                    if nuisance == "raise":
+                        raise e
+                    elif nuisance == "warn":
+                        warnings.warn(str(e))
+                    continue
+            out[name] = result
+
+        out = DataFrame(
+            {
+                name: ScalarColumn(result)
+                if isinstance(result, np.ndarray) and result.ndim == 1
+                else result
+                for name, result in out.items()
+            },
+            primary_key=False,
+        )
+        return self._add_slice_keys(out)
+
+    @property
+    def _segments(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The row indices of all slices, concatenated in the order of
+        ``slice_keys``, along with the start and length of each slice."""
+        if self._segments_cache is None:
+            indices = [np.asarray(self.slices[key]) for key in self.slice_keys]
+            lengths = np.array([len(idx) for idx in indices], dtype=np.int64)
+            order = (
+                np.concatenate(indices).astype(np.int64)
+                if len(indices) > 0
+                else np.zeros(0, dtype=np.int64)
+            )
+            self._segments_cache = (order, np.cumsum(lengths) - lengths, lengths)
+        return self._segments_cache
 
-        # add the by columns.
+    def _add_slice_keys(self, out: DataFrame) -> DataFrame:
+        # add the by columns. The keys are converted to columns up front, since
+        # unpacking and converting long lists of keys on assignment is slow.
         if len(self.slice_keys) > 0:
             if len(self.by) > 1:
                 columns = list(zip(*self.slice_keys))
                 for i, col in enumerate(self.by):
-                    out[col] = columns[i]
+                    out[col] = ScalarColumn(np.asarray(columns[i]))
             else:
                 col = self.by[0]
-                out[col] = self.slice_keys
+                out[col] = ScalarColumn(np.asarray(self.slice_keys))
                 out = out.set_primary_key(col)
         return out
 
@@ -148,6 +253,135 @@ class SliceBy(IdentifiableMixin):
             )
 
 
+def _segment_values(column: Column, **kwargs) -> Tuple[np.ndarray, bool]:
+    """Get the values of ``column`` as a numeric NumPy array, along with
+    whether missing values should be skipped, mirroring the semantics of the
+    column's own aggregations.
+
+    Returns ``None`` if the column (or the keyword arguments passed to the
+    aggregation) are not supported by ``_segment_reduce``.
+    """
+    if isinstance(column, NumPyTensorColumn):
+        if set(kwargs) - {"axis"} or kwargs.get("axis", None) not in (None, 0):
+            return None
+        values, skipna = np.asarray(column.data), False
+    elif isinstance(column, TorchTensorColumn):
+        if set(kwargs) - {"dim"} or kwargs.get("dim", None) not in (None, 0):
+            return None
+        values, skipna = column.to_numpy(), False
+    elif isinstance(column, PandasScalarColumn):
+        if set(kwargs) - {"skipna"} or not pd.api.types.is_numeric_dtype(
+            column.data.dtype
+        ):
+            return None
+        data = column.data
+        if data.hasnans:
+            values = data.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            values = data.to_numpy(dtype=getattr(data.dtype, "numpy_dtype", None))
+        skipna = kwargs.get("skipna", True)
+    elif isinstance(column, ArrowScalarColumn):
+        if set(kwargs) - {"skipna"} or not (
+            pa.types.is_integer(column.data.type)
+            or pa.types.is_floating(column.data.type)
+            or pa.types.is_boolean(column.data.type)
+        ):
+            return None
+        data = column.data
+        # nulls are converted to `nan`, which requires a floating point type
+        values = np.asarray(
+            pc.cast(data, pa.float64()) if data.null_count > 0 else data
+        )
+        skipna = kwargs.get("skipna", True)
+    else:
+        return None
+
+    if values.dtype.kind not in "biuf":
+        return None
+    if values.dtype.kind == "b":
+        values = values.astype(np.int64)
+    return values, skipna
+
+
+def _segment_reduce(
+    column: Column,
+    how: str,
+    order: np.ndarray,
+    starts: np.ndarray,
+    lengths: np.ndarray,
+    **kwargs,
+) -> np.ndarray:
+    """Reduce the segments ``column[order[start : start + length]]`` with one
+    vectorized pass. Returns ``None`` if the reduction can't be vectorized for
+    this column."""
+    values = _segment_values(column, **kwargs)
+    if values is None:
+        return None
+    values, skipna = values
+    # without an axis, tensor aggregations reduce over all of the elements in a slice
+    flatten = kwargs.get("axis", kwargs.get("dim", None)) is None
+    if how == "median" and values.ndim > 1:
+        return None
+
+    values = values[order]
+    if flatten and values.ndim > 1:
+        values = values.reshape(len(values), -1)
+    if len(values) == 0:
+        return np.full((len(lengths),) + values.shape[1 + flatten :], np.nan)
+
+    nonempty = lengths > 0
+    # `reduceat` can't handle empty segments, so we only reduce the nonempty ones,
+    # which are still contiguous in `values`
+    bounds = starts[nonempty]
+
+    isnan = np.isnan(values) if values.dtype.kind == "f" else None
+    if skipna and isnan is not None:
+        counts = np.add.reduceat(~isnan, bounds, axis=0)
+        filled = np.where(isnan, 0, values)
+    else:
+        counts = lengths[nonempty].reshape(-1, *([1] * (values.ndim - 1)))
+        filled = values
+
+    if how in ("sum", "mean"):
+        result = np.add.reduceat(filled, bounds, axis=0)
+        if how == "mean":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result = result / counts
+    elif how in ("min", "max"):
+        if skipna:
+            ufunc = np.fmin if how == "min" else np.fmax
+        else:
+            ufunc = np.minimum if how == "min" else np.maximum
+        result = ufunc.reduceat(values, bounds, axis=0)
+    elif how == "median":
+        segment_ids = np.repeat(np.arange(len(bounds)), lengths[nonempty])
+        # sort within each segment, `nan`s are sorted to the end of their segment
+        values = values[np.lexsort((values, segment_ids))]
+        counts = counts.reshape(-1)
+        lo = bounds + np.maximum(counts - 1, 0) // 2
+        hi = bounds + counts // 2
+        with np.errstate(invalid="ignore"):
+            result = np.where(counts > 0, (values[lo] + values[hi]) / 2, np.nan)
+        if not skipna and isnan is not None:
+            result[np.logical_or.reduceat(isnan, bounds)] = np.nan
+    else:
+        raise ValueError(f"Unsupported reduction `{how}`.")
+
+    if flatten and result.ndim > 1 and how != "median":
+        # reduce over the remaining elements of each slice
+        if how == "mean":
+            result = result.mean(axis=1)
+        else:
+            result = {"sum": np.sum, "min": np.min, "max": np.max}[how](result, axis=1)
+
+    if nonempty.all():
+        return result
+    # slices without any rows reduce to `nan`
+    out = np.full((len(lengths),) + result.shape[1:], np.nan)
+    out[nonempty] = result
+    return out
+
+
 class SliceIndexer:
     def __init__(self, obj: object):
         self.obj = obj
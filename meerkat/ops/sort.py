@@ -1,12 +1,61 @@
-from typing import List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 from meerkat import DataFrame
 from meerkat.interactive.graph import reactive
+from meerkat.ops.view_cache import view_cache
 
 
-@reactive()
+def _sort_incremental(
+    result: DataFrame,
+    delta: Dict[str, Optional[List[str]]],
+    data: DataFrame,
+    by: Union[str, List[str]] = None,
+    ascending: Union[bool, List[bool]] = True,
+    kind: str = "quicksort",
+) -> Optional[List[str]]:
+    """Update a sorted view in place when only columns that are not sorted by
+    have changed, reusing the cached sort order."""
+    # the DataFrame is named `self` when sorting with `DataFrame.sort`
+    param = "self" if "self" in delta else "data"
+    scope = delta.get(param)
+    if len(delta) != 1 or scope is None or by is None or by == None:  # noqa: E711
+        return NotImplemented
+
+    by, ascending = _normalize_by(by, ascending)
+    positions = view_cache.get(data, by, ("sort", tuple(by), tuple(ascending), kind))
+    if (
+        positions is None
+        or not set(scope).isdisjoint(by)
+        or not set(scope).issubset(data.columns)
+        or result.columns != data.columns
+        or len(result) != len(data)
+    ):
+        return NotImplemented
+
+    for name in scope:
+        result[name] = data[name][positions]
+    return scope
+
+
+def _normalize_by(
+    by: Union[str, List[str]], ascending: Union[bool, List[bool]]
+) -> Tuple[List[str], List[bool]]:
+    by = [by] if isinstance(by, str) else by
+
+    if isinstance(ascending, bool):
+        ascending = [ascending] * len(by)
+
+    if len(ascending) != len(by):
+        raise ValueError(
+            f"Length of `ascending` ({len(ascending)}) must be the same as "
+            f"length of `by` ({len(by)})."
+        )
+    return by, ascending
+
+
+@reactive(incremental_fn=_sort_incremental)
 def sort(
     data: DataFrame,
     by: Union[str, List[str]],
@@ -27,25 +76,23 @@ def sort(
 
     Return:
         DataFrame: A sorted view of DataFrame.
+
+    The sort order is cached (see :mod:`meerkat.ops.view_cache`), so sorting the
+    same DataFrame by the same columns again only gathers the rows.
     """
     # Use "==" because `by` can be a Store.
     # Store(None) == None is True, but `Store(None) is None` evalutes to False.
     if by is None or by == None:  # noqa: E711
         return data.view()
 
-    by = [by] if isinstance(by, str) else by
-
-    if isinstance(ascending, bool):
-        ascending = [ascending] * len(by)
-
-    if len(ascending) != len(by):
-        raise ValueError(
-            f"Length of `ascending` ({len(ascending)}) must be the same as "
-            f"length of `by` ({len(by)})."
-        )
-    df = data[by].to_pandas()
-    df["_sort_idx_"] = np.arange(len(df))
-    df = df.sort_values(by=by, ascending=ascending, kind=kind, inplace=False)
-    sorted_indices = df["_sort_idx_"]
+    by, ascending = _normalize_by(by, ascending)
+    spec = ("sort", tuple(by), tuple(ascending), kind)
+    sorted_indices = view_cache.get(data, by, spec)
+    if sorted_indices is None:
+        df = data[by].to_pandas()
+        df["_sort_idx_"] = np.arange(len(df))
+        df = df.sort_values(by=by, ascending=ascending, kind=kind, inplace=False)
+        sorted_indices = df["_sort_idx_"].to_numpy()
+        view_cache.put(data, by, spec, sorted_indices)
 
     return data[sorted_indices]
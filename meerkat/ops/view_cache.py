@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from meerkat.columns.abstract import Column
+    from meerkat.dataframe import DataFrame
+
+
+class ViewCache:
+    """A least-recently-used cache of the row positions selected by sorts and
+    filters, with a budget on the number of bytes held in memory.
+
+    Entries are keyed by the id of the DataFrame, the versions of the columns the
+    rows were selected by, and a hashable spec of the sort or filter. A column's
+    version changes whenever the column is replaced or its cells are set, so an
+    entry is never served for data that has changed since it was computed.
+    Entries are also dropped eagerly when a :class:`DataFrameModification` for
+    the DataFrame is issued with one of the columns in its scope.
+
+    Args:
+        max_bytes (int): The maximum number of bytes of positions to hold.
+            Defaults to 256 MiB.
+    """
+
+    def __init__(self, max_bytes: int = 2**28):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, data: "DataFrame", columns: Sequence[str], spec: Hashable
+    ) -> Optional[np.ndarray]:
+        """Get the positions cached for ``spec`` over ``columns`` of ``data``, or
+        None if there are none."""
+        key = _make_key(data, columns, spec)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        data: "DataFrame",
+        columns: Sequence[str],
+        spec: Hashable,
+        positions: np.ndarray,
+    ):
+        key = _make_key(data, columns, spec)
+        node_id = data.inode.id if data.has_inode() else None
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[0].nbytes
+            if positions.nbytes > self.max_bytes:
+                return
+            self._entries[key] = (positions, node_id)
+            self._nbytes += positions.nbytes
+            while self._nbytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+    def invalidate(self, id: str, columns: Sequence[str] = None):
+        """Drop the entries of the DataFrame (or DataFrame node) with ``id``
+        that depend on any of ``columns``, or all of its entries if ``columns``
+        is None."""
+        with self._lock:
+            for key, (positions, node_id) in list(self._entries.items()):
+                if id != key[0] and id != node_id:
+                    continue
+                if columns is None or not set(columns).isdisjoint(
+                    name for name, _ in key[1]
+                ):
+                    del self._entries[key]
+                    self._nbytes -= positions.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+def _make_key(data: "DataFrame", columns: Sequence[str], spec: Hashable) -> Tuple:
+    return (
+        data.id,
+        tuple((name, _column_version(data.data[name])) for name in columns),
+        spec,
+    )
+
+
+def _column_version(column: "Column") -> Tuple:
+    # views of a column share its block, so mutations through any view are
+    # tracked on the block
+    block = getattr(column, "_block", None)
+    return (column.id, column._version, None if block is None else block._version)
+
+
+# the cache shared by `mk.sort` and the interactive filter
+view_cache = ViewCache()
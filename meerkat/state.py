@@ -1,7 +1,7 @@
 import logging
 import os
 import subprocess
-import time
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
@@ -138,21 +138,42 @@ class Identifiables:
         return value
 
 
-@dataclass
 class ModificationQueue:
-    """A queue of modifications to be applied to a dataframe."""
+    """A queue of modifications to be applied to a dataframe.
 
-    queue: List["Modification"] = field(default_factory=list)
+    The queue is local to the current context (see :mod:`contextvars`): each
+    request to the API server runs in its own thread or task, and only sees the
+    modifications made while handling it. So endpoints that run concurrently
+    do not wait for each other to release the queue.
+    """
 
-    # Boolean attribute that controls whether the queue is accepting new
-    # modifications
-    # When _ready is False, `add` will no-op
-    _ready: bool = False
+    def __init__(self):
+        self._context: ContextVar[Optional[_QueueContext]] = ContextVar(
+            f"modification_queue_{id(self)}", default=None
+        )
+
+    def _get(self) -> "_QueueContext":
+        context = self._context.get()
+        if context is None:
+            context = _QueueContext()
+            self._context.set(context)
+        return context
+
+    @property
+    def queue(self) -> List["Modification"]:
+        return self._get().queue
+
+    @queue.setter
+    def queue(self, queue: List["Modification"]):
+        # Set a new context rather than mutating the current one, which may
+        # have been inherited from the context that spawned this one
+        self._context.set(_QueueContext(queue=queue, ready=self._get().ready))
 
     def add(self, modification: "Modification"):
-        if self._ready:
+        context = self._get()
+        if context.ready:
             logger.debug(f"Adding modification {modification} to queue.")
-            self.queue.append(modification)
+            context.queue.append(modification)
             return
         # Do nothing if not ready
         logger.debug(f"Modification queue not ready. Ignoring {modification}.")
@@ -166,28 +187,24 @@ class ModificationQueue:
 
     def ready(self):
         """Ready the queue for accepting new modifications."""
-        count = 0
-        while self._ready:
-            # Modification queue is already in use
-            # Wait for it to be unready
-            logger.debug("Modification queue is already in use. Waiting...")
-            time.sleep(0.1)
-            count += 1
-            if count == 1e-3:
-                logger.warn(
-                    "Modification queue is taking a long time to unready."
-                    "Check for deadlocks."
-                )
-
-        self._ready = True
+        self._context.set(_QueueContext(queue=list(self.queue), ready=True))
         logger.debug("Modification queue is now ready.")
 
     def unready(self):
         """Unready the queue for accepting new modifications."""
-        self._ready = False
+        self._context.set(_QueueContext(queue=self.queue, ready=False))
         logger.debug("Modification queue is now unready.")
 
 
+@dataclass
+class _QueueContext:
+    queue: List["Modification"] = field(default_factory=list)
+
+    # Whether the queue is accepting new modifications
+    # When ready is False, `add` will no-op
+    ready: bool = False
+
+
 @dataclass
 class ProgressQueue:
     """A queue of progress messages to be displayed to the user."""
@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+
+import pyarrow as pa
+
+from meerkat.columns.abstract import Column
+from meerkat.columns.scalar.arrow import ArrowScalarColumn
+from meerkat.writers.abstract import AbstractWriter
+
+
+class ArrowIPCWriter(AbstractWriter):
+    """Writes a scalar column to an Arrow IPC file, a batch at a time.
+
+    Batches are buffered until ``chunk_size`` rows are pending, so that the file
+    is not split into many tiny record batches when the batches are small. The
+    column returned by :meth:`finalize` is an :class:`ArrowScalarColumn` backed
+    by the memory-mapped file.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        chunk_size: int = 2**16,
+        template: Column = None,
+        *args,
+        **kwargs,
+    ):
+        super(ArrowIPCWriter, self).__init__(*args, **kwargs)
+
+        self.file = None
+        self.path = path
+        self.chunk_size = chunk_size
+        self.template = template
+        if path is not None:
+            self.open(path=path)
+
+    def open(self, path: str, *args, **kwargs) -> None:
+        os.makedirs(str(Path(path).absolute().parent), exist_ok=True)
+
+        self.file = pa.OSFile(path, "wb")
+        self.path = path
+        self._writer = None
+        self._buffer = []
+        self._buffered_rows = 0
+
+    def write(self, data, **kwargs) -> None:
+        if isinstance(data, Column):
+            data = data.to_arrow()
+        elif not isinstance(data, (pa.Array, pa.ChunkedArray)):
+            data = pa.array(data)
+
+        chunks = data.chunks if isinstance(data, pa.ChunkedArray) else [data]
+        for chunk in chunks:
+            self._buffer.append(chunk)
+            self._buffered_rows += len(chunk)
+        if self._buffered_rows >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+
+        if self._writer is None:
+            # the type of the column is fixed by the first batch
+            self._type = self._buffer[0].type
+            self._writer = pa.ipc.new_file(self.file, pa.schema([("data", self._type)]))
+        dtype = self._type
+        array = pa.concat_arrays(
+            [
+                chunk if chunk.type == dtype else chunk.cast(dtype)
+                for chunk in self._buffer
+            ]
+        )
+        self._writer.write_batch(pa.record_batch([array], names=["data"]))
+        self._buffer = []
+        self._buffered_rows = 0
+
+    def close(self, *args, **kwargs):
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+        self.file.close()
+
+    def finalize(self, *args, **kwargs) -> Column:
+        self.close()
+        data = pa.ipc.open_file(pa.memory_map(self.path)).read_all()["data"]
+        if isinstance(self.template, ArrowScalarColumn):
+            return self.template._clone(data=data)
+        return ArrowScalarColumn(data)
@@ -0,0 +1,114 @@
+import bisect
+import os
+from pathlib import Path
+from typing import Sequence
+
+import dill
+import numpy as np
+
+from meerkat.columns.abstract import Column
+from meerkat.writers.abstract import AbstractWriter
+
+
+class ObjectStoreWriter(AbstractWriter):
+    """Writes an object column to a file of pickled chunks, a batch at a time.
+
+    Each chunk holds ``chunk_size`` rows, pickled with dill. The column returned
+    by :meth:`finalize` is a :class:`DeferredColumn` that loads the rows from
+    the file when it is materialized.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        chunk_size: int = 1024,
+        *args,
+        **kwargs,
+    ):
+        super(ObjectStoreWriter, self).__init__(*args, **kwargs)
+
+        self.file = None
+        self.path = path
+        self.chunk_size = chunk_size
+        if path is not None:
+            self.open(path=path)
+
+    def open(self, path: str, *args, **kwargs) -> None:
+        os.makedirs(str(Path(path).absolute().parent), exist_ok=True)
+
+        self.file = open(path, "wb")
+        self.path = path
+        self._buffer = []
+        # the byte offset and first row of each chunk in the file
+        self._offsets = [0]
+        self._starts = [0]
+
+    def write(self, data, **kwargs) -> None:
+        if isinstance(data, Column):
+            data = data.data
+        self._buffer.extend(data)
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        self.file.write(dill.dumps(self._buffer))
+        self._offsets.append(self.file.tell())
+        self._starts.append(self._starts[-1] + len(self._buffer))
+        self._buffer = []
+
+    def close(self, *args, **kwargs):
+        self.flush()
+        self.file.close()
+
+    def finalize(self, *args, **kwargs) -> Column:
+        from meerkat.columns.object.base import ObjectColumn
+        from meerkat.columns.tensor.numpy import NumPyTensorColumn
+
+        self.close()
+        reader = ObjectStoreReader(self.path, self._offsets, self._starts)
+        return NumPyTensorColumn(np.arange(self._starts[-1])).defer(
+            reader,
+            is_batched_fn=True,
+            batch_size=self.chunk_size,
+            outputs="single",
+            output_type=ObjectColumn,
+        )
+
+
+class ObjectStoreReader:
+    """Loads rows from a file written by :class:`ObjectStoreWriter`, by their
+    positions.
+
+    The last chunk read is kept in memory, so reading the rows in order loads
+    every chunk once.
+    """
+
+    def __init__(self, path: str, offsets: Sequence[int], starts: Sequence[int]):
+        self.path = path
+        self.offsets = list(offsets)
+        self.starts = list(starts)
+        self._chunk = (None, None)
+
+    def __getstate__(self):
+        return {"path": self.path, "offsets": self.offsets, "starts": self.starts}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _load_chunk(self, chunk_idx: int) -> list:
+        if self._chunk[0] != chunk_idx:
+            with open(self.path, "rb") as f:
+                f.seek(self.offsets[chunk_idx])
+                data = f.read(self.offsets[chunk_idx + 1] - self.offsets[chunk_idx])
+            self._chunk = (chunk_idx, dill.loads(data))
+        return self._chunk[1]
+
+    def __call__(self, positions: Sequence[int]) -> list:
+        out = []
+        for position in positions:
+            position = int(position)
+            chunk_idx = bisect.bisect_right(self.starts, position) - 1
+            out.append(self._load_chunk(chunk_idx)[position - self.starts[chunk_idx]])
+        return out
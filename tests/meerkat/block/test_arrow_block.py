@@ -97,3 +97,36 @@ def test_io(tmpdir):
 
     assert isinstance(block, ArrowBlock)
     assert block.data.equals(new_block.data)
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        np.array([3, 4, 7, 8, 11]),
+        np.array([11, 0, 5, 5, 9, 2, -1]),
+        np.array([], dtype=int),
+    ],
+)
+def test_take_chunked(index):
+    chunks = [np.arange(start, start + 4) for start in range(0, 12, 4)]
+    table = pa.Table.from_batches(
+        [
+            pa.RecordBatch.from_pydict({"a": chunk, "b": [str(x) for x in chunk]})
+            for chunk in chunks
+        ]
+    )
+    expected = np.arange(12)[index]
+
+    out = ArrowBlock._take(table, index)
+    assert isinstance(out, pa.Table)
+    assert out["a"].to_pylist() == list(expected)
+    assert out["b"].to_pylist() == [str(x) for x in expected]
+
+    out = ArrowBlock._take(table["b"], index)
+    assert out.to_pylist() == [str(x) for x in expected]
+
+
+def test_take_out_of_bounds():
+    table = pa.Table.from_batches([pa.RecordBatch.from_pydict({"a": [1, 2]})] * 2)
+    with pytest.raises(IndexError):
+        ArrowBlock._take(table, np.array([0, 4]))
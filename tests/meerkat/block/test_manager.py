@@ -382,6 +382,48 @@ def test_io(tmpdir):
         assert mgr[f"col{idx}"].data == new_mgr[f"col{idx}"].data
 
 
+def test_io_incremental(tmpdir):
+    tmpdir = os.path.join(tmpdir, "test")
+    mgr = BlockManager()
+    mgr.add_column(mk.TensorColumn(np.arange(10)), "a")
+    mgr.add_column(mk.TensorColumn(torch.arange(10) * 2), "b")
+    mgr.add_column(mk.ScalarColumn(np.arange(10) * 3), "c")
+    mgr.add_column(mk.ArrowScalarColumn(np.arange(10) * 4), "d")
+    mgr.write(tmpdir)
+
+    def data_files():
+        meta = load_yaml(os.path.join(tmpdir, "meta.yaml"))
+        assert len(meta["blocks"]) == 4
+        for block_meta in meta["blocks"].values():
+            assert block_meta["nbytes"] > 0
+        out = {}
+        for name, col_meta in meta["columns"].items():
+            block_dir = os.path.join(tmpdir, col_meta["block"]["block_dir"])
+            (data_file,) = [f for f in os.listdir(block_dir) if f.startswith("data")]
+            out[name] = (
+                os.stat(os.path.join(block_dir, data_file)).st_ino,
+                meta["blocks"][col_meta["block"]["block_dir"]]["checksum"],
+            )
+        return out
+
+    before = data_files()
+    mgr["b"][0] = 100
+    mgr.add_column(mk.ScalarColumn(np.arange(10) * 5), "c")
+    mgr.write(tmpdir)
+    after = data_files()
+
+    # unchanged blocks are not rewritten
+    assert after["a"] == before["a"]
+    assert after["d"] == before["d"]
+    assert after["b"][1] != before["b"][1]
+    assert after["c"][1] != before["c"][1]
+    assert not os.path.exists(os.path.join(tmpdir, "blocks.old"))
+
+    new_mgr = BlockManager.read(tmpdir)
+    for name in "abcd":
+        assert (new_mgr[name] == mgr[name]).all()
+
+
 def test_io_no_overwrite(tmpdir):
     new_dir = os.path.join(tmpdir, "test")
     os.mkdir(new_dir)
@@ -467,6 +509,105 @@ def test_io_chained_lambda_args(tmpdir, column_type):
     )
 
 
+def _make_io_mgr() -> BlockManager:
+    mgr = BlockManager()
+    mgr.add_column(mk.TensorColumn(np.arange(10)), "a")
+    mgr.add_column(mk.TensorColumn(torch.arange(10) * 2), "b")
+    mgr.add_column(mk.ScalarColumn(np.arange(10) * 3), "c")
+    mgr.add_column(mk.ArrowScalarColumn(np.arange(10) * 4), "d")
+    mgr.add_column(mk.ObjectColumn(list(range(10))), "e")
+    mgr.add_column(mgr["c"].defer(lambda x: x + 2), "f")
+    return mgr
+
+
+def test_io_lazy(tmpdir):
+    path = os.path.join(tmpdir, "test")
+    mgr = _make_io_mgr()
+    mgr.write(path)
+
+    new_mgr = BlockManager.read(path, lazy=True)
+    assert list(new_mgr.keys()) == list(mgr.keys())
+    assert len(new_mgr._block_refs) == 0
+
+    # accessing a column only reads its block
+    assert (new_mgr["b"] == mgr["b"]).all()
+    assert len(new_mgr._block_refs) == 1
+
+    # accessing a deferred column reads the blocks of its inputs
+    assert new_mgr["f"].data.args[0] is new_mgr["c"]
+    assert (new_mgr["f"]().data == np.arange(10) * 3 + 2).all()
+
+    # operations over all of the columns read all of the blocks
+    sliced = new_mgr.apply("_get", index=slice(2, 5), materialize=True)
+    assert list(sliced.keys()) == list(mgr.keys())
+    for name in "abcd":
+        assert (sliced[name] == mgr[name][2:5]).all()
+    assert new_mgr._reader is None
+
+
+def test_io_lazy_all_columns(tmpdir):
+    path = os.path.join(tmpdir, "test")
+    mgr = _make_io_mgr()
+    mgr.write(path)
+
+    # accessing the last unloaded column drops the reader
+    new_mgr = BlockManager.read(path, lazy=True)
+    for name in mgr.keys():
+        new_mgr[name]
+    assert new_mgr._reader is None
+    assert (new_mgr["a"] == mgr["a"]).all()
+
+    # as do iterating over and copying a lazily read DataFrame
+    df = mk.DataFrame({"a": np.arange(4), "b": mk.ObjectColumn(list("abcd"))})
+    df.write(os.path.join(tmpdir, "df"))
+    assert len(list(mk.DataFrame.read(os.path.join(tmpdir, "df"), lazy=True))) == 4
+    copy = mk.DataFrame.read(os.path.join(tmpdir, "df"), lazy=True).copy()
+    assert list(copy["b"]) == list("abcd")
+
+
+@pytest.mark.parametrize("max_loaded_blocks", [None, 1])
+def test_io_lazy_repr(tmpdir, max_loaded_blocks: int):
+    df = mk.DataFrame({"a": np.arange(4), "b": mk.ObjectColumn(list("abcd"))})
+    df.write(os.path.join(tmpdir, "df"))
+
+    lazy_df = mk.DataFrame.read(
+        os.path.join(tmpdir, "df"), lazy=True, max_loaded_blocks=max_loaded_blocks
+    )
+    out, _ = lazy_df._repr_pandas_()
+    expected, _ = df._repr_pandas_()
+    assert out.equals(expected)
+
+
+def test_io_lazy_evict(tmpdir):
+    path = os.path.join(tmpdir, "test")
+    mgr = _make_io_mgr()
+    mgr.write(path)
+
+    new_mgr = BlockManager.read(path, lazy=True, mmap=True, max_loaded_blocks=1)
+    assert isinstance(new_mgr["a"].data, np.memmap)
+    assert (new_mgr["b"] == mgr["b"]).all()
+    # the block of "a" was released
+    assert len(new_mgr._block_refs) == 1
+    assert "a" not in new_mgr._column_to_block_id
+    assert (new_mgr["a"] == mgr["a"]).all()
+
+    # blocks that have been modified are never released
+    new_mgr = BlockManager.read(path, lazy=True, max_loaded_blocks=1)
+    new_mgr["a"][0] = 100
+    new_mgr["b"]
+    assert new_mgr["a"][0] == 100
+
+
+def test_io_subset(tmpdir):
+    path = os.path.join(tmpdir, "test")
+    mgr = _make_io_mgr()
+    mgr.write(path)
+
+    new_mgr = BlockManager.read(path, columns=["f", "a"])
+    assert list(new_mgr.keys()) == ["a", "f"]
+    assert (new_mgr["f"]().data == np.arange(10) * 3 + 2).all()
+
+
 def test_topological_block_refs():
     mgr = BlockManager()
     base_col = mk.TensorColumn(np.arange(16))
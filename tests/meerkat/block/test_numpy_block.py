@@ -116,3 +116,35 @@ def test_io(tmpdir):
 
     assert isinstance(block, NumPyBlock)
     assert (block.data == new_block.data).all()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        np.random.randn(100, 10),
+        np.asfortranarray(np.random.randn(100, 10)),
+        np.random.randn(100, 10, 3)[::2, :, 1],
+        np.arange(10)[:, None],
+        np.zeros((0, 4)),
+        np.array([["a", "bc", "def"]]),
+        np.array([[{"a": 1}, None]], dtype=object),
+    ],
+)
+def test_io_layouts(tmpdir, monkeypatch, data):
+    # write in several chunks
+    monkeypatch.setattr("meerkat.block.numpy_block.CHUNK_BYTES", 64)
+    block = NumPyBlock(data)
+    block.write(tmpdir)
+    new_block = NumPyBlock.read(tmpdir)
+
+    assert new_block.data.dtype == data.dtype
+    assert new_block.data.shape == data.shape
+    assert (new_block.data == data).all()
+
+
+def test_checksum():
+    data = np.random.randn(100, 10)
+    assert NumPyBlock(data)._checksum() == NumPyBlock(data.copy())._checksum()
+    assert NumPyBlock(data)._checksum() != NumPyBlock(data[:, ::-1])._checksum()
+    assert NumPyBlock(data)._checksum() != NumPyBlock(data.astype("f4"))._checksum()
+    assert NumPyBlock(np.array([[None, 1]], dtype=object))._checksum() is None
@@ -109,3 +109,11 @@ def test_io(tmpdir):
 
     assert isinstance(block, PandasBlock)
     assert block.data.reset_index(drop=True).equals(new_block.data)
+
+
+def test_io_mmap(tmpdir):
+    block = PandasBlock(pd.DataFrame({"a": [1, 2, 3], "b": ["4", "5", "6"]}))
+    block.write(tmpdir)
+    new_block = block.read(tmpdir, mmap=True)
+
+    assert block.data.equals(new_block.data)
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 import torch
 
@@ -122,3 +124,27 @@ def test_io(tmpdir):
 
     assert isinstance(block, TorchBlock)
     assert (block.data == new_block.data).all()
+
+
+def test_io_mmap(tmpdir):
+    block = TorchBlock(torch.arange(20, dtype=torch.float32).reshape(10, 2))
+    block.write(tmpdir)
+    assert os.path.exists(os.path.join(tmpdir, "data.npy"))
+
+    new_block = TorchBlock.read(tmpdir, mmap=True)
+    assert (new_block.data == block.data).all()
+
+    # the file is mapped copy-on-write
+    new_block.data[0] = 100
+    assert (TorchBlock.read(tmpdir).data == block.data).all()
+
+
+def test_io_no_numpy_dtype(tmpdir):
+    block = TorchBlock(torch.ones(10, 2, dtype=torch.bfloat16))
+    block.write(tmpdir)
+    assert os.path.exists(os.path.join(tmpdir, "data.pt"))
+    assert not os.path.exists(os.path.join(tmpdir, "data.npy"))
+
+    new_block = TorchBlock.read(tmpdir, mmap=True)
+    assert new_block.data.dtype == torch.bfloat16
+    assert (new_block.data == block.data).all()
@@ -1,4 +1,5 @@
 """Unittests for LambdaColumn."""
+import os
 from typing import Type
 
 import numpy as np
@@ -6,6 +7,7 @@ import pytest
 
 import meerkat as mk
 from meerkat import DeferredColumn, NumPyTensorColumn, ObjectColumn
+from meerkat.block.result_cache import ResultCache
 from meerkat.errors import ConcatWarning
 
 from ....testbeds import MockColumn, MockDatapanel
@@ -187,3 +189,106 @@ def test_col_concat(col_type):
     col_b = col.defer(lambda x: x)
     with pytest.warns(ConcatWarning):
         out = mk.concat([col_a, col_b])
+
+
+@pytest.mark.parametrize("is_batched_fn", [False, True])
+def test_cache(is_batched_fn: bool):
+    calls = []
+
+    def fn(x):
+        calls.append(x)
+        return x * 2
+
+    col = NumPyTensorColumn(np.arange(16)).defer(
+        fn, is_batched_fn=is_batched_fn, batch_size=4
+    )
+    cache = col.enable_cache()
+    calls.clear()
+
+    assert (col[2:6]().data == np.arange(2, 6) * 2).all()
+    num_calls = len(calls)
+    assert (col[2:6]().data == np.arange(2, 6) * 2).all()
+    assert len(calls) == num_calls
+
+    # views of the column share the cache, and only the missing rows are computed
+    view = col[4:10]
+    assert (view().data == np.arange(4, 10) * 2).all()
+    computed = np.concatenate([np.atleast_1d(x) for x in calls[num_calls:]])
+    assert sorted(computed.tolist()) == list(range(6, 10))
+    assert view[1].get() == 10
+    assert cache.hits > 0
+
+    col.disable_cache()
+    calls.clear()
+    col[2:6]()
+    assert len(calls) > 0
+
+
+def test_cache_shared_across_columns():
+    """Columns sharing a cache never serve each other's outputs, even when the
+    ids of freed functions and inputs are reused."""
+    cache = ResultCache()
+    for i in range(50):
+        col = NumPyTensorColumn(np.arange(4) + i).defer(lambda x: x * 2, cache=cache)
+        assert (col().data == (np.arange(4) + i) * 2).all()
+        del col
+
+
+def test_cache_mutated_input():
+    df = mk.DataFrame({"a": np.arange(4)})
+    col = df["a"].defer(lambda x: x * 2)
+    col.enable_cache()
+    assert (col().data == np.arange(4) * 2).all()
+
+    df["a"][1] = 10
+    assert (col().data == np.array([0, 20, 4, 6])).all()
+
+
+def test_cache_persist(tmpdir):
+    with pytest.raises(ValueError, match="persisted"):
+        NumPyTensorColumn(np.arange(4)).defer(lambda x: x).enable_cache(
+            cache=ResultCache(spill_dir=str(tmpdir), persist=True)
+        )
+
+
+def test_cache_multiple_outputs():
+    calls = []
+
+    def fn(x):
+        calls.append(len(x))
+        return {"a": x + 1, "b": x * 2}
+
+    cache = ResultCache()
+    df = NumPyTensorColumn(np.arange(8)).defer(
+        fn, is_batched_fn=True, batch_size=4, cache=cache
+    )
+    calls.clear()
+
+    out = df[0:4]()
+    assert (out["a"].data == np.arange(4) + 1).all()
+    assert (out["b"].data == np.arange(4) * 2).all()
+    out = df[2:8]()
+    assert (out["a"].data == np.arange(2, 8) + 1).all()
+    assert (out["b"].data == np.arange(2, 8) * 2).all()
+    # the first row is computed by `defer` to infer the outputs
+    assert calls == [3, 4]
+
+
+def test_cache_eviction(tmpdir):
+    def fn(x):
+        return np.full(100, x, dtype=np.float64)
+
+    col = NumPyTensorColumn(np.arange(10)).defer(fn)
+    cache = col.enable_cache(max_bytes=4 * 800)
+    col()
+    assert len(cache) == 4 and cache.nbytes <= 4 * 800
+
+    spill_dir = str(tmpdir.join("spill"))
+    cache = col.enable_cache(max_bytes=4 * 800, spill_dir=spill_dir)
+    col()
+    misses = cache.misses
+    out = col()
+    assert cache.misses == misses
+    assert (out.data[:, 0] == np.arange(10)).all()
+    cache.clear()
+    assert len(cache) == 0 and len(os.listdir(spill_dir)) == 0
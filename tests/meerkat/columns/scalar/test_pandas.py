@@ -143,3 +143,87 @@ def test_ufunc_out():
     b = ScalarColumn([1, 2, 3])
     np.add(a, b, out=out)
     assert (out == np.array([2, 4, 6])).all()
+
+
+STRINGS = ["a asdsd ", "Straße", "İstanbul", "²³", "", " \t ABC1 ", "x y"]
+
+
+@pytest.mark.parametrize("ascii", [True, False])
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("len", {}),
+        ("isalnum", {}),
+        ("isalpha", {}),
+        ("isdigit", {}),
+        ("islower", {}),
+        ("isupper", {}),
+        ("isspace", {}),
+        ("lower", {}),
+        ("upper", {}),
+        ("strip", {}),
+        ("lstrip", {"to_strip": "a "}),
+        ("rstrip", {}),
+        ("startswith", {"pat": "a"}),
+        ("contains", {"pat": "s"}),
+        ("contains", {"pat": "S", "case": False}),
+        ("contains", {"pat": r"\w\b"}),
+        ("contains", {"pat": "(", "regex": True}),
+        ("replace", {"pat": "s", "repl": "_", "n": 1}),
+        ("replace", {"pat": "(s+)", "repl": r"<\1>", "regex": True}),
+        ("replace", {"pat": "[a-z]", "repl": "_", "regex": True}),
+    ],
+)
+def test_str_methods_arrow(method: str, kwargs: dict, ascii: bool):
+    series = pd.Series([s for s in STRINGS if s.isascii() or not ascii] * 3)
+    col = ScalarColumn(series)
+    if method == "contains" and kwargs["pat"] == "(":
+        with pytest.raises(Exception):
+            getattr(series.str, method)(**kwargs)
+        with pytest.raises(Exception):
+            getattr(col.str, method)(**kwargs)
+        return
+
+    out = getattr(col.str, method)(**kwargs)
+    assert out.data.equals(getattr(series.str, method)(**kwargs))
+    assert out.data.dtype == getattr(series.str, method)(**kwargs).dtype
+
+
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("contains", {"pat": "c$"}),
+        ("contains", {"pat": "^b"}),
+        ("contains", {"pat": "c", "regex": True}),
+        ("contains", {"pat": "C", "case": False}),
+        ("replace", {"pat": "c$", "repl": "Z", "regex": True}),
+        ("replace", {"pat": "c", "repl": "Z", "regex": True}),
+        ("replace", {"pat": "c", "repl": r"\\", "regex": True}),
+    ],
+)
+def test_str_methods_arrow_regex(method: str, kwargs: dict):
+    series = pd.Series(["abc\n", "x", "c\nb", "abc"])
+    col = ScalarColumn(series)
+    out = getattr(col.str, method)(**kwargs)
+    assert out.data.equals(getattr(series.str, method)(**kwargs))
+
+
+def test_str_methods_arrow_cache():
+    col = ScalarColumn(["a", "b", "ab"])
+    assert col.str.contains("a").data.tolist() == [True, False, True]
+    array = col.str._arrow[2]
+    col.str.startswith("a")
+    assert col.str._arrow[2] is array
+
+    # the arrow copy is rebuilt when the column is modified
+    col[1] = "a"
+    assert col.str.contains("a").data.tolist() == [True, True, True]
+    assert col.str._arrow[2] is not array
+
+
+@pytest.mark.parametrize("values", [["a", None, "b"], ["a", 1, "b"]])
+def test_str_methods_arrow_fallback(values):
+    series = pd.Series(values)
+    col = ScalarColumn(series)
+    assert col.str.len().data.equals(series.str.len())
+    assert col.str._arrow[2] is None
@@ -112,6 +112,109 @@ def test_rows(df_testbed):
     assert response_json["primaryKey"] == df.primary_key
 
 
+def test_rows_keyidxs(df_testbed):
+    df: mk.DataFrame = df_testbed["df"]
+    response = client.post(
+        f"/df/{df.id}/rows/",
+        json={"keyidxs": [7, 2], "columns": ["a", "b"]},
+    )
+    assert response.status_code == 200
+    assert response.json()["rows"] == [[7, 17], [2, 12]]
+
+    # rows are returned in the order of the keys, and missing keys are skipped
+    response = client.post(
+        f"/df/{df.id}/rows/",
+        json={"keyidxs": [17, 99, 12], "key_column": "b", "columns": ["a", "b"]},
+    )
+    assert response.status_code == 200
+    assert response.json()["rows"] == [[7, 17], [2, 12]]
+
+
+def test_rows_column_major(df_testbed):
+    df: mk.DataFrame = df_testbed["df"]
+    response = client.post(
+        f"/df/{df.id}/rows/",
+        json={"posidxs": [3, 5], "column_major": True},
+    )
+    assert response.status_code == 200
+    response_json = response.json()
+    assert response_json["rows"] is None
+    assert response_json["columnData"] == [
+        [3, 5],
+        [13, 15],
+        [{"data": [0.0, 0.0, 0.0, 0.0], "shape": [4], "dtype": "float64"}] * 2,
+    ]
+
+
+def test_rows_arrow(df_testbed):
+    import json
+
+    import pyarrow as pa
+
+    df: mk.DataFrame = df_testbed["df"]
+    df["c"] = np.array([0.5, np.nan] * 5)
+    response = client.post(
+        f"/df/{df.id}/rows/",
+        json={"start": 0, "end": 2, "response_format": "arrow"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+
+    table = pa.ipc.open_stream(response.content).read_all()
+    metadata = json.loads(table.schema.metadata[b"meerkat"])
+    assert table.column_names == ["a", "b", "clip(a)", "c"]
+    assert table["b"].to_pylist() == [10, 11]
+    assert table["clip(a)"].to_pylist()[0]["shape"] == [4]
+    # numbers mixed with "NaN" strings are sent as json
+    assert metadata["jsonColumns"] == ["c"]
+    assert [json.loads(v) for v in table["c"].to_pylist()] == [0.5, "NaN"]
+    assert metadata["fullLength"] == 10 and metadata["posidxs"] == [0, 1]
+    assert [info["name"] for info in metadata["columnInfos"]] == table.column_names
+
+    with pytest.raises(ValueError):
+        client.post(f"/df/{df.id}/rows/", json={"start": 0, "response_format": "xml"})
+
+
+def test_rows_image():
+    from PIL import Image
+
+    from meerkat.interactive.formatter import image as image_module
+
+    df = mk.DataFrame(
+        {
+            "id": np.arange(4),
+            "img": mk.column(
+                [
+                    Image.fromarray(np.full((40, 40, 3), i * 60, dtype=np.uint8))
+                    for i in range(4)
+                ]
+            ),
+        },
+        primary_key="id",
+    )
+    formatter = df["img"].formatters["thumbnail"]
+    cache = image_module.get_thumbnail_cache()
+    hits = cache.hits
+    for _ in range(2):
+        response = client.post(
+            f"/df/{df.id}/rows/",
+            json={"start": 1, "end": 3, "formatter": "thumbnail"},
+        )
+        assert response.status_code == 200
+        assert response.json()["rows"] == [
+            [i, formatter.encode(df["img"][i])] for i in [1, 2]
+        ]
+    # the second request is served from the thumbnail cache
+    assert cache.hits == hits + 2
+
+    # cells that are set in place are encoded again
+    df["img"][1] = Image.fromarray(np.zeros((40, 40, 3), dtype=np.uint8))
+    response = client.post(
+        f"/df/{df.id}/rows/", json={"start": 1, "end": 3, "formatter": "thumbnail"}
+    )
+    assert response.json()["rows"][0] == [1, formatter.encode(df["img"][1])]
+
+
 @pytest.mark.skip
 def test_sort(df_testbed):
     df = df_testbed["df"]
@@ -157,3 +157,31 @@ def test_filter_bool():
 
 #     _set_criteria(criteria[::-1], filter.criteria)
 #     assert id(node.obj) == obj_id
+
+
+def test_filter_cache():
+    from meerkat.ops.view_cache import view_cache
+
+    df = mk.DataFrame({"a": np.arange(10), "b": np.arange(10, 20)})
+    filter = mk.gui.Filter(df=df)
+    out = filter(df)
+    node = out.inode
+
+    greater = FilterCriterion(is_enabled=True, column="a", op=">", value=5)
+    _set_criteria([greater], filter.criteria)
+    equal = FilterCriterion(is_enabled=True, column="a", op="==", value=2)
+    _set_criteria([equal], filter.criteria)
+
+    # toggling back to a filter that was seen before is served from the cache
+    hits = view_cache.hits
+    _set_criteria([greater], filter.criteria)
+    assert view_cache.hits == hits + 1
+    assert node.obj["b"].tolist() == [16, 17, 18, 19]
+
+    # only modifications to a filtered column invalidate its entries
+    mk.gui.DataFrameModification(id=df.id, scope=["b"]).add_to_queue()
+    _set_criteria([equal], filter.criteria)
+    assert view_cache.hits == hits + 2
+    mk.gui.DataFrameModification(id=df.id, scope=["a"]).add_to_queue()
+    _set_criteria([greater], filter.criteria)
+    assert view_cache.hits == hits + 2
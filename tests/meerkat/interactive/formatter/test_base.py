@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+import torch
+
+import meerkat as mk
+from meerkat.interactive.formatter import (
+    NumberFormatter,
+    TensorFormatter,
+    TextFormatter,
+)
+
+
+@pytest.mark.parametrize(
+    "column",
+    [
+        mk.column(np.array([1, 2, 3])),
+        mk.column(np.array([1.5, np.nan, 0.1], dtype=np.float32)),
+        mk.column(np.array([True, False, True])),
+        mk.column(["a", None, "c"]),
+        mk.column(pd.Series([1, None, 3], dtype="Int64")),
+        mk.column(pd.Series(pd.to_datetime(["2020-01-01"] * 3))),
+        mk.ArrowScalarColumn(pa.array(["x", None, "z"])),
+        mk.ArrowScalarColumn(pa.array([1.0, None, float("nan")])),
+        mk.column(np.random.rand(3, 4)),
+        mk.column(torch.rand(3, 2)),
+    ],
+)
+@pytest.mark.parametrize(
+    "formatter", [NumberFormatter(), TextFormatter(), TensorFormatter(dtype=None)]
+)
+def test_encode_batch(column: mk.Column, formatter):
+    """Batch encodings match encoding each cell on its own."""
+    try:
+        expected = [formatter.encode(column[i]) for i in range(len(column))]
+    except (AttributeError, TypeError):
+        pytest.skip("formatter does not apply to column")
+    # compare reprs, since nan != nan
+    assert repr(formatter.encode_batch(column[1:])) == repr(expected[1:])
+    assert repr(formatter.encode_batch(column)) == repr(expected)
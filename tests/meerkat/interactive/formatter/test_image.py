@@ -1,7 +1,10 @@
+import os
+
 import numpy as np
 import pytest
 from PIL import Image
 
+import meerkat as mk
 from meerkat.interactive.formatter.image import ImageFormatter
 
 
@@ -16,3 +19,82 @@ def test_image_formatter_encode_skip_copy(skip_copy: bool):
         assert image.size == (20, 20)
     else:
         assert image.size == (100, 100)
+
+
+def test_image_formatter_encode_batch(tmpdir, monkeypatch):
+    from meerkat.block.result_cache import ResultCache
+    from meerkat.interactive.formatter import image as image_module
+
+    cache = ResultCache(spill_dir=str(tmpdir), persist=True)
+    monkeypatch.setattr(image_module, "_thumbnail_cache", cache)
+
+    formatter = ImageFormatter(max_size=(20, 20))
+    images = mk.column(
+        [
+            Image.fromarray(np.full((50, 50, 3), i * 50, dtype=np.uint8))
+            for i in range(4)
+        ]
+    )
+    keys = [("col", i) for i in range(4)]
+    out = formatter.encode_batch(images, keys=keys)
+    assert out == [formatter.encode(image) for image in images]
+    assert cache.misses == 4 and len(cache) == 4
+
+    assert formatter.encode_batch(images, keys=keys) == out
+    assert cache.hits == 4
+    # a formatter with a different size does not share encodings
+    ImageFormatter(max_size=(10, 10)).encode_batch(images, keys=keys)
+    assert len(cache) == 8
+
+    # cells keyed by their column are not persisted, since column ids are only
+    # meaningful in this process
+    assert os.listdir(tmpdir) == []
+
+    # without keys, nothing is cached
+    assert formatter.encode_batch(images) == out
+    assert cache.hits == 4
+
+
+def test_image_formatter_encode_batch_files(tmpdir, monkeypatch):
+    from meerkat.block.result_cache import ResultCache
+    from meerkat.interactive.formatter import image as image_module
+
+    cache_dir = os.path.join(tmpdir, "cache")
+    monkeypatch.setattr(
+        image_module, "_thumbnail_cache", ResultCache(spill_dir=cache_dir, persist=True)
+    )
+    paths = []
+    for i in range(4):
+        paths.append(os.path.join(tmpdir, f"{i}.png"))
+        Image.fromarray(np.full((50, 50, 3), i * 50, dtype=np.uint8)).save(paths[-1])
+    images = mk.FileColumn(paths, type="image")
+    formatter = images.formatters["thumbnail"]
+
+    out = formatter.encode_batch(images)
+    assert len(os.listdir(cache_dir)) == 4
+
+    # encodings of files are persisted and can be read by a fresh cache
+    cache = ResultCache(spill_dir=cache_dir, persist=True)
+    monkeypatch.setattr(image_module, "_thumbnail_cache", cache)
+    assert formatter.encode_batch(images) == out
+    assert cache.hits == 4
+
+    # rewriting a file invalidates its encoding
+    Image.fromarray(np.zeros((60, 60, 3), dtype=np.uint8)).save(paths[0])
+    assert formatter.encode_batch(images)[0] == formatter.encode(images[0])
+    assert cache.hits == 7
+
+
+def test_result_cache_max_disk_bytes(tmpdir):
+    from meerkat.block.result_cache import MISSING, ResultCache
+
+    value = np.zeros(1000, dtype=np.uint8)
+    cache = ResultCache(spill_dir=str(tmpdir), persist=True, max_disk_bytes=4000)
+    for i in range(10):
+        cache.put(("ns", i), value)
+    assert sum(os.path.getsize(tmpdir.join(f)) for f in os.listdir(tmpdir)) <= 4000
+
+    # the oldest entries were deleted from disk
+    fresh = ResultCache(spill_dir=str(tmpdir), persist=True, max_disk_bytes=4000)
+    assert fresh.get(("ns", 0)) is MISSING
+    assert (fresh.get(("ns", 9)) == value).all()
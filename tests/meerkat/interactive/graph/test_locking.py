@@ -0,0 +1,89 @@
+import threading
+import time
+
+from meerkat.interactive.graph.locking import ReadWriteLock, lock_nodes
+from meerkat.interactive.node import Node
+
+
+def _run(fn, n: int):
+    threads = [threading.Thread(target=fn) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_readers_share():
+    lock = ReadWriteLock()
+    barrier = threading.Barrier(3, timeout=10)
+
+    def read():
+        lock.acquire_read()
+        # Only passes if all readers hold the lock at once
+        barrier.wait()
+        lock.release_read()
+
+    _run(read, 3)
+
+
+def test_writers_exclude():
+    lock = ReadWriteLock()
+    running, overlaps = [], []
+
+    def write():
+        lock.acquire_write()
+        running.append(None)
+        overlaps.append(len(running) > 1)
+        time.sleep(0.01)
+        running.pop()
+        lock.release_write()
+
+    _run(write, 4)
+    assert not any(overlaps)
+
+
+def test_reentrant():
+    lock = ReadWriteLock()
+    lock.acquire_write()
+    lock.acquire_write()
+    lock.acquire_read()
+    lock.release_read()
+    lock.release_write()
+    lock.release_write()
+
+    # a lone reader can upgrade
+    lock.acquire_read()
+    lock.acquire_write()
+    lock.release_write()
+    lock.release_read()
+
+    # the lock is free again
+    acquired = []
+    thread = threading.Thread(
+        target=lambda: (lock.acquire_write(), acquired.append(True))
+    )
+    thread.start()
+    thread.join(timeout=10)
+    assert acquired
+
+
+def test_lock_nodes_opposite_order():
+    """Threads that lock the same nodes in opposite orders do not deadlock."""
+    a, b = Node(None), Node(None)
+
+    def lock_ab():
+        for _ in range(100):
+            with lock_nodes(write=[a, b]):
+                pass
+
+    def lock_ba():
+        for _ in range(100):
+            with lock_nodes(read=[b], write=[a]), lock_nodes(write=[b]):
+                pass
+
+    threads = [threading.Thread(target=fn) for fn in (lock_ab, lock_ba)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+        assert not thread.is_alive()
@@ -145,3 +145,67 @@ def test_trigger_unmarked_inputs():
     # unnecessarily.
     assert a.inode is None
     assert b.inode is None
+
+
+def test_coalesce_modifications():
+    from meerkat.interactive.graph import coalesce_modifications
+    from meerkat.interactive.modification import (
+        DataFrameModification,
+        StoreModification,
+    )
+
+    modifications = coalesce_modifications(
+        [
+            DataFrameModification(id="df", scope=["a"]),
+            StoreModification(id="store", value=1),
+            DataFrameModification(id="df", scope=["b", "a"]),
+            StoreModification(id="store", value=2),
+        ]
+    )
+    assert len(modifications) == 2
+    assert modifications[0].scope == ["a", "b"]
+    assert modifications[1].value == 2
+
+
+def test_trigger_skips_unmodified():
+    calls = []
+
+    @reactive()
+    def _is_positive(x):
+        return x > 0
+
+    @reactive()
+    def _record(x):
+        calls.append(x)
+        return x
+
+    a = mk.Store(1)
+    _record(_is_positive(a))
+    assert calls == [True]
+
+    # the result of `_is_positive` does not change, so `_record` is not re-run
+    _set_store(a, 2)
+    assert calls == [True]
+    _set_store(a, -1)
+    assert calls == [True, False]
+
+
+def test_trigger_incremental():
+    @endpoint()
+    def _set_column(df: mk.DataFrame, col: str, value: np.ndarray):
+        df[col][np.arange(len(df))] = value
+        mk.gui.DataFrameModification(id=df.id, scope=[col]).add_to_queue()
+
+    df = mk.DataFrame({"a": np.array([3, 1, 2]), "b": np.array([1, 2, 3])}).mark()
+    out = mk.sort(df, by="a")
+    node = out.inode
+
+    # `b` is not sorted by, so the sorted view is updated in place
+    _set_column(df, "b", np.array([4, 5, 6]))
+    assert node.obj is out
+    assert out["b"].tolist() == [5, 6, 4]
+
+    # `a` is sorted by, so the sort is re-run
+    _set_column(df, "a", np.array([1, 2, 3]))
+    assert node.obj is not out
+    assert node.obj["b"].tolist() == [4, 5, 6]
@@ -1,3 +1,6 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 
 import numpy as np
@@ -222,3 +225,55 @@ def test_is_annotation_store_true(type_hint):
 @pytest.mark.parametrize("type_hint", [mk.DataFrame, mk.Column])
 def test_is_annotation_store_false(type_hint):
     assert not _is_annotation_store(type_hint)
+
+
+def test_endpoint_run_concurrent():
+    """Endpoints bound to different stores run at the same time, and each
+    returns only the modifications it made."""
+    barrier = threading.Barrier(2, timeout=10)
+
+    @mk.endpoint()
+    def set_value(store: mk.Store, value: int):
+        # Only passes once both endpoints are running
+        barrier.wait()
+        store.set(value)
+
+    stores = [mk.Store(0), mk.Store(0)]
+    with mk.magic():
+        doubled = [store * 2 for store in stores]
+
+    with ThreadPoolExecutor(2) as pool:
+        futures = [
+            pool.submit(set_value.partial(store=store, value=value).run)
+            for value, store in enumerate(stores, start=1)
+        ]
+        results = [future.result() for future in futures]
+
+    for store, out, (_, modifications) in zip(stores, doubled, results):
+        assert {mod.id for mod in modifications} == {store.inode.id, out.inode.id}
+    with mk.unmarked():
+        assert [out.value for out in doubled] == [2, 4]
+
+
+def test_endpoint_run_shared_store():
+    """Endpoints bound to the same store run one at a time."""
+    lock = threading.Lock()
+    running = []
+
+    @mk.endpoint()
+    def increment(store: mk.Store):
+        with lock:
+            running.append(threading.get_ident())
+            assert len(running) == 1
+        time.sleep(0.01)
+        store.set(store.value + 1)
+        with lock:
+            running.remove(threading.get_ident())
+
+    store = mk.Store(0)
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(increment.partial(store=store).run) for _ in range(8)]
+        for future in futures:
+            future.result()
+
+    assert store.value == 8
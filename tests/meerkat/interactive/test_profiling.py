@@ -0,0 +1,92 @@
+import json
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import meerkat as mk
+from meerkat.interactive.api.main import app
+from meerkat.interactive.graph import reactive
+from meerkat.interactive.profiling import Histogram, profiler
+
+client = TestClient(app)
+
+
+@reactive()
+def _double(x):
+    return x * 2
+
+
+@mk.endpoint()
+def _set_store(store: mk.Store, value):
+    store.set(value)
+
+
+@pytest.fixture
+def enabled_profiler():
+    profiler.reset()
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+
+def test_histogram():
+    histogram = Histogram()
+    for ms in [0.05, 0.3, 3, 3, 40]:
+        histogram.add(ms)
+    stats = histogram.to_dict()
+    assert stats["count"] == 5 and stats["max_ms"] == 40
+    assert stats["p50_ms"] == 5 and stats["p99_ms"] == 40
+    assert stats["buckets"]["le_5"] == 2
+
+
+def test_profiler_disabled():
+    profiler.reset()
+    a = mk.Store(1)
+    _double(a)
+    _set_store(a, 2)
+    assert profiler.stats()["latency"] == {}
+
+
+def test_profiler(enabled_profiler):
+    a = mk.Store(1)
+    b = _double(a)
+    _set_store(a, 2)
+    assert b == 4
+
+    stats = profiler.stats()
+    assert stats["latency"]["endpoint"]["_set_store"]["count"] == 1
+    assert stats["latency"]["trigger"]["_set_store"]["count"] == 1
+    assert stats["latency"]["operation"]["_double"]["count"] == 1
+    assert stats["counters"]["operation.recomputed"] == 1
+
+    df = mk.DataFrame({"a": np.arange(10)}).mark()
+    client.post(f"/df/{df.id}/rows/", json={"start": 0, "end": 5})
+    response = client.get("/metrics/")
+    assert response.status_code == 200
+    latency = response.json()["latency"]
+    assert latency["formatter"]["NumberFormatter"]["count"] == 1
+    assert latency["route"]["/df/{df}/rows/"]["count"] == 1
+    assert "view" in response.json()["caches"]
+
+
+def test_profiler_trace(tmpdir):
+    profiler.reset()
+    assert client.get("/metrics/trace/").status_code == 404
+
+    a = mk.Store(1)
+    _double(a)
+    path = str(tmpdir / "trace.json")
+    profiler.trace_next(path)
+    _set_store(a, 2)
+    # only the next endpoint is traced, and the profiler is left disabled
+    _set_store(a, 3)
+    assert not profiler.enabled
+
+    with open(path) as f:
+        trace = json.load(f)
+    assert trace == client.get("/metrics/trace/").json()
+    names = [event["name"] for event in trace["traceEvents"]]
+    assert sorted(names) == ["_double", "_set_store", "_set_store"]
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
@@ -120,3 +120,150 @@ def test_embed_text(simple_encoder):
         simple_text_transform(df["text"][0]).to(torch.float32).mean()
         == df["_simple_encoder(text)"][0].mean()
     )
+
+
+def test_embed_num_workers(tmpdir: str, simple_encoder):
+    image_testbed = ImageColumnTestBed(tmpdir=tmpdir)
+
+    out = embed(
+        data=image_testbed.col,
+        encoder="_simple_encoder",
+        modality="image",
+        batch_size=4,
+        num_workers=2,
+    )
+    expected = embed(
+        data=image_testbed.col,
+        encoder="_simple_encoder",
+        modality="image",
+        batch_size=4,
+    )
+    assert isinstance(out, mk.NumPyTensorColumn)
+    assert (out.data == expected.data).all()
+
+
+def test_embed_mmap(tmpdir: str, simple_encoder):
+    testbed = TextColumnTestBed()
+    mmap_dir = os.path.join(tmpdir, "mmap")
+
+    out = embed(
+        data=testbed.col,
+        encoder="_simple_encoder",
+        modality="text",
+        batch_size=4,
+        mmap_dir=mmap_dir,
+    )
+    expected = embed(
+        data=testbed.col, encoder="_simple_encoder", modality="text", batch_size=4
+    )
+    assert isinstance(out.data, np.memmap)
+    assert (out.data == expected.data).all()
+    assert os.path.exists(os.path.join(mmap_dir, "emb_mmap.npy"))
+
+
+def test_embed_resume(tmpdir: str):
+    testbed = TextColumnTestBed()
+    mmap_dir = os.path.join(tmpdir, "mmap")
+    encoded = []
+
+    def encode(batch: torch.Tensor):
+        if len(encoded) == 2 and interrupt:
+            raise KeyboardInterrupt
+        encoded.append(len(batch))
+        return simple_encode(batch)
+
+    encoder = Encoder(encode=encode, preprocess=simple_text_transform)
+    kwargs = dict(
+        data=testbed.col, encoder=encoder, modality="text", batch_size=4, pbar=False
+    )
+    interrupt = True
+    with pytest.raises(KeyboardInterrupt):
+        embed(**kwargs, mmap_dir=mmap_dir)
+
+    # the run resumes after the two batches that were written
+    interrupt = False
+    encoded.clear()
+    out = embed(**kwargs, mmap_dir=mmap_dir)
+    assert encoded == [4, 4]
+
+    expected = embed(
+        data=testbed.col, encoder="_simple_encoder", modality="text", batch_size=4
+    )
+    assert (out.data == expected.data).all()
+
+
+def test_embed_nothing_to_encode(tmpdir: str):
+    from meerkat.ops.embed import _embed
+
+    encoded = []
+
+    def encode(batch: torch.Tensor):
+        encoded.append(len(batch))
+        return simple_encode(batch)
+
+    kwargs = dict(
+        encode=encode, preprocess=simple_text_transform, collate=None, pbar=False
+    )
+    for mmap_dir in [None, os.path.join(tmpdir, "empty")]:
+        out = _embed(col=mk.ScalarColumn([]), mmap_dir=mmap_dir, **kwargs)
+        assert isinstance(out, mk.NumPyTensorColumn)
+        assert len(out) == 0
+
+    # a finished run that is resumed has no rows left to encode
+    col = TextColumnTestBed().col
+    mmap_dir = os.path.join(tmpdir, "mmap")
+    first = _embed(col=col, mmap_dir=mmap_dir, batch_size=4, key="emb", **kwargs)
+    encoded.clear()
+    second = _embed(col=col, mmap_dir=mmap_dir, batch_size=4, key="emb", **kwargs)
+    assert encoded == []
+    assert (second.data == first.data).all()
+
+
+def test_embed_mmap_different_inputs(tmpdir: str, simple_encoder):
+    mmap_dir = os.path.join(tmpdir, "mmap")
+    kwargs = dict(encoder="_simple_encoder", modality="text", batch_size=2)
+
+    first = mk.ScalarColumn(["a", "b b", "c c c"])
+    embed(data=first, **kwargs, mmap_dir=mmap_dir)
+
+    # a column of the same length is not mistaken for a resumed run
+    second = mk.ScalarColumn(["x", "y y", "z z z"])
+    out = embed(data=second, **kwargs, mmap_dir=mmap_dir)
+    expected = embed(data=second, **kwargs)
+    assert (out.data == expected.data).all()
+
+
+def test_embed_cache(tmpdir: str):
+    image_testbed = ImageColumnTestBed(tmpdir=tmpdir)
+    encoded = []
+
+    def _counting_encoder(device: str = "cpu"):
+        def encode(batch: torch.Tensor):
+            encoded.append(len(batch))
+            return simple_encode(batch)
+
+        return {
+            "image": Encoder(encode=encode, preprocess=simple_image_transform),
+        }
+
+    if "_counting_encoder" not in encoders.names:
+        encoders.register(_counting_encoder)
+
+    cache_dir = os.path.join(tmpdir, "cache")
+    kwargs = dict(
+        encoder="_counting_encoder", modality="image", batch_size=4, cache=cache_dir
+    )
+    first = embed(data=image_testbed.col[:8], **kwargs)
+    assert sum(encoded) == 8
+
+    # only the rows that are not in the cache are encoded
+    encoded.clear()
+    second = embed(data=image_testbed.col[4:], **kwargs)
+    assert sum(encoded) == 8
+    assert (second.data[:4] == first.data[4:]).all()
+
+    encoded.clear()
+    third = embed(data=image_testbed.col, **kwargs, mmap_dir=str(tmpdir / "mmap"))
+    assert sum(encoded) == 0
+    assert isinstance(third.data, np.memmap)
+    assert (third.data[4:] == second.data).all()
@@ -0,0 +1,70 @@
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+import meerkat as mk
+from meerkat.ops.embed.cache import EmbeddingCache, encoder_key, row_keys
+
+
+def test_get_many_put_many(tmpdir):
+    cache = EmbeddingCache(str(tmpdir))
+    values = [np.arange(4, dtype=np.float32), np.ones((2, 3), dtype=np.float16)]
+    cache.put_many(["a", "b"], values)
+
+    out = cache.get_many(["b", "c", "a"])
+    assert out[1] is None
+    assert out[0].dtype == np.float16 and (out[0] == values[1]).all()
+    assert out[2].dtype == np.float32 and (out[2] == values[0]).all()
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert len(cache) == 2 and cache.nbytes == 28
+
+    # the store is shared by caches opened on the same path
+    assert len(EmbeddingCache(str(tmpdir))) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_eviction(tmpdir):
+    cache = EmbeddingCache(str(tmpdir), max_bytes=3 * 16)
+    for key in "abc":
+        cache.put_many([key], [np.zeros(4, dtype=np.float32)])
+        time.sleep(0.01)
+    # "a" is now the most recently used
+    cache.get_many(["a"])
+    cache.put_many(["d"], [np.zeros(4, dtype=np.float32)])
+
+    assert len(cache) == 3
+    assert [value is None for value in cache.get_many(list("abcd"))] == [
+        False,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_row_keys(tmpdir):
+    key = encoder_key("clip", "image", variant="ViT-B/32")
+    assert key != encoder_key("clip", "text", variant="ViT-B/32")
+
+    # in-memory rows are keyed by their contents
+    keys = row_keys(mk.column(["a", "b", "a"]), key)
+    assert keys[0] == keys[2] and keys[0] != keys[1]
+    assert keys[0] != row_keys(mk.column(["a"]), "other")[0]
+    assert row_keys(mk.column([object()]), key) == [None]
+
+    # rows loaded from files are keyed by the path and modification time
+    paths = []
+    for i in range(2):
+        paths.append(os.path.join(tmpdir, f"{i}.png"))
+        Image.fromarray(np.zeros((2, 2, 3), dtype=np.uint8)).save(paths[-1])
+    col = mk.ImageColumn(paths)
+    keys = row_keys(col, key)
+    assert keys[0] != keys[1]
+    assert row_keys(mk.ImageColumn(["1.png"], base_dir=str(tmpdir)), key) == [keys[1]]
+
+    stat = os.stat(paths[0])
+    os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert row_keys(col, key) != keys
@@ -1,8 +1,19 @@
 import numpy as np
-
-from meerkat import NumPyTensorColumn, ObjectColumn
+import pyarrow as pa
+import pytest
+import torch
+
+from meerkat import (
+    ArrowScalarColumn,
+    NumPyTensorColumn,
+    ObjectColumn,
+    PandasScalarColumn,
+    TorchTensorColumn,
+)
 from meerkat.dataframe import DataFrame
+from meerkat.mixins.aggregate import AggregationError
 from meerkat.ops.sliceby.groupby import GroupBy, groupby
+from meerkat.ops.sliceby.sliceby import SliceBy
 
 # Comment for meeting 5/19: Testing group by multiple columns,
 # single columns on list, on string.
@@ -347,3 +358,76 @@ def test_simple_list_column():
     assertNumpyArrayEquality(out["a"].data, np.array([1, 1, 2, 3]))
     assertNumpyArrayEquality(out["a_diff"].data, np.array([1, 2, 2, 3]))
     assertNumpyArrayEquality(out["b"].data, np.array([1, 4, 11.0 / 3.0, 6]))
+
+
+@pytest.mark.parametrize("how", ["mean", "sum", "min", "max", "median"])
+def test_group_by_reductions_match_pandas(how):
+    np.random.seed(0)
+    keys = np.random.randint(0, 10, 100)
+    values = np.random.rand(100)
+    values[::7] = np.nan
+    df = DataFrame(
+        {
+            "key": keys,
+            "pandas": PandasScalarColumn(values),
+            "arrow": ArrowScalarColumn(pa.array(values, from_pandas=True)),
+            "int": NumPyTensorColumn(np.random.randint(0, 9, 100)),
+            "torch": TorchTensorColumn(torch.rand(100)),
+        }
+    )
+    out = getattr(df.groupby("key"), how)()
+    expected = getattr(df.to_pandas().groupby("key"), how)()
+
+    assert out.primary_key_name == "key"
+    assertNumpyArrayEquality(out["key"].data, expected.index.values)
+    for name in ["pandas", "int", "torch"]:
+        assert np.allclose(
+            np.asarray(out[name].data, dtype=float),
+            expected[name].values,
+            equal_nan=True,
+        )
+    # arrow skips nulls like pandas skips `nan`s
+    assert np.allclose(
+        np.asarray(out["arrow"].data, dtype=float),
+        expected["pandas"].values,
+        equal_nan=True,
+    )
+
+
+def test_group_by_count():
+    df = DataFrame(
+        {
+            "a": NumPyTensorColumn([1, 2, 2, 1, 3, 2, 3]),
+            "name": NumPyTensorColumn(
+                np.array(["a", "b", "a", "c", "b", "d", "d"], dtype=str)
+            ),
+        }
+    )
+    out = df.groupby("a").count()
+    assertNumpyArrayEquality(out["name"].data, np.array([2, 3, 2]))
+
+
+def test_slice_by_empty_slice():
+    df = DataFrame({"a": NumPyTensorColumn([1.0, 2.0, 3.0])})
+    sb = SliceBy(
+        data=df, by="slice", sets={"x": np.array([0, 2]), "y": np.array([], int)}
+    )
+    out = sb.mean()
+    assert out["a"][0] == 2.0
+    assert np.isnan(out["a"][1])
+
+
+def test_group_by_fallback_nuisance():
+    df = DataFrame(
+        {
+            "a": NumPyTensorColumn([1, 2, 2, 1]),
+            "b": NumPyTensorColumn([1.0, 2.0, 3.0, 4.0]),
+            "c": ObjectColumn(["w", "x", "y", "z"]),
+        }
+    )
+    out = df.groupby("a").mean()
+    assert "c" not in out
+    assertNumpyArrayEquality(out["b"].data, np.array([2.5, 2.5]))
+
+    with pytest.raises(AggregationError):
+        df.groupby("a").mean(nuisance="raise")
@@ -0,0 +1,120 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+import meerkat as mk
+from meerkat.ops.expression import Expression, is_lazy_context
+
+
+@pytest.fixture
+def df():
+    np.random.seed(0)
+    return mk.DataFrame(
+        {
+            "a": np.random.rand(1000),
+            "b": np.random.rand(1000),
+            "c": np.random.rand(1000),
+            "i": np.random.randint(-5, 5, 1000),
+            "t": mk.NumPyTensorColumn(np.random.rand(1000, 3)),
+        }
+    )
+
+
+def test_lazy_context():
+    assert not is_lazy_context()
+    with mk.lazy():
+        assert is_lazy_context()
+        with mk.lazy(False):
+            assert not is_lazy_context()
+        assert is_lazy_context()
+    assert not is_lazy_context()
+
+    @mk.lazy()
+    def fn():
+        return is_lazy_context()
+
+    assert fn()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, 4096])
+def test_evaluate(df: mk.DataFrame, chunk_size: int):
+    with mk.lazy():
+        expr = ((df["a"] * 2 + df["b"]) > df["c"]) | ~(df["i"] >= 0)
+    assert isinstance(expr, Expression) and len(expr) == 1000
+
+    out = expr.evaluate(chunk_size=chunk_size)
+    expected = ((df["a"] * 2 + df["b"]) > df["c"]) | ~(df["i"] >= 0)
+    assert isinstance(out, mk.ScalarColumn)
+    assert out.data.equals(expected.data)
+
+
+def test_right_operators(df: mk.DataFrame):
+    with mk.lazy():
+        expr = 1 - (2 / df["a"]) + 3 ** df["i"].astype(float) % 2
+    expected = 1 - (2 / df["a"]) + 3 ** df["i"].astype(float) % 2
+    assert np.allclose(expr.evaluate(chunk_size=64).data, expected.data)
+
+
+def test_operators_on_expressions_are_lazy(df: mk.DataFrame):
+    with mk.lazy():
+        expr = df["a"] * 2
+    # outside the context, but applied to an expression
+    expr = df["b"] + expr
+    assert isinstance(expr, Expression)
+    assert isinstance(np.sqrt(expr), Expression)
+    assert np.allclose(
+        np.sqrt(expr).evaluate().data, np.sqrt(df["b"].data + df["a"].data * 2)
+    )
+
+
+def test_tensor_column(df: mk.DataFrame):
+    with mk.lazy():
+        expr = np.exp(df["t"]) * 2 - 1
+    out = expr.evaluate(chunk_size=100)
+    assert isinstance(out, mk.NumPyTensorColumn)
+    assert out.shape == (1000, 3)
+    assert np.allclose(out.data, np.exp(df["t"].data) * 2 - 1)
+
+
+def test_filter(df: mk.DataFrame):
+    with mk.lazy():
+        expr = (df["a"] > 0.5) & (df["i"] != 0)
+    mask = (df["a"].data.to_numpy() > 0.5) & (df["i"].data.to_numpy() != 0)
+    assert np.array_equal(expr.nonzero(chunk_size=3), np.flatnonzero(mask))
+
+    out = df[expr]
+    assert len(out) == mask.sum()
+    assert np.array_equal(out["a"].data.to_numpy(), df["a"].data.to_numpy()[mask])
+
+
+def test_errors(df: mk.DataFrame):
+    with mk.lazy():
+        expr = df["a"] > 0.5
+        with pytest.raises(ValueError, match="ambiguous"):
+            bool(expr)
+        with pytest.raises(ValueError, match="different lengths"):
+            df["a"] + df["b"][:10]
+
+
+def test_evaluate_empty(df: mk.DataFrame):
+    with mk.lazy():
+        expr = df["a"][:0] * 2 > df["i"][:0]
+        tensor_expr = df["t"][:0] + 1
+    out = expr.evaluate()
+    assert isinstance(out, mk.ScalarColumn)
+    assert len(out) == 0
+    assert out.data.dtype == bool
+    assert tensor_expr.evaluate().data.shape == (0, 3)
+
+
+def test_arrow_nulls():
+    col = mk.ArrowScalarColumn(pa.array(["a", None, "b"]))
+    with mk.lazy():
+        out = col + "z"
+    assert not isinstance(out, Expression)
+    assert out.data.to_pylist() == ["az", None, "bz"]
+
+    with mk.lazy():
+        expr = mk.ScalarColumn([1, 2, 3]) + 1
+    with pytest.raises(ValueError, match="nulls"):
+        expr + mk.ArrowScalarColumn(pa.array([1, None, 3]))
@@ -1,5 +1,8 @@
+import numpy as np
 import pytest
 
+import meerkat as mk
+
 from ...utils import product_parametrize
 from ..columns.abstract import AbstractColumnTestBed, column_parametrize
 
@@ -49,3 +52,71 @@ def test_filter(column_testbed: AbstractColumnTestBed, batched: bool):
     )
 
     assert result.is_equal(filter_spec["expected_result"])
+
+
+@product_parametrize(params={"batched": [True, False], "chunk_size": [None, 7, 64]})
+def test_dataframe_filter(batched: bool, chunk_size: int):
+    df = mk.DataFrame({"a": np.arange(100), "b": np.arange(100) % 3})
+
+    def func(x):
+        return x["b"] == 0
+
+    result = df.filter(func, is_batched_fn=batched, batch_size=4, chunk_size=chunk_size)
+    assert (result["a"] == np.arange(0, 100, 3)).all()
+
+
+@product_parametrize(params={"batched": [True, False]})
+def test_dataframe_filter_limit(batched: bool):
+    df = mk.DataFrame({"a": np.arange(100), "b": np.arange(100) % 3})
+    evaluated = []
+
+    def func(x):
+        evaluated.append(len(x["a"]) if batched else 1)
+        return x["b"] == 0
+
+    result = df.filter(func, is_batched_fn=batched, batch_size=4, chunk_size=8, limit=5)
+    assert (result["a"] == np.arange(0, 15, 3)).all()
+    # the chunk of rows 8-15 holds the 5th match, so later chunks are skipped
+    assert sum(evaluated) < 24
+
+
+def test_dataframe_filter_expression():
+    df = mk.DataFrame({"a": np.arange(100), "b": np.arange(100) % 3})
+    with mk.lazy():
+        expr = (df["b"] == 0) & (df["a"] > 50)
+
+    result = df.filter(expr, chunk_size=16)
+    assert (result["a"] == np.arange(51, 100, 3)).all()
+
+    result = df.filter(expr, chunk_size=16, limit=2)
+    assert (result["a"] == np.array([51, 54])).all()
+
+
+def test_dataframe_filter_num_workers(monkeypatch):
+    import concurrent.futures
+
+    pools = []
+
+    class CountingPoolExecutor(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", CountingPoolExecutor)
+    # rows of 64 KiB, so that cache-sized chunks hold 32 rows
+    df = mk.DataFrame(
+        {"a": np.arange(100), "t": mk.NumPyTensorColumn(np.zeros((100, 8192)))}
+    )
+
+    result = df.filter(lambda a: a % 3 == 0, input_columns="a", num_workers=2)
+    assert (result["a"] == np.arange(0, 100, 3)).all()
+    # the rows are filtered by a single pool rather than one per chunk
+    assert len(pools) == 1
+
+
+@product_parametrize(params={"chunk_size": [None, 7]})
+def test_dataframe_filter_input_column(chunk_size: int):
+    df = mk.DataFrame({"a": np.arange(100), "b": np.arange(100) % 3})
+
+    result = df.filter(lambda b: b == 0, input_columns="b", chunk_size=chunk_size)
+    assert (result["a"] == np.arange(0, 100, 3)).all()
@@ -1,5 +1,11 @@
+import os
+import threading
+import time
+
+import numpy as np
 import pytest
 
+import meerkat as mk
 from meerkat import DeferredColumn
 from meerkat.dataframe import DataFrame
 
@@ -142,3 +148,145 @@ def test_map_return_multiple(
     assert isinstance(result, DataFrame)
     for key, map_spec in map_specs.items():
         assert result[key].is_equal(map_spec["expected_result"])
+
+
+@product_parametrize(
+    params={"batched": [True, False], "executor": ["process", "thread"]}
+)
+def test_map_executor(
+    column_testbed: AbstractColumnTestBed, batched: bool, executor: str
+):
+    """`map`, parallelized across a process or thread pool."""
+    col = column_testbed.col
+    map_spec = column_testbed.get_map_spec(batched=batched)
+
+    def func(x):
+        out = map_spec["fn"](x)
+        return out
+
+    result = col.map(
+        func,
+        batch_size=4,
+        is_batched_fn=batched,
+        output_type=map_spec.get("output_type", None),
+        executor=executor,
+        num_workers=2 if executor == "process" else None,
+        num_threads=4 if executor == "thread" else None,
+    )
+    assert result.is_equal(map_spec["expected_result"])
+
+
+def test_map_thread_executor_preserves_order():
+    """`map` with a thread pool returns outputs in row order, even when later rows
+    finish first."""
+    df = DataFrame({"a": np.arange(32), "b": [str(i) for i in range(32)]})
+
+    def func(a, b):
+        time.sleep(0.001 * (32 - a))
+        return {"c": a * 2, "d": b + "!"}
+
+    result = df.map(func, executor="thread", num_threads=8)
+    assert (result["c"] == np.arange(32) * 2).all()
+    assert list(result["d"]) == [f"{i}!" for i in range(32)]
+
+
+def test_map_thread_executor_overlaps_batches():
+    """`map` with a thread pool materializes batches of `batch_size` rows
+    concurrently, so rows in different batches overlap."""
+    col = mk.NumPyTensorColumn(np.arange(8))
+    lock = threading.Lock()
+    active, max_active = [0], [0]
+
+    def func(x):
+        with lock:
+            active[0] += 1
+            max_active[0] = max(max_active[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return x * 2
+
+    result = col.map(func, batch_size=2, executor="thread", num_threads=4)
+    assert (result.data == np.arange(8) * 2).all()
+    # rows overlap across batches, but each of the 4 threads computes the rows of
+    # its batch one at a time
+    assert 1 < max_active[0] <= 4
+
+
+def test_map_bounded():
+    """`_map_bounded` returns results in order and submits a call only once there
+    are fewer than `window` calls whose results have not been consumed."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from meerkat.ops.map import _map_bounded
+
+    submitted = []
+
+    def func(x):
+        submitted.append(x)
+        time.sleep(0.001 * (10 - x))
+        return x * 2
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for consumed, out in enumerate(_map_bounded(pool, func, range(10), window=3)):
+            assert out == consumed * 2
+            assert len(submitted) <= consumed + 3
+
+
+@pytest.mark.parametrize("kwargs", [{"num_workers": 0}, {"num_threads": 0}])
+def test_map_zero_workers(kwargs):
+    """`map` with zero workers or threads materializes the rows serially."""
+    col = mk.NumPyTensorColumn(np.arange(10))
+    result = col.map(lambda x: x * 2, is_batched_fn=True, batch_size=3, **kwargs)
+    assert (result.data == np.arange(10) * 2).all()
+
+
+@product_parametrize(params={"executor": [None, "process", "thread"]})
+def test_map_output_path(tmpdir, executor: str):
+    """`map` with an `output_path` writes each output to disk as it is computed."""
+    df = DataFrame({"a": np.arange(100), "b": [str(i) for i in range(100)]})
+
+    def func(a, b):
+        return {
+            "emb": np.full((len(a), 3), a.to_numpy()[:, None], dtype=np.float32),
+            "c": b.to_numpy() + "!",
+            "d": [{"a": x} for x in a],
+        }
+
+    result = df.map(
+        func,
+        is_batched_fn=True,
+        batch_size=16,
+        output_type={
+            "emb": mk.NumPyTensorColumn,
+            "c": mk.ScalarColumn,
+            "d": mk.ObjectColumn,
+        },
+        executor=executor,
+        num_workers=2 if executor == "process" else None,
+        output_path=str(tmpdir),
+    )
+
+    assert isinstance(result["emb"], mk.NumPyTensorColumn)
+    assert isinstance(result["emb"].data, np.memmap)
+    assert (result["emb"].data == np.arange(100)[:, None]).all()
+
+    assert isinstance(result["c"], mk.ArrowScalarColumn)
+    assert list(result["c"]) == [f"{i}!" for i in range(100)]
+
+    assert isinstance(result["d"], DeferredColumn)
+    assert result["d"]().data == [{"a": i} for i in range(100)]
+
+    assert sorted(os.listdir(tmpdir)) == ["c", "d", "emb", "pkey"]
+
+
+def test_map_output_path_column(tmpdir):
+    col = mk.NumPyTensorColumn(np.arange(20).reshape(10, 2))
+    result = col.map(
+        lambda x: x * 2, is_batched_fn=True, batch_size=3, output_path=str(tmpdir)
+    )
+    assert isinstance(result.data, np.memmap)
+    assert (result.data == np.arange(20).reshape(10, 2) * 2).all()
+
+    with pytest.raises(ValueError, match="output_path"):
+        col.map(lambda x: x * 2, output_path=str(tmpdir), use_ray=True)
@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 import torch
 
+import meerkat as mk
 from meerkat.columns.abstract import Column
 from meerkat.columns.deferred.file import FileColumn
 from meerkat.columns.deferred.image import ImageColumn
@@ -129,7 +130,6 @@ class TestMerge:
             else:
                 assert out[f"{name}_1"].is_equal(out[f"{name}_2"])
 
-    @pytest.mark.skip
     @MergeTestBed.parametrize(config={"simple": [True]}, params={"sort": [True, False]})
     def test_merge_outer(self, testbed, sort):
         df1, df2 = (
@@ -178,7 +178,6 @@ class TestMerge:
         assert out[mask_1]["e_2"].isna().all()
         assert out[mask_2]["e_1"].isna().all()
 
-    @pytest.mark.skip
     @MergeTestBed.parametrize(config={"simple": [True]}, params={"sort": [True, False]})
     def test_merge_left(self, testbed, sort):
         df1, df2 = (
@@ -223,7 +222,6 @@ class TestMerge:
         # check for equality at matched rows
         assert out[mask_1]["e_2"].isna().all()
 
-    @pytest.mark.skip
     @MergeTestBed.parametrize(config={"simple": [True]}, params={"sort": [True, False]})
     def test_merge_right(self, testbed, sort):
         df1, df2 = (
@@ -267,6 +265,101 @@ class TestMerge:
         # check for equality at matched rows
         assert (out[mask_2]["e_1"]).isna().all()
 
+    @pytest.mark.parametrize("how", ["inner", "outer", "left", "right"])
+    @pytest.mark.parametrize("sort", [True, False])
+    def test_merge_matches_pandas(self, how, sort):
+        np.random.seed(1)
+        left = DataFrame(
+            {
+                "k1": np.random.randint(0, 8, size=40),
+                "k2": np.random.choice(["a", "b", "c"], size=40),
+                "x": np.arange(40),
+            }
+        )
+        right = DataFrame(
+            {
+                "k1": np.random.randint(4, 12, size=30),
+                "k2": np.random.choice(["a", "b", "d"], size=30),
+                "y": np.arange(30),
+            }
+        )
+        out = left.merge(right, on=["k1", "k2"], how=how, sort=sort)
+        expected = left.to_pandas().merge(
+            right.to_pandas(), on=["k1", "k2"], how=how, sort=sort
+        )
+
+        def _rows(df):
+            return sorted(
+                df[["k1", "k2", "x", "y"]]
+                .astype({"x": float, "y": float})
+                .fillna(-1)
+                .itertuples(index=False),
+                key=str,
+            )
+
+        assert len(out) == len(expected)
+        assert _rows(out.to_pandas()) == _rows(expected)
+        if sort:
+            assert list(out["k1"]) == list(expected["k1"])
+            assert list(out["k2"]) == list(expected["k2"])
+
+    @pytest.mark.parametrize("how", ["inner", "outer", "left", "right"])
+    @pytest.mark.parametrize("sort", [True, False])
+    @pytest.mark.parametrize("empty", ["left", "right"])
+    def test_merge_empty_side(self, how, sort, empty):
+        left = DataFrame({"key": np.array([2, 0, 1]), "x": np.arange(3)})
+        right = DataFrame({"key": np.array([1, 3]), "y": np.arange(2)})
+        if empty == "left":
+            left = left[:0]
+        else:
+            right = right[:0]
+
+        out = left.merge(right, on="key", how=how, sort=sort)
+        expected = left.to_pandas().merge(
+            right.to_pandas(), on="key", how=how, sort=sort
+        )
+        assert list(out["key"]) == list(expected["key"])
+
+    def test_merge_outer_string_keys(self):
+        left = DataFrame({"key": np.array(["a", "b"]), "x": np.arange(2)})
+        right = DataFrame({"key": np.array(["b", "cccc"]), "y": np.arange(2)})
+        # keys only on the right are not truncated to the width of the left keys
+        out = left.merge(right, on="key", how="outer")
+        assert list(out["key"]) == ["a", "b", "cccc"]
+
+    def test_merge_outer_missing_values(self):
+        import pyarrow as pa
+
+        left = DataFrame(
+            {
+                "key": np.arange(4),
+                "arrow": mk.ArrowScalarColumn(pa.array(["a", "b", "c", "d"])),
+                "object": ObjectColumn([[0], [1], [2], [3]]),
+                "torch": torch.arange(4),
+            }
+        )
+        right = DataFrame({"key": np.arange(2, 6), "pandas": np.arange(4)})
+
+        out = left.merge(right, on="key", how="outer")
+        assert list(out["key"]) == [0, 1, 2, 3, 4, 5]
+        # arrow columns hold nulls without changing type
+        assert out["arrow"].data.type == pa.string()
+        assert out["arrow"].data.to_pylist() == ["a", "b", "c", "d", None, None]
+        assert out["object"].data == [[0], [1], [2], [3], None, None]
+        assert torch.isnan(out["torch"].data[4:]).all()
+        assert np.isnan(out["pandas"].data[:2]).all()
+        assert list(out["pandas"][2:]) == [0, 1, 2, 3]
+
+    def test_merge_validate(self):
+        df1 = DataFrame({"a": np.array([0, 0, 1]), "b": np.arange(3)})
+        df2 = DataFrame({"a": np.array([0, 1]), "c": np.arange(2)})
+
+        assert len(df1.merge(df2, on="a", validate="m:1")) == 3
+        with pytest.raises(MergeError):
+            df1.merge(df2, on="a", validate="1:1")
+        with pytest.raises(MergeError):
+            df2.merge(df1, on="a", validate="many_to_one")
+
     def test_merge_output_column_types(self):
         df1 = DataFrame.from_batch(
             {"a": np.arange(3), "b": ObjectColumn(["1", "2", "3"])}
@@ -424,7 +517,7 @@ class TestMerge:
         with pytest.raises(MergeError):
             df1.merge(df2, on="a")
 
-        # checks that having a column called __right_indices__ raises a merge error
+        # checks that there are no reserved column names
         df1 = DataFrame.from_batch(
             {
                 "a": ObjectColumn(["hello"] + [{"a": 1}] * (length - 1)),
@@ -433,5 +526,6 @@ class TestMerge:
             }
         )
         df2 = df1.copy()
-        with pytest.raises(MergeError):
-            df1.merge(df2, on="__right_indices__")
+        out = df1.merge(df2, on="__right_indices__")
+        assert (out["__right_indices__"] == np.arange(length)).all()
+        assert out["a_x"].data == out["a_y"].data == df1["a"].data
@@ -0,0 +1,157 @@
+import numpy as np
+import pytest
+import torch
+
+import meerkat as mk
+from meerkat.block.vector_index import FlatIndex, HNSWIndex, IVFIndex, VectorIndex
+
+
+def make_test_df(n: int = 500, dim: int = 16, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(10, dim))
+    emb = centers[rng.integers(0, 10, n)] + 0.3 * rng.normal(size=(n, dim))
+    return mk.DataFrame(
+        {"emb": emb.astype(np.float32), "id": np.arange(n)}, primary_key="id"
+    )
+
+
+def brute_force(emb: np.ndarray, queries: np.ndarray, metric: str, k: int):
+    if metric == "dot":
+        scores = queries @ emb.T
+    elif metric == "cosine":
+        scores = (queries / np.linalg.norm(queries, axis=1, keepdims=True)) @ (
+            emb / np.linalg.norm(emb, axis=1, keepdims=True)
+        ).T
+    else:
+        scores = -((queries[:, None, :] - emb[None, :, :]) ** 2).sum(axis=-1)
+    return np.argsort(-scores, axis=1, kind="stable")[:, :k]
+
+
+@pytest.mark.parametrize("metric", ["dot", "cosine", "l2"])
+@pytest.mark.parametrize("column_type", ["numpy", "torch"])
+def test_search_exact(metric, column_type):
+    df = make_test_df()
+    emb = df["emb"].data
+    queries = emb[:5] + 0.01
+    expected = brute_force(emb, queries, metric, k=10)
+    if column_type == "torch":
+        df["emb"] = mk.TorchTensorColumn(torch.tensor(emb))
+        queries = torch.tensor(queries)
+
+    out = mk.search(df, queries, by="emb", k=10, metric=metric)
+    assert isinstance(out, list) and len(out) == 5
+    for result, expected_ids in zip(out, expected):
+        # ties aside, the top results should match exactly
+        assert len(set(result["id"]) ^ set(expected_ids)) <= 2
+
+    single = mk.search(df, queries[0], by="emb", k=10, metric=metric)
+    assert isinstance(single, mk.DataFrame)
+    assert (single["id"] == out[0]["id"]).all()
+
+
+@pytest.mark.parametrize("column_type", ["numpy", "torch"])
+def test_search_list_query(column_type):
+    df = make_test_df()
+    if column_type == "torch":
+        df["emb"] = mk.TorchTensorColumn(torch.tensor(df["emb"].data))
+    query = df["emb"][0].tolist()
+
+    out = mk.search(df, query, by="emb", k=3)
+    assert isinstance(out, mk.DataFrame)
+    assert (out["id"] == mk.search(df, np.array(query), by="emb", k=3)["id"]).all()
+
+    batch = mk.search(df, [query, query], by="emb", k=3)
+    assert isinstance(batch, list) and len(batch) == 2
+
+
+@pytest.mark.parametrize("metric", ["dot", "cosine", "l2"])
+@pytest.mark.parametrize(
+    "kind,kwargs",
+    [
+        ("flat", {}),
+        ("ivf", {"num_lists": 8, "num_probes": 4}),
+        ("hnsw", {"m": 8, "ef_construction": 40}),
+    ],
+)
+def test_search_index(metric, kind, kwargs):
+    df = make_test_df()
+    emb = df["emb"].data
+    queries = emb[:10] + 0.01
+    expected = brute_force(emb, queries, metric, k=5)
+
+    df["emb"].create_vector_index(kind, metric=metric, **kwargs)
+    assert isinstance(df["emb"].vector_index, VectorIndex)
+    out = mk.search(df, queries, by="emb", k=5, metric=metric)
+    recall = np.mean([len(set(r["id"]) & set(e)) / 5 for r, e in zip(out, expected)])
+    assert recall >= (1.0 if kind == "flat" else 0.8)
+
+
+def test_search_index_large_k():
+    # probes are expanded until enough rows have been seen, and k is clipped to
+    # the number of rows in the index
+    index = VectorIndex.create("ivf", metric="dot", num_lists=2, num_probes=1)
+    index.add(np.eye(4, dtype=np.float32))
+    scores, positions = index.search(np.ones((1, 4)), k=10)
+    assert scores.shape == positions.shape == (1, 4)
+    assert sorted(positions[0]) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("kind", ["flat", "ivf", "hnsw"])
+def test_index_add_incremental(kind):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(200, 8)).astype(np.float32)
+    full = VectorIndex.create(kind, metric="l2")
+    full.add(vectors)
+    incremental = VectorIndex.create(kind, metric="l2")
+    incremental.add(vectors[:100])
+    incremental.add(vectors[100:])
+
+    assert len(incremental) == 200
+    _, positions = incremental.search(vectors[150:160], k=1)
+    assert (positions[:, 0] == np.arange(150, 160)).all()
+
+
+def test_index_concat():
+    df = make_test_df(n=200)
+    df["emb"].create_vector_index("flat", metric="cosine")
+    out = mk.concat([df, make_test_df(n=100, seed=1)])
+    index = out["emb"].vector_index
+    assert index is not None and len(index) == 300
+    # the original column's index is not modified
+    assert len(df["emb"].vector_index) == 200
+
+    query = out["emb"].data[250]
+    result = mk.search(out, query, by="emb", k=1, metric="cosine")
+    assert result["emb"].data[0].tolist() == query.tolist()
+
+
+def test_index_invalidated_on_set():
+    df = make_test_df(n=50)
+    df["emb"].create_vector_index("flat")
+    df["emb"][0] = np.zeros(16, dtype=np.float32)
+    assert df["emb"].vector_index is None
+
+
+def test_index_persistence(tmpdir):
+    df = make_test_df(n=200)
+    df["emb"].create_vector_index("hnsw", metric="l2", m=8)
+    df.write(str(tmpdir))
+    df2 = mk.read(str(tmpdir))
+
+    index = df2["emb"].vector_index
+    assert isinstance(index, HNSWIndex)
+    assert index.metric == "l2" and len(index) == 200
+    queries = df["emb"].data[:3]
+    assert (
+        index.search(queries, k=3)[1] == df["emb"].vector_index.search(queries, k=3)[1]
+    ).all()
+
+
+def test_index_unknown():
+    with pytest.raises(ValueError):
+        VectorIndex.create("unknown")
+    with pytest.raises(ValueError):
+        FlatIndex(metric="unknown")
+    with pytest.raises(ValueError):
+        mk.search(make_test_df(n=10), np.zeros(16), by="emb", metric="unknown")
+    assert isinstance(VectorIndex.create("ivf"), IVFIndex)
@@ -1,5 +1,7 @@
 from typing import List, Union
 
+import numpy as np
+
 import meerkat as mk
 
 
@@ -182,3 +184,29 @@ def test_sort_with_store():
     df = mk.DataFrame({"tensor": mk.TorchTensorColumn([3, 2, 4])})
     test = df.sort(by=mk.Store("tensor"), ascending=True)
     assert (test["tensor"] == mk.TorchTensorColumn([2, 3, 4])).all()
+
+
+def test_sort_cache():
+    from meerkat.ops.view_cache import view_cache
+
+    df = mk.DataFrame({"a": np.array([3, 1, 2]), "b": np.array([1, 2, 3])})
+    hits = view_cache.hits
+    assert df.sort(by="a")["b"].tolist() == [2, 3, 1]
+    assert df.sort(by="a")["b"].tolist() == [2, 3, 1]
+    assert view_cache.hits == hits + 1
+
+    # a different spec is sorted from scratch
+    assert df.sort(by="a", ascending=False)["b"].tolist() == [1, 3, 2]
+    assert view_cache.hits == hits + 1
+
+    # setting a cell in a sort column changes its version
+    df["a"][0] = 0
+    assert df.sort(by="a")["b"].tolist() == [1, 2, 3]
+    # so does setting it through another view of the same block
+    df.view()["a"][0] = 4
+    assert df.sort(by="a")["b"].tolist() == [2, 3, 1]
+
+    # replacing a column invalidates entries that depend on it
+    df["a"] = np.array([2, 3, 1])
+    assert df.sort(by="a")["b"].tolist() == [3, 1, 2]
+    assert view_cache.hits == hits + 1
@@ -1053,15 +1053,17 @@ def test_csv_io(testbed, tmpdir, engine):
             assert name in df2
 
 
-@product_parametrize(params={"engine": ["arrow", "pandas"]})
-def test_feather_io(testbed, tmpdir, engine):
+@product_parametrize(
+    params={"engine": ["arrow", "pandas"], "backend": ["arrow", "pandas"]}
+)
+def test_feather_io(testbed, tmpdir, engine, backend):
     df = testbed.df
     filepath = os.path.join(tmpdir, "test.feather")
 
     with pytest.warns():
         df.to_feather(filepath, engine=engine)
 
-    df2 = DataFrame.from_feather(filepath)
+    df2 = DataFrame.from_feather(filepath, backend=backend)
 
     for name, col in df.items():
         if isinstance(col, ObjectColumn) or isinstance(col, DeferredColumn):
@@ -1073,15 +1075,17 @@ def test_feather_io(testbed, tmpdir, engine):
             assert (df2[name].to_numpy() == col.to_numpy()).all()
 
 
-@product_parametrize(params={"engine": ["arrow", "pandas"]})
-def test_parquet_io(testbed, tmpdir, engine):
+@product_parametrize(
+    params={"engine": ["arrow", "pandas"], "backend": ["arrow", "pandas"]}
+)
+def test_parquet_io(testbed, tmpdir, engine, backend):
     df = testbed.df
     filepath = os.path.join(tmpdir, "test.parquet")
 
     with pytest.warns():
         df.to_parquet(filepath, engine=engine)
 
-    df2 = DataFrame.from_parquet(filepath)
+    df2 = DataFrame.from_parquet(filepath, backend=backend)
 
     for name, col in df.items():
         if isinstance(col, ObjectColumn) or isinstance(col, DeferredColumn):
@@ -1093,6 +1097,51 @@ def test_parquet_io(testbed, tmpdir, engine):
             assert (df2[name].to_numpy() == col.to_numpy()).all()
 
 
+def test_parquet_io_projection_and_filters(tmpdir):
+    filepath = os.path.join(tmpdir, "test.parquet")
+    pd.DataFrame(
+        {"a": np.arange(1000), "b": [f"row {i}" for i in range(1000)]},
+        index=np.arange(1000) * 2,
+    ).to_parquet(filepath, row_group_size=100)
+
+    df = DataFrame.from_parquet(
+        filepath, columns=["b"], filters=[("a", ">=", 950)], backend="arrow"
+    )
+    assert df.columns == ["b"]
+    assert isinstance(df["b"], ArrowScalarColumn)
+    assert df["b"].to_numpy().tolist() == [f"row {i}" for i in range(950, 1000)]
+
+    df = DataFrame.from_parquet(filepath, filters=[("a", ">=", 950)])
+    assert df.columns == ["a", "b"]
+    assert (df["a"].to_numpy() == np.arange(950, 1000)).all()
+
+
+@product_parametrize(params={"kind": ["parquet", "feather"]})
+def test_iter_arrow_files(tmpdir, kind):
+    filepath = os.path.join(tmpdir, f"test.{kind}")
+    data = pd.DataFrame({"a": np.arange(1000), "b": [f"row {i}" for i in range(1000)]})
+    if kind == "parquet":
+        data.to_parquet(filepath, row_group_size=300)
+    else:
+        data.to_feather(filepath)
+
+    dfs = list(
+        getattr(DataFrame, f"iter_{kind}")(
+            filepath, batch_size=128, filters=[("a", "<", 500)], primary_key="a"
+        )
+    )
+    assert all(0 < len(df) <= 128 for df in dfs)
+    assert all(df.primary_key_name == "a" for df in dfs)
+    assert all(isinstance(df["b"], ArrowScalarColumn) for df in dfs)
+    df = mk.concat(dfs)
+    assert (df["a"].to_numpy() == np.arange(500)).all()
+    assert df["b"].to_numpy().tolist() == [f"row {i}" for i in range(500)]
+
+    dfs = list(getattr(DataFrame, f"iter_{kind}")(filepath, columns=["b"]))
+    assert all(df.columns == ["b"] for df in dfs)
+    assert sum(len(df) for df in dfs) == 1000
+
+
 def test_json_io(testbed, tmpdir):
     df = testbed.df
     filepath = os.path.join(tmpdir, "test.json")
@@ -1279,6 +1328,74 @@ def test_loc_missing():
         df.loc[1, 2, 4]
 
 
+def test_loc_multiple_order():
+    df = DataFrame({"x": np.arange(4), "y": ScalarColumn(["a", "b", "c", "d"])})
+    df = df.set_primary_key("y")
+
+    new_df = df.loc[["d", "a", "c"]]
+    assert (new_df["x"] == np.array([3, 0, 2])).all()
+
+
+@product_parametrize(
+    params={"column_type": [PandasScalarColumn, ArrowScalarColumn, NumPyTensorColumn]}
+)
+def test_loc_key_index(column_type: type):
+    df = DataFrame({"x": np.arange(4), "pk": column_type(["a", "b", "c", "d"])})
+    df = df.set_primary_key("pk")
+
+    assert df.loc["c"]["x"] == 2
+    key_index = df["pk"]._get_key_index()
+    # views that share the block reuse the index
+    assert df[["x", "pk"]]["pk"]._get_key_index() is key_index
+
+    if column_type is not ArrowScalarColumn:
+        # mutating the column invalidates the index
+        df.loc["c", "pk"] = "e"
+        assert df["pk"]._get_key_index() is not key_index
+        assert df.loc["e"]["x"] == 2
+        with pytest.raises(KeyError):
+            df.loc["c"]
+
+
+@product_parametrize(
+    params={
+        "column_type": [
+            PandasScalarColumn,
+            ArrowScalarColumn,
+            NumPyTensorColumn,
+            TorchTensorColumn,
+        ]
+    }
+)
+def test_keyidxs_to_posidxs(column_type: type):
+    col = column_type([10, 40, 20, 30])
+
+    assert col._keyidxs_to_posidxs([30, 10, 40]).tolist() == [3, 0, 1]
+    assert col._keyidxs_to_posidxs([]).tolist() == []
+    with pytest.raises(KeyError):
+        col._keyidxs_to_posidxs([30, 50])
+
+    posidxs, found = col._get_key_index().lookup([20, 50, 10])
+    assert posidxs.tolist() == [2, -1, 0]
+    assert found.tolist() == [True, False, True]
+
+
+def test_key_index_duplicates():
+    col = ScalarColumn(["b", "a", "c", "a"])
+    assert col._keyidxs_to_posidxs(["a", "c", "b"]).tolist() == [1, 2, 0]
+
+
+def test_loc_key_index_write(tmpdir):
+    df = DataFrame({"x": np.arange(4), "pk": ScalarColumn(["a", "b", "c", "d"])})
+    df = df.set_primary_key("pk")
+    df.loc["a"]
+
+    df.write(os.path.join(tmpdir, "df"))
+    new_df = DataFrame.read(os.path.join(tmpdir, "df"))
+    assert new_df["pk"]._block._get_key_index(new_df["pk"]._block_index) is not None
+    assert new_df.loc["c"]["x"] == 2
+
+
 def test_primary_key_persistence():
     df = DataFrame({"a": ScalarColumn(np.arange(16)), "b": ScalarColumn(np.arange(16))})
     df = df.set_primary_key("a")